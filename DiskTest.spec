@@ -6,7 +6,9 @@ a = Analysis(
     ['src\\main.py'],
     pathex=['src'],
     binaries=[],
-    datas=[],
+    datas=[
+        ('src\\gui\\resources\\*.qss', 'gui\\resources'),
+    ],
     hiddenimports=[
         'PySide6.QtCore',
         'PySide6.QtGui',
@@ -3,6 +3,7 @@ File Analyzer für DiskTest
 Analysiert vorhandene Testdateien und erkennt Muster
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Tuple
 from dataclasses import dataclass
@@ -35,6 +36,8 @@ class FileAnalyzer:
 
     SAMPLE_SIZE = 1024  # Erste 1 KB zum Pattern-Check
     CHUNK_SIZE = 16 * 1024 * 1024  # Muss mit test_engine.py übereinstimmen
+    PARALLEL_MIN_FILES = 8  # Ab dieser Dateianzahl parallel analysieren
+    MAX_WORKERS = 8  # Gleichzeitige Lesezugriffe (SSD-Queue füllen, HDD nicht überlasten)
 
     def __init__(self, target_path: str, expected_file_size_gb: float):
         """
@@ -56,24 +59,31 @@ class FileAnalyzer:
         """
         Analysiert alle vorhandenen Testdateien
 
+        Pro Datei fallen ein stat und ein kurzer Lesezugriff an. Bei vielen
+        Dateien laufen diese in einem Thread-Pool, da die Wartezeit auf das
+        Laufwerk (USB, Netzwerk) und nicht die CPU den Scan bestimmt.
+
         Returns:
             Liste von FileAnalysisResult, sortiert nach Dateiindex
         """
-        results = []
+        filepaths = []
+        indices = []
 
         # Finde alle disktest_*.dat Dateien
-        pattern_files = sorted(self.target_path.glob("disktest_*.dat"))
-
-        for filepath in pattern_files:
+        for filepath in sorted(self.target_path.glob("disktest_*.dat")):
             # Extrahiere Index aus Dateinamen
             try:
-                index = self._extract_file_index(filepath.name)
+                indices.append(self._extract_file_index(filepath.name))
             except ValueError:
                 continue
-
-            # Analysiere Datei
-            result = self._analyze_file(filepath, index)
-            results.append(result)
+            filepaths.append(filepath)
+
+        # Analysiere Dateien
+        if len(filepaths) < self.PARALLEL_MIN_FILES:
+            results = list(map(self._analyze_file, filepaths, indices))
+        else:
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                results = list(executor.map(self._analyze_file, filepaths, indices))
 
         return sorted(results, key=lambda r: r.file_index)
 
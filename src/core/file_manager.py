@@ -5,6 +5,7 @@ Verwaltet Erstellung, Zugriff und Löschung der Testdateien
 import logging
 import os
 import shutil
+import stat
 from pathlib import Path
 from typing import List
 
@@ -59,10 +60,12 @@ class FileManager:
             # Default: 3 Stellen (abwärtskompatibel)
             self._digits = 3
 
-        # Validierung Pfad
-        if not self.target_path.exists():
+        # Validierung Pfad (ein stat für Existenz und Verzeichnis)
+        try:
+            st = self.target_path.stat()
+        except OSError:
             raise ValueError(f"Pfad existiert nicht: {target_path}")
-        if not self.target_path.is_dir():
+        if not stat.S_ISDIR(st.st_mode):
             raise ValueError(f"Pfad ist kein Verzeichnis: {target_path}")
 
     def _calculate_digits(self, file_count: int) -> int:
@@ -222,12 +225,24 @@ class FileManager:
         Returns:
             int: Größe in Bytes
         """
+        # os.scandir statt glob: ein Verzeichnisdurchlauf ohne Path-Objekte,
+        # unter Windows liefert DirEntry.stat() die Größe ohne weiteren Aufruf.
+        # normcase entspricht der Groß-/Kleinschreibung von glob (Windows: egal)
         total_size = 0
-        for filepath in self.target_path.glob(self.FILE_GLOB_PATTERN):
-            try:
-                total_size += filepath.stat().st_size
-            except Exception as e:
-                logger.warning(f"Konnte Dateigröße nicht ermitteln für {filepath}: {e}")
+        try:
+            with os.scandir(self.target_path) as entries:
+                for entry in entries:
+                    name = os.path.normcase(entry.name)
+                    if not (name.startswith(self.FILE_PREFIX) and name.endswith(self.FILE_SUFFIX)):
+                        continue
+                    try:
+                        if entry.is_file():
+                            total_size += entry.stat().st_size
+                    except OSError as e:
+                        logger.warning(f"Konnte Dateigröße nicht ermitteln für {entry.path}: {e}")
+        except OSError:
+            # Wie glob: nicht lesbarer/fehlender Ordner enthält keine Testdateien
+            pass
         return total_size
 
     def migrate_old_filenames(self, file_count: int) -> tuple[int, int]:
@@ -20,14 +20,18 @@ class PatternType(Enum):
     @property
     def display_name(self):
         """Anzeigename für GUI"""
-        names = {
-            PatternType.ZERO: "0x00 (Null)",
-            PatternType.ONE: "0xFF (Eins)",
-            PatternType.ALT_AA: "0xAA (Alt-1)",
-            PatternType.ALT_55: "0x55 (Alt-2)",
-            PatternType.RANDOM: "Random"
-        }
-        return names[self]
+        return _DISPLAY_NAMES[self]
+
+
+# Anzeigenamen einmal anlegen statt bei jedem Zugriff auf display_name
+# (als Klassenattribut würde das Dict zu einem Enum-Member)
+_DISPLAY_NAMES = {
+    PatternType.ZERO: "0x00 (Null)",
+    PatternType.ONE: "0xFF (Eins)",
+    PatternType.ALT_AA: "0xAA (Alt-1)",
+    PatternType.ALT_55: "0x55 (Alt-2)",
+    PatternType.RANDOM: "Random"
+}
 
 
 # Standard-Reihenfolge der Muster (wie in Spezifikation)
@@ -13,7 +13,7 @@ Verwendung:
 """
 import sys
 
-from .base import PlatformIO
+from .base import PlatformIO, DriveInfo, BYTES_PER_GB
 
 
 def get_platform_io(buffer_size: int = 64 * 1024 * 1024) -> PlatformIO:
@@ -62,4 +62,53 @@ def get_window_activator():
         return qt_activate
 
 
-__all__ = ['PlatformIO', 'get_platform_io', 'get_window_activator']
+def get_drive_prober():
+    """
+    Gibt plattform-spezifische Funktion zur Laufwerks-Abfrage zurueck.
+
+    Usage:
+        from core.platform import get_drive_prober
+        probe_drives = get_drive_prober()
+        drives = probe_drives()  # {"C:\\": DriveInfo(...), ...}
+
+    Returns:
+        Callable die ein Dict Laufwerks-Wurzel -> DriveInfo liefert
+    """
+    if sys.platform == 'win32':
+        from .windows import WindowsIO
+        return WindowsIO.probe_drives
+    else:
+        from .posix import PosixIO
+        return PosixIO.probe_drives
+
+
+def get_disk_space_reader():
+    """
+    Gibt plattform-spezifische Funktion zur Speicherplatz-Abfrage zurueck.
+
+    Unter Windows wird GetDiskFreeSpaceExW direkt aufgerufen, sonst
+    os.statvfs - jeweils ein einziger Systemaufruf. Ein nicht existierender
+    Pfad fuehrt zu FileNotFoundError, eine vorherige Existenz-Pruefung ist
+    nicht noetig.
+
+    Usage:
+        from core.platform import get_disk_space_reader
+        get_disk_space = get_disk_space_reader()
+        free_bytes, total_bytes = get_disk_space("C:\\")
+
+    Returns:
+        Callable die (free_bytes, total_bytes) liefert und bei Fehlern OSError wirft
+        (FileNotFoundError wenn der Pfad nicht existiert)
+    """
+    if sys.platform == 'win32':
+        from .windows import WindowsIO
+        return WindowsIO.get_disk_space
+    else:
+        from .posix import PosixIO
+        return PosixIO.get_disk_space
+
+
+__all__ = [
+    'PlatformIO', 'DriveInfo', 'BYTES_PER_GB', 'get_platform_io', 'get_window_activator',
+    'get_drive_prober', 'get_disk_space_reader'
+]
@@ -4,12 +4,47 @@ Platform-Abstraktion fuer OS-spezifische I/O Operationen.
 Dieses Modul definiert das Interface fuer plattform-spezifische Operationen
 wie Direct I/O, Cache-Flush und Sektor-Groessen-Ermittlung.
 """
+import os
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
 from typing import IO, Optional
 import logging
 
 
+# Umrechnung Bytes -> GB (Binaerpraefix, wie ueberall in DiskTest)
+BYTES_PER_GB = 1 << 30
+
+
+@dataclass(frozen=True)
+class DriveInfo:
+    """Ergebnis einer Laufwerks-Abfrage (ein Durchlauf pro Laufwerk)"""
+    path: str           # Laufwerks-Wurzel (z.B. "C:\\")
+    free_bytes: int     # Fuer den Benutzer verfuegbarer Speicher
+    total_bytes: int    # Gesamtgroesse des Laufwerks
+
+
+def is_directory_accessible(path: str) -> bool:
+    """
+    Prueft ob ein Verzeichnis lesbar ist.
+
+    Liest hoechstens einen Verzeichniseintrag (statt os.listdir, das das
+    komplette Verzeichnis aufzaehlt und bei langsamen Laufwerken blockiert).
+
+    Args:
+        path: Zu pruefendes Verzeichnis
+
+    Returns:
+        True wenn das Verzeichnis geoeffnet werden konnte
+    """
+    try:
+        with os.scandir(path) as entries:
+            next(entries, None)
+        return True
+    except OSError:
+        return False
+
+
 class PlatformIO(ABC):
     """
     Abstrakte Basisklasse fuer plattform-spezifische I/O Operationen.
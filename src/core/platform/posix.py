@@ -6,11 +6,12 @@ Dieses Modul enthaelt POSIX-konforme Operationen fuer:
 - posix_fadvise fuer Cache-Flush
 """
 import os
+import shutil
 from pathlib import Path
 from typing import IO, Optional
 import logging
 
-from .base import PlatformIO
+from .base import PlatformIO, DriveInfo, is_directory_accessible
 
 
 class PosixIO(PlatformIO):
@@ -121,3 +122,44 @@ class PosixIO(PlatformIO):
             True wenn O_DIRECT als Flag existiert
         """
         return hasattr(os, 'O_DIRECT')
+
+    @staticmethod
+    def probe_drives() -> dict:
+        """
+        Ermittelt zugreifbare Laufwerke samt Speicherplatz (Fallback ohne Windows API).
+
+        Prueft die Laufwerksbuchstaben A-Z einzeln. Ausserhalb von Windows
+        existieren diese Pfade normalerweise nicht.
+
+        Returns:
+            Dict Laufwerks-Wurzel -> DriveInfo
+        """
+        drives = {}
+        for letter in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
+            drive_path = f"{letter}:\\"
+            if not os.path.exists(drive_path) or not is_directory_accessible(drive_path):
+                continue
+            try:
+                usage = shutil.disk_usage(drive_path)
+            except OSError:
+                continue
+            drives[drive_path] = DriveInfo(drive_path, usage.free, usage.total)
+        return drives
+
+    @staticmethod
+    def get_disk_space(path: str) -> tuple:
+        """
+        Ermittelt freien und gesamten Speicherplatz mit einem statvfs-Aufruf.
+
+        Args:
+            path: Pfad auf dem Laufwerk
+
+        Returns:
+            Tuple (free_bytes, total_bytes)
+
+        Raises:
+            FileNotFoundError: Wenn der Pfad nicht existiert
+            OSError: Wenn die Abfrage fehlschlaegt
+        """
+        st = os.statvfs(path)
+        return st.f_bavail * st.f_frsize, st.f_blocks * st.f_frsize
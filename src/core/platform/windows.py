@@ -5,6 +5,7 @@ Dieses Modul enthaelt alle Windows-spezifischen Operationen wie:
 - FILE_FLAG_NO_BUFFERING fuer Direct I/O
 - EmptyWorkingSet/FlushFileBuffers fuer Cache-Flush
 - GetDiskFreeSpaceW fuer Sektor-Groessen-Ermittlung
+- GetLogicalDrives/GetDriveTypeW/GetDiskFreeSpaceExW fuer Laufwerks-Abfrage
 """
 import os
 import time
@@ -14,7 +15,29 @@ from pathlib import Path
 from typing import IO, Optional
 import logging
 
-from .base import PlatformIO
+from .base import PlatformIO, DriveInfo
+
+
+# Einmalig beim Import gebunden (Modul wird nur unter Windows geladen)
+_GetDiskFreeSpaceExW = ctypes.windll.kernel32.GetDiskFreeSpaceExW
+_GetDiskFreeSpaceExW.argtypes = [
+    wintypes.LPCWSTR,
+    ctypes.POINTER(ctypes.c_ulonglong),
+    ctypes.POINTER(ctypes.c_ulonglong),
+    ctypes.POINTER(ctypes.c_ulonglong),
+]
+_GetDiskFreeSpaceExW.restype = wintypes.BOOL
+
+# Eigene Instanz mit use_last_error, damit ERROR_FILE_NOT_FOUND auswertbar ist
+_kernel32_le = ctypes.WinDLL('kernel32', use_last_error=True)
+
+_FindFirstFileW = _kernel32_le.FindFirstFileW
+_FindFirstFileW.argtypes = [wintypes.LPCWSTR, ctypes.POINTER(wintypes.WIN32_FIND_DATAW)]
+_FindFirstFileW.restype = wintypes.HANDLE
+
+_FindClose = _kernel32_le.FindClose
+_FindClose.argtypes = [wintypes.HANDLE]
+_FindClose.restype = wintypes.BOOL
 
 
 class WindowsIO(PlatformIO):
@@ -39,6 +62,19 @@ class WindowsIO(PlatformIO):
     FILE_FLAG_SEQUENTIAL_SCAN = 0x08000000
     FILE_FLAG_WRITE_THROUGH = 0x80000000
     INVALID_HANDLE_VALUE = -1
+    ERROR_FILE_NOT_FOUND = 2
+
+    # Laufwerkstypen (GetDriveTypeW)
+    DRIVE_UNKNOWN = 0
+    DRIVE_NO_ROOT_DIR = 1
+    DRIVE_REMOVABLE = 2
+    DRIVE_FIXED = 3
+    DRIVE_REMOTE = 4
+    DRIVE_CDROM = 5
+    DRIVE_RAMDISK = 6
+
+    # SetThreadErrorMode: Keine "Kein Datentraeger"-Meldungsbox von Windows
+    SEM_FAILCRITICALERRORS = 0x0001
 
     def __init__(self, buffer_size: int = 64 * 1024 * 1024):
         """
@@ -308,3 +344,112 @@ class WindowsIO(PlatformIO):
             True (immer verfuegbar unter Windows)
         """
         return True
+
+    @staticmethod
+    def probe_drives() -> dict:
+        """
+        Ermittelt zugreifbare Laufwerke samt Speicherplatz ueber die Windows API.
+
+        GetLogicalDrives liefert alle vorhandenen Buchstaben mit einem
+        einzigen Aufruf als Bitmaske. GetDriveTypeW filtert CD-Laufwerke
+        und ungueltige Eintraege aus, ohne das Laufwerk anzusprechen.
+        Wechseldatentraeger ohne eingelegtes Medium werden per
+        GetVolumeInformationW erkannt (schlaegt sofort fehl) und
+        uebersprungen. GetDiskFreeSpaceExW liefert den Speicherplatz im
+        selben Durchlauf, damit spaetere Anzeigen keine weiteren Abfragen
+        brauchen.
+
+        Returns:
+            Dict Laufwerks-Wurzel -> DriveInfo
+        """
+        kernel32 = ctypes.windll.kernel32
+        bitmask = kernel32.GetLogicalDrives()
+
+        # Fehler-Dialoge fuer leere Laufwerke nur in diesem Thread unterdruecken
+        old_mode = wintypes.DWORD()
+        kernel32.SetThreadErrorMode(WindowsIO.SEM_FAILCRITICALERRORS, ctypes.byref(old_mode))
+
+        drives = {}
+        try:
+            for i in range(26):
+                if not bitmask & (1 << i):
+                    continue
+
+                drive_path = f"{chr(ord('A') + i)}:\\"
+                drive_type = kernel32.GetDriveTypeW(drive_path)
+                if drive_type in (WindowsIO.DRIVE_UNKNOWN,
+                                  WindowsIO.DRIVE_NO_ROOT_DIR,
+                                  WindowsIO.DRIVE_CDROM):
+                    continue
+
+                # Wechseldatentraeger ohne Medium (z.B. leerer Kartenleser)
+                if (drive_type == WindowsIO.DRIVE_REMOVABLE and
+                        not kernel32.GetVolumeInformationW(
+                            drive_path, None, 0, None, None, None, None, 0)):
+                    continue
+
+                # Zugriff pruefen (genau ein FindFirstFileW-Aufruf)
+                if not WindowsIO._is_root_accessible(drive_path):
+                    continue
+
+                free_bytes = ctypes.c_ulonglong()
+                total_bytes = ctypes.c_ulonglong()
+                if not kernel32.GetDiskFreeSpaceExW(
+                    drive_path,
+                    ctypes.byref(free_bytes),
+                    ctypes.byref(total_bytes),
+                    None
+                ):
+                    continue
+
+                drives[drive_path] = DriveInfo(
+                    drive_path, int(free_bytes.value), int(total_bytes.value)
+                )
+        finally:
+            kernel32.SetThreadErrorMode(old_mode.value, None)
+
+        return drives
+
+    @staticmethod
+    def _is_root_accessible(drive_path: str) -> bool:
+        """
+        Prueft per FindFirstFileW, ob ein Laufwerk lesbar ist.
+
+        Liefert hoechstens einen Eintrag und schliesst das Such-Handle sofort
+        wieder; es wird kein Verzeichnis aufgezaehlt und keine Python-Liste
+        erzeugt. Eine leere Wurzel (ERROR_FILE_NOT_FOUND) gilt als lesbar.
+
+        Args:
+            drive_path: Laufwerks-Wurzel (z.B. "C:\\")
+
+        Returns:
+            True wenn das Laufwerk geoeffnet werden konnte
+        """
+        find_data = wintypes.WIN32_FIND_DATAW()
+        handle = _FindFirstFileW(drive_path + "*", ctypes.byref(find_data))
+        if handle is None or handle == wintypes.HANDLE(WindowsIO.INVALID_HANDLE_VALUE).value:
+            return ctypes.get_last_error() == WindowsIO.ERROR_FILE_NOT_FOUND
+        _FindClose(handle)
+        return True
+
+    @staticmethod
+    def get_disk_space(path: str) -> tuple:
+        """
+        Ermittelt freien und gesamten Speicherplatz direkt per GetDiskFreeSpaceExW.
+
+        Args:
+            path: Pfad auf dem Laufwerk
+
+        Returns:
+            Tuple (free_bytes, total_bytes)
+
+        Raises:
+            FileNotFoundError: Wenn der Pfad nicht existiert
+            OSError: Wenn die Abfrage fehlschlaegt
+        """
+        free_bytes = ctypes.c_ulonglong()
+        total_bytes = ctypes.c_ulonglong()
+        if not _GetDiskFreeSpaceExW(path, ctypes.byref(free_bytes),
+                                    ctypes.byref(total_bytes), None):
+            raise ctypes.WinError()
+        return int(free_bytes.value), int(total_bytes.value)
@@ -231,9 +231,7 @@ class SessionManager:
             IOError: Wenn Laden fehlschlägt
             ValueError: Wenn JSON-Format ungültig ist
         """
-        if not self.exists():
-            return None
-
+        # Kein vorgelagertes exists(): eine fehlende Datei meldet open() selbst
         try:
             with open(self.session_path, 'r', encoding='utf-8') as f:
                 session_dict = json.load(f)
@@ -247,6 +245,8 @@ class SessionManager:
             # errors ist bereits eine Liste, muss nicht konvertiert werden
             return SessionData(**session_dict)
 
+        except FileNotFoundError:
+            return None
         except json.JSONDecodeError as e:
             raise ValueError(f"Ungültiges JSON-Format in Session-Datei: {e}")
         except Exception as e:
@@ -268,11 +268,10 @@ class SessionManager:
         Raises:
             IOError: Wenn Löschen fehlschlägt
         """
-        if self.exists():
-            try:
-                self.session_path.unlink()
-            except Exception as e:
-                raise IOError(f"Fehler beim Löschen der Session: {e}")
+        try:
+            self.session_path.unlink(missing_ok=True)
+        except Exception as e:
+            raise IOError(f"Fehler beim Löschen der Session: {e}")
 
     def get_session_path(self) -> str:
         """
@@ -49,6 +49,15 @@ class TestConfig:
     log_dir: Optional[str] = None
 
 
+@dataclass
+class ProgressSnapshot:
+    """Fertig berechneter Fortschritt für die GUI (wird im Engine-Thread erstellt)"""
+    test_percent: int           # Fortschritt über alle Muster (0-100)
+    all_files_percent: int      # Fortschritt aller Dateien in aktueller Phase (0-100)
+    speed_mbps: float           # Aktuelle Geschwindigkeit in MB/s
+    remaining_seconds: float    # Geschätzte Restzeit in Sekunden
+
+
 class TestEngine(QThread):
     """
     Test-Engine als QThread
@@ -58,6 +67,7 @@ class TestEngine(QThread):
 
     Signals:
         progress_updated: (current_bytes: float, total_bytes: float, speed_mbps: float)
+        progress_snapshot: (ProgressSnapshot)  # GUI-fertig berechneter Fortschritt
         status_changed: (status_message)
         log_entry: (log_message)
         error_occurred: (error_dict)
@@ -68,6 +78,7 @@ class TestEngine(QThread):
 
     # Qt Signals
     progress_updated = Signal(float, float, float)  # current_bytes, total_bytes, speed_mbps
+    progress_snapshot = Signal(object)  # ProgressSnapshot
     file_progress_updated = Signal(int)  # file_progress_percent (0-100)
     file_changed = Signal(int, int)  # current_file_index, total_file_count
     status_changed = Signal(str)
@@ -81,7 +92,9 @@ class TestEngine(QThread):
     CHUNK_SIZE = 32 * 1024 * 1024  # 32 MB - Größere Chunks = weniger System-Calls
     IO_BUFFER_SIZE = 64 * 1024 * 1024  # 64 MB - Großer Buffer für bessere Performance
     PROGRESS_UPDATE_INTERVAL = 4  # Emit Progress nur alle N Chunks (reduziert GUI-Overhead)
+    PROGRESS_MIN_INTERVAL_SECONDS = 0.05  # Und hoechstens 20x pro Sekunde (schnelle SSDs)
     IO_TIMEOUT_WARNING_SECONDS = 30  # Warnung wenn Chunk länger als 30s dauert
+    _INV_MIB = 1.0 / (1024 * 1024)  # Bytes -> MB als Multiplikation
 
     def __init__(self, config: TestConfig):
         """
@@ -129,10 +142,17 @@ class TestEngine(QThread):
         self.total_bytes = 0
         self.error_count = 0
 
+        # Cache für Gesamtvolumen (gilt für die Session-Instanz)
+        self._total_test_bytes = 0
+        self._total_test_bytes_session: Optional[SessionData] = None
+
         # Geschwindigkeits-Berechnung
         self._speed_samples = []
         self._speed_window = 10  # Letzte N Chunks für Durchschnitt
 
+        # Zeitpunkt (monotonic) des letzten Progress-Emits, siehe _progress_due()
+        self._last_progress_emit = 0.0
+
         # Platform I/O fuer plattform-spezifische Operationen
         self.platform_io = get_platform_io(self.IO_BUFFER_SIZE)
 
@@ -521,9 +541,8 @@ class TestEngine(QThread):
                             f"moeglicherweise Disk-Probleme"
                         )
 
-                    # Progress nur alle PROGRESS_UPDATE_INTERVAL Chunks emittieren
-                    # Oder am Ende der Datei (letzter Chunk)
-                    if chunk_idx % self.PROGRESS_UPDATE_INTERVAL == 0 or chunk_idx == chunks_total - 1:
+                    # Progress gedrosselt emittieren, am Ende der Datei immer
+                    if self._progress_due(chunk_idx, chunks_total):
                         self._emit_progress()
 
                         # Datei-Fortschritt emittieren
@@ -677,9 +696,8 @@ class TestEngine(QThread):
                             f"moeglicherweise Disk-Probleme"
                         )
 
-                    # Progress nur alle PROGRESS_UPDATE_INTERVAL Chunks emittieren
-                    # Oder am Ende der Datei (letzter Chunk)
-                    if chunk_idx % self.PROGRESS_UPDATE_INTERVAL == 0 or chunk_idx == chunks_total - 1:
+                    # Progress gedrosselt emittieren, am Ende der Datei immer
+                    if self._progress_due(chunk_idx, chunks_total):
                         self._emit_progress()
 
                         # Datei-Fortschritt emittieren
@@ -756,10 +774,146 @@ class TestEngine(QThread):
         mb_per_chunk = self.CHUNK_SIZE / (1024 * 1024)
         return mb_per_chunk / avg_time
 
+    def _progress_due(self, chunk_idx: int, chunks_total: int) -> bool:
+        """
+        Prüft ob nach diesem Chunk Fortschritt emittiert werden soll.
+
+        Emittiert wird nur alle PROGRESS_UPDATE_INTERVAL Chunks und höchstens
+        alle PROGRESS_MIN_INTERVAL_SECONDS, der letzte Chunk einer Datei
+        immer. So landen auch bei sehr schnellen Laufwerken nicht mehr
+        Events in der GUI-Queue, als angezeigt werden können.
+        """
+        if chunk_idx != chunks_total - 1:
+            if chunk_idx % self.PROGRESS_UPDATE_INTERVAL != 0:
+                return False
+            if time.monotonic() - self._last_progress_emit < self.PROGRESS_MIN_INTERVAL_SECONDS:
+                return False
+        self._last_progress_emit = time.monotonic()
+        return True
+
     def _emit_progress(self):
         """Emittiert Fortschritts-Update"""
         speed = self._calculate_speed()
         self.progress_updated.emit(float(self.bytes_processed), float(self.total_bytes), speed)
+        self.progress_snapshot.emit(self._compute_progress_snapshot(speed))
+
+    def _compute_progress_snapshot(self, speed_mbps: float) -> ProgressSnapshot:
+        """
+        Berechnet den GUI-Fortschritt im Engine-Thread.
+
+        Args:
+            speed_mbps: Aktuelle Geschwindigkeit in MB/s
+
+        Returns:
+            ProgressSnapshot mit allen Anzeige-Werten
+        """
+        test_percent = self._calculate_test_progress()
+        return ProgressSnapshot(
+            test_percent=test_percent,
+            all_files_percent=self._calculate_all_files_progress(),
+            speed_mbps=speed_mbps,
+            remaining_seconds=self._calculate_time_remaining(test_percent, speed_mbps)
+        )
+
+    def _calculate_test_progress(self) -> int:
+        """
+        Berechnet Test-Fortschritt über alle Muster.
+
+        Formel: (completed_patterns * 2 + current_phase) / (total_patterns * 2) * 100
+
+        Returns:
+            Fortschritt in Prozent (0-100)
+        """
+        session = self.session
+        if not session:
+            return 0
+
+        # Anzahl ausgewählter Patterns
+        total_patterns = len(session.selected_patterns) if session.selected_patterns else 5
+
+        # Anzahl abgeschlossener Patterns (beide Phasen komplett)
+        completed_patterns = len(session.completed_patterns) if session.completed_patterns else 0
+
+        # Aktuelles Pattern: Wie viele Phasen sind abgeschlossen?
+        # - Wenn Phase "write": 0 Phasen abgeschlossen
+        # - Wenn Phase "verify": 1 Phase abgeschlossen (write ist fertig)
+        current_phase_value = 1 if session.current_phase == "verify" else 0
+
+        # Fortschritt in der aktuellen Phase (0.0 - 1.0)
+        phase_bytes, bytes_per_phase = self._get_phase_bytes()
+        phase_progress = min(1.0, phase_bytes / bytes_per_phase) if bytes_per_phase > 0 else 0.0
+
+        # Gesamtfortschritt berechnen
+        # completed_patterns sind komplett (2 Phasen je Pattern)
+        # Aktuelles Pattern: current_phase_value Phasen + Fortschritt in aktueller Phase
+        total_phases = total_patterns * 2  # Jedes Pattern hat 2 Phasen (write + verify)
+        completed_phases = (completed_patterns * 2) + current_phase_value + phase_progress
+
+        percent = int((completed_phases / total_phases) * 100) if total_phases > 0 else 0
+        return min(100, max(0, percent))
+
+    def _calculate_all_files_progress(self) -> int:
+        """
+        Berechnet Fortschritt aller Dateien in der aktuellen Phase.
+
+        Returns:
+            Fortschritt in Prozent (0-100)
+        """
+        if not self.session:
+            return 0
+
+        phase_bytes, bytes_per_phase = self._get_phase_bytes()
+        percent = int((phase_bytes / bytes_per_phase) * 100) if bytes_per_phase > 0 else 0
+        return min(100, max(0, percent))
+
+    def _get_phase_bytes(self) -> tuple:
+        """
+        Ermittelt verarbeitete Bytes und Gesamtbytes der aktuellen Phase.
+
+        Returns:
+            (phase_bytes, bytes_per_phase)
+        """
+        session = self.session
+        bytes_per_file = int(session.file_size_gb * 1024 * 1024 * 1024)
+        bytes_per_phase = session.file_count * bytes_per_file
+        phase_bytes = (session.current_file_index * bytes_per_file +
+                       session.current_chunk_index * self.CHUNK_SIZE)
+        return phase_bytes, bytes_per_phase
+
+    def _calculate_time_remaining(self, test_percent: int, speed_mbps: float) -> float:
+        """
+        Berechnet geschätzte Restzeit basierend auf Test-Fortschritt und aktueller Geschwindigkeit.
+
+        Args:
+            test_percent: Aktueller Test-Fortschritt (0-100)
+            speed_mbps: Aktuelle Geschwindigkeit in MB/s
+
+        Returns:
+            Geschätzte Restzeit in Sekunden
+        """
+        # Early-Out bevor irgendetwas berechnet wird
+        if not self.session or test_percent >= 100 or speed_mbps <= 0:
+            return 0.0
+
+        # Verbleibende MB = Gesamtvolumen × verbleibender Anteil
+        remaining_mb = self._get_total_test_bytes() * (1.0 - test_percent * 0.01) * self._INV_MIB
+        return max(0.0, remaining_mb / speed_mbps)
+
+    def _get_total_test_bytes(self) -> int:
+        """
+        Gesamtvolumen des Tests: Alle Dateien × Alle Muster × 2 Phasen.
+
+        Wird einmal pro Session berechnet, da sich Dateianzahl und
+        Muster-Auswahl während des Laufs nicht ändern.
+        """
+        if self._total_test_bytes_session is not self.session:
+            session = self.session
+            total_patterns = len(session.selected_patterns) if session.selected_patterns else 5
+            bytes_per_file = int(session.file_size_gb * 1024 * 1024 * 1024)
+            bytes_per_pattern = session.file_count * bytes_per_file * 2  # Write + Verify
+            self._total_test_bytes = total_patterns * bytes_per_pattern
+            self._total_test_bytes_session = session
+        return self._total_test_bytes
 
     def _handle_pause(self):
         """Behandelt Pause-Request"""
@@ -799,7 +953,7 @@ class TestEngine(QThread):
 
         # Wichtig: bytes_processed könnte durch Rundungsfehler < total_bytes sein
         self.bytes_processed = self.total_bytes
-        self.progress_updated.emit(float(self.total_bytes), float(self.total_bytes), self._calculate_speed())
+        self._emit_progress()
         self.file_progress_updated.emit(100)
 
         self.logger.section("Test abgeschlossen")
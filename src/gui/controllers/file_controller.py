@@ -8,7 +8,6 @@ Verantwortlich für:
 - Fehlende Dateien füllen (Lücken)
 """
 
-import os
 import random
 from pathlib import Path
 from typing import Optional, List, TYPE_CHECKING, Callable
@@ -21,7 +20,7 @@ from core.file_manager import FileManager
 from core.file_analyzer import FileAnalyzer, FileAnalysisResult
 from core.patterns import PatternGenerator, PatternType, PATTERN_SEQUENCE
 from core.session import SessionManager, SessionData
-from core.platform import get_window_activator
+from core.platform import get_window_activator, BYTES_PER_GB
 
 if TYPE_CHECKING:
     from gui.main_window import MainWindow
@@ -50,6 +49,9 @@ class FileController(QObject):
         self.window = main_window
         self._get_timestamp = get_timestamp
 
+        # Bestätigungs-Dialog wird einmal erstellt und per reset() wiederverwendet
+        self._delete_dialog = None
+
     def fill_missing_files(
         self,
         analyzer: FileAnalyzer,
@@ -103,7 +105,7 @@ class FileController(QObject):
         file_manager = FileManager(analyzer.target_path, file_size_gb, session_data.file_count)
         pattern_gen = PatternGenerator(detected_pattern)
         chunk_size = 16 * 1024 * 1024  # 16 MB
-        target_size = int(file_size_gb * 1024 * 1024 * 1024)
+        target_size = int(file_size_gb * BYTES_PER_GB)
 
         for engine_index in sorted(missing_indices):
             file_path = file_manager.get_file_path(engine_index)
@@ -173,6 +175,9 @@ class FileController(QObject):
             activate_window(expansion_dialog)
             expansion_dialog.exec()
 
+            # Freier Speicher hat sich geändert
+            self.window.config_widget.invalidate_free_space_cache()
+
             success_count, error_count = expansion_dialog.get_results()
 
             if error_count > 0:
@@ -209,7 +214,8 @@ class FileController(QObject):
         Rekonstruiert eine Session aus vorhandenen Dateien.
 
         Args:
-            analysis_results: Liste von FileAnalysisResult
+            analysis_results: Liste von FileAnalysisResult, sortiert nach Dateiindex
+                              (wie von FileAnalyzer.analyze_existing_files geliefert)
             file_size_gb: Erwartete Dateigröße in GB
             overwrite_corrupted: Ob beschädigte Dateien überschrieben werden sollen
             requested_test_size_gb: Vom User gewünschte Testgröße (falls None: aus GUI lesen)
@@ -221,12 +227,14 @@ class FileController(QObject):
         # Nach dem Vergrößern sind sie vollständig, vorher können sie zu klein aber konsistent sein
         # WICHTIG: FileAnalyzer gibt Indizes aus Dateinamen (1-basiert)
         # Konvertiere alle zu Engine-Indizes (0-basiert) durch -1
-        usable_files = [
-            r for r in analysis_results
-            if r.detected_pattern is not None and r.actual_size > 0
-        ]
+        # Ergebnisse sind sortiert: die letzte verwendbare Datei ist die erste von hinten
+        last_usable = next(
+            (r for r in reversed(analysis_results)
+             if r.detected_pattern is not None and r.actual_size > 0),
+            None
+        )
 
-        if not usable_files:
+        if last_usable is None:
             QMessageBox.warning(
                 self.window,
                 "Keine verwendbaren Dateien",
@@ -236,7 +244,6 @@ class FileController(QObject):
             return None
 
         # Konvertiere file_index von 1-basiert zu 0-basiert
-        last_usable = max(usable_files, key=lambda r: r.file_index)
         last_usable_index = last_usable.file_index - 1  # Engine-Index
 
         # Aktuelles Muster schätzen (Write-Phase)
@@ -261,28 +268,25 @@ class FileController(QObject):
         # Nächste Datei bestimmen
         # HINWEIS: Lücken wurden bereits in fill_missing_files() gefüllt
         if overwrite_corrupted:
-            # Finde erste beschädigte Datei NACH letzter verwendbarer (Engine-Index)
-            corrupted_after = [
-                r for r in analysis_results
-                if not r.is_complete and (r.file_index - 1) > last_usable_index
-            ]
-
-            if corrupted_after:
-                next_file_index = min(corrupted_after, key=lambda r: r.file_index).file_index - 1
-            else:
-                # Keine beschädigten Dateien nach letzter verwendbarer
-                # Setze am Ende fort
-                next_file_index = last_usable_index + 1
+            # Finde erste beschädigte Datei NACH letzter verwendbarer
+            min_file_index = last_usable.file_index
         else:
             # Finde erste beschädigte Datei (auch vor letzter verwendbarer)
-            corrupted_all = [r for r in analysis_results if not r.is_complete]
+            min_file_index = 0
 
-            if corrupted_all:
-                next_file_index = min(corrupted_all, key=lambda r: r.file_index).file_index - 1
-            else:
-                # Keine beschädigten Dateien
-                # Setze am Ende fort
-                next_file_index = last_usable_index + 1
+        # Sortiert: die erste Fundstelle ist die mit dem kleinsten Index
+        first_corrupted = next(
+            (r for r in analysis_results
+             if not r.is_complete and r.file_index > min_file_index),
+            None
+        )
+
+        if first_corrupted is not None:
+            next_file_index = first_corrupted.file_index - 1
+        else:
+            # Keine beschädigten Dateien (nach letzter verwendbarer)
+            # Setze am Ende fort
+            next_file_index = last_usable_index + 1
 
         # Session-Daten erstellen
         config = self.window.config_widget.get_config()
@@ -339,10 +343,14 @@ class FileController(QObject):
             return None
 
         # Log
+        usable_count = sum(
+            1 for r in analysis_results
+            if r.detected_pattern is not None and r.actual_size > 0
+        )
         self.window.log_widget.add_log(
             self._get_timestamp(),
             "INFO",
-            f"Session aus {len(usable_files)} verwendbaren Dateien rekonstruiert"
+            f"Session aus {usable_count} verwendbaren Dateien rekonstruiert"
         )
 
         return session_data
@@ -379,7 +387,7 @@ class FileController(QObject):
         corrupted_incomplete = categorized['corrupted_incomplete']
 
         total_size = sum(r.actual_size for r in results)
-        total_size_gb = total_size / (1024 ** 3)
+        total_size_gb = total_size / BYTES_PER_GB
 
         # Muster schätzen
         pattern_estimate = analyzer.estimate_current_pattern(results)
@@ -469,7 +477,7 @@ class FileController(QObject):
         corrupted_incomplete = categorized['corrupted_incomplete']
 
         total_size = sum(r.actual_size for r in results)
-        total_size_gb = total_size / (1024 ** 3)
+        total_size_gb = total_size / BYTES_PER_GB
 
         # Muster schätzen
         pattern_estimate = analyzer.estimate_current_pattern(results)
@@ -542,7 +550,14 @@ class FileController(QObject):
         """
         from gui.dialogs import DeleteFilesDialog
 
-        if not target_path or not os.path.exists(target_path):
+        # FileManager prüft den Pfad selbst (ein stat statt zusätzlichem os.path.exists)
+        file_manager = None
+        if target_path:
+            try:
+                file_manager = FileManager(target_path, 1.0)  # Größe egal
+            except ValueError:
+                pass
+        if file_manager is None:
             QMessageBox.warning(
                 self.window,
                 "Fehler",
@@ -551,7 +566,6 @@ class FileController(QObject):
             return (0, 0)
 
         # Testdateien zählen und Größe ermitteln
-        file_manager = FileManager(target_path, 1.0)  # Größe egal
         file_count = file_manager.count_existing_files()
 
         if file_count == 0:
@@ -564,15 +578,19 @@ class FileController(QObject):
 
         # Gesamtgröße berechnen
         total_size_bytes = file_manager.get_existing_files_size()
-        total_size_gb = total_size_bytes / (1024 ** 3)
+        total_size_gb = total_size_bytes / BYTES_PER_GB
 
         # Bestätigungs-Dialog
-        dialog = DeleteFilesDialog(
-            target_path,
-            file_count,
-            total_size_gb,
-            self.window
-        )
+        if self._delete_dialog is None:
+            self._delete_dialog = DeleteFilesDialog(
+                target_path,
+                file_count,
+                total_size_gb,
+                self.window
+            )
+        else:
+            self._delete_dialog.reset(target_path, file_count, total_size_gb)
+        dialog = self._delete_dialog
         activate_window = get_window_activator()
         activate_window(dialog)
 
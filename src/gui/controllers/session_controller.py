@@ -18,10 +18,11 @@ from datetime import datetime
 from PySide6.QtCore import QObject
 from PySide6.QtWidgets import QMessageBox
 
+from core.file_manager import FileManager
 from core.session import SessionManager, SessionData
 from core.patterns import PatternType, PATTERN_SEQUENCE
 from core.file_analyzer import FileAnalyzer
-from core.platform import get_window_activator
+from core.platform import get_window_activator, BYTES_PER_GB
 
 if TYPE_CHECKING:
     from gui.main_window import MainWindow
@@ -29,6 +30,10 @@ if TYPE_CHECKING:
     from .file_controller import FileController
 
 
+# Display-Namen der Muster nach Pattern-Wert (z.B. "0x00" -> "0x00 (Null)")
+_PATTERN_NAMES = {pt.value: pt.display_name for pt in PatternType}
+
+
 @dataclass
 class SessionInfo:
     """Informationen über eine gefundene Session oder verwaiste Testdateien."""
@@ -179,7 +184,7 @@ class SessionController(QObject):
 
             if results:
                 total_size = sum(r.actual_size for r in results)
-                total_size_gb = total_size / (1024 ** 3)
+                total_size_gb = total_size / BYTES_PER_GB
 
                 # Pattern schätzen
                 pattern_estimate = analyzer.estimate_current_pattern(results)
@@ -313,6 +318,7 @@ class SessionController(QObject):
                     'progress': int(session_data.get_progress_percentage()),
                     'pattern_index': session_data.current_pattern_index,
                     'pattern_name': self._get_pattern_name_from_value(session_data.current_pattern_name),
+                    'pattern_total': len(session_data.selected_patterns) if session_data.selected_patterns else 5,
                     'error_count': len(session_data.errors)
                 }
 
@@ -415,6 +421,7 @@ class SessionController(QObject):
                             'progress': int(session_data.get_progress_percentage()),
                             'pattern_index': session_data.current_pattern_index,
                             'pattern_name': self._get_pattern_name_from_value(session_data.current_pattern_name),
+                            'pattern_total': len(session_data.selected_patterns) if session_data.selected_patterns else 5,
                             'error_count': len(session_data.errors)
                         }
 
@@ -492,9 +499,9 @@ class SessionController(QObject):
         pattern_name = self._get_pattern_name_from_value(session_data.current_pattern_name)
         total_patterns = len(session_data.selected_patterns) if session_data.selected_patterns else 5
         # Berechne aktuellen Index (abgeschlossene + 1)
-        completed_count = len(session_data.completed_patterns) if hasattr(session_data, 'completed_patterns') else 0
-        current_pattern_num = completed_count + 1
-        self.window.progress_widget.set_pattern(f"{current_pattern_num}/{total_patterns} ({pattern_name})")
+        current_pattern_num = len(completed) + 1
+        pattern_info = f"{current_pattern_num}/{total_patterns} ({pattern_name})"
+        self.window.progress_widget.set_pattern(pattern_info)
 
         phase = "Schreiben" if session_data.current_phase == "write" else "Verifizieren"
         self.window.progress_widget.set_phase(phase)
@@ -511,26 +518,15 @@ class SessionController(QObject):
         self.window.config_widget.set_enabled_for_resume()  # Nur bestimmte Felder aktivieren
 
         # Session-Info anzeigen
-        session_path = Path(session_data.target_path) / "disktest_session.json"
-        self.window.set_session_info(str(session_path))
+        session_path = os.path.join(session_data.target_path, SessionManager.SESSION_FILENAME)
+        self.window.set_session_info(session_path)
 
         # Log
-        self.window.log_widget.add_log(
-            self._get_timestamp(),
-            "INFO",
-            "Session wiederhergestellt - Test pausiert"
-        )
-
-        # Pattern-Info für Log
-        total_patterns = len(session_data.selected_patterns) if session_data.selected_patterns else 5
-        completed_count = len(session_data.completed_patterns) if hasattr(session_data, 'completed_patterns') else 0
-        current_pattern_num = completed_count + 1
-
-        self.window.log_widget.add_log(
-            self._get_timestamp(),
-            "INFO",
-            f"Fortschritt: {progress}% - Muster {current_pattern_num}/{total_patterns} ({pattern_name})"
-        )
+        timestamp = self._get_timestamp()
+        self.window.log_widget.add_logs_batch([
+            (timestamp, "INFO", "Session wiederhergestellt - Test pausiert"),
+            (timestamp, "INFO", f"Fortschritt: {progress}% - Muster {pattern_info}"),
+        ])
 
     def _get_pattern_name_from_value(self, pattern_value: str) -> str:
         """
@@ -542,11 +538,7 @@ class SessionController(QObject):
         Returns:
             Display-Name des Patterns
         """
-        try:
-            pattern_type = PatternType(pattern_value)
-            return pattern_type.display_name
-        except (ValueError, AttributeError):
-            return "--"
+        return _PATTERN_NAMES.get(pattern_value, "--")
 
     def _migrate_filenames_if_needed(self, session_data: SessionData) -> None:
         """
@@ -559,8 +551,6 @@ class SessionController(QObject):
             session_data: Die Session-Daten mit file_count
         """
         try:
-            from core.file_manager import FileManager
-
             # FileManager mit aktueller file_count erstellen
             file_manager = FileManager(
                 session_data.target_path,
@@ -47,6 +47,30 @@ class SettingsController:
         if path and os.path.exists(path):
             self.settings.setValue("last_target_path", path)
 
+    # --- Free Space Cache ---
+
+    def get_free_space_cache(self) -> dict:
+        """
+        Lädt die zuletzt angezeigten Speicherplatz-Werte.
+
+        Returns:
+            Dict Pfad -> verfügbarer Speicher in GB (leer wenn nichts gespeichert)
+        """
+        cache = self.settings.value("free_space_cache", "{}")
+        try:
+            return {str(k): float(v) for k, v in json.loads(cache).items()}
+        except (json.JSONDecodeError, TypeError, ValueError, AttributeError):
+            return {}
+
+    def save_free_space_cache(self, cache: dict) -> None:
+        """
+        Speichert die zuletzt angezeigten Speicherplatz-Werte.
+
+        Args:
+            cache: Dict Pfad -> verfügbarer Speicher in GB
+        """
+        self.settings.setValue("free_space_cache", json.dumps(cache))
+
     # --- Recent Sessions ---
 
     def get_recent_sessions(self, max_count: int = 10) -> List[dict]:
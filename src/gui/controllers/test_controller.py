@@ -9,18 +9,23 @@ Verantwortlich für:
 
 import os
 import shutil
+import stat
+import time
+from collections import deque
 from pathlib import Path
 from typing import Optional, TYPE_CHECKING
 from datetime import datetime
 
-from PySide6.QtCore import QObject, Slot, QTimer
+from PySide6.QtCore import QObject, Qt, Slot, QTimer, QFileSystemWatcher
 from PySide6.QtWidgets import QMessageBox
 
-from core.test_engine import TestEngine, TestConfig, TestState
+from core.test_engine import TestEngine, TestConfig, TestState, ProgressSnapshot
 from core.session import SessionManager, SessionData
 from core.file_manager import FileManager
 from core.patterns import PatternType, PATTERN_SEQUENCE
-from core.platform import get_window_activator
+from core.platform import get_window_activator, BYTES_PER_GB
+from gui.dialogs import StopConfirmationDialog, ErrorDetailDialog, ErrorEntry
+from gui.widgets import LogWidget
 
 from .settings_controller import SettingsController
 from .file_controller import FileController
@@ -37,6 +42,16 @@ class TestController(QObject):
     Koordiniert alle anderen Controller und steuert die Test-Engine.
     """
 
+    FS_CACHE_TTL_SECONDS = 2.0  # Gültigkeit gecachter Testdatei-Zählungen ohne neues os.stat
+    FS_MTIME_RESOLUTION_NS = 2_000_000_000  # Gröbste mtime-Auflösung (FAT: 2 Sekunden)
+    PROGRESS_FLUSH_INTERVAL_MS = 100  # Fortschritt höchstens ~10x pro Sekunde anzeigen
+    LOG_FLUSH_INTERVAL_MS = 50  # Engine-Logeinträge gesammelt ins Log-Widget schreiben
+    DIR_WATCH_DEBOUNCE_MS = 300  # Änderungen im Zielordner gesammelt auswerten
+    SPEED_DISPLAY_TOLERANCE = 0.01  # Geschwindigkeit erst ab 1 % Abweichung neu anzeigen
+
+    # Angezeigte Werte (Test-%, Alle-Dateien-%, MB/s, Restsekunden) vor der ersten Anzeige
+    _NO_PROGRESS_SHOWN = (-1, -1, -1.0, -1)
+
     def __init__(self, main_window: "MainWindow"):
         """
         Initialisiert den Controller.
@@ -47,9 +62,20 @@ class TestController(QObject):
         super().__init__()
 
         self.window: "MainWindow" = main_window
+
+        # Häufig genutzte Widgets einmal binden (Slots laufen mit Engine-Signalrate)
+        self._progress_widget = main_window.progress_widget
+        self._log_widget = main_window.log_widget
+        self._control_widget = main_window.control_widget
+        self._config_widget = main_window.config_widget
+        self._status_bar = main_window.statusBar()
         self.engine: Optional[TestEngine] = None
         self.current_state = TestState.IDLE
 
+        # Zeitstempel der aktuellen Sekunde (siehe _get_timestamp)
+        self._ts_sec = -1
+        self._ts_str = ""
+
         # Sub-Controller initialisieren
         self.settings = SettingsController()
         self.file_controller = FileController(main_window, self._get_timestamp)
@@ -63,44 +89,114 @@ class TestController(QObject):
         # Fehler-Liste für Detail-Dialog
         self.errors = []
 
+        # Aufbereitete ErrorEntries zu self.errors (siehe on_error_counter_clicked)
+        self._error_entries = []
+        self._error_entries_source = None
+
+        # Stop-Bestätigung wird beim ersten Bedarf erstellt und wiederverwendet
+        self._stop_dialog = None
+
+        # Stop bestätigt, Aufräumen steht noch aus (siehe _on_stop_finished)
+        self._stop_pending = False
+
         # Statistiken
         self.test_start_time = None
 
+        # Anzahl Testdateien pro Pfad: path -> (Zeitpunkt, mtime_ns, Anzahl)
+        self._fs_cache: dict[str, tuple[float, int, int]] = {}
+
+        # Pfad, für den der Delete-Button zuletzt gesetzt wurde, und ob dort Testdateien lagen
+        self._last_delete_path: Optional[str] = None
+        self._last_delete_has_files = False
+
+        # Zielordner überwachen: außerhalb von DiskTest angelegte oder gelöschte
+        # Testdateien aktualisieren den Delete-Button ohne erneutes Scannen
+        # bei jeder Pfadänderung. Mehrere Meldungen werden gesammelt.
+        self._dir_watcher = QFileSystemWatcher(self)
+        self._dir_watch_timer = QTimer(self)
+        self._dir_watch_timer.setSingleShot(True)
+        self._dir_watch_timer.setInterval(self.DIR_WATCH_DEBOUNCE_MS)
+        self._dir_watch_timer.timeout.connect(self._on_target_dir_changed)
+        self._dir_watcher.directoryChanged.connect(self._dir_watch_timer.start)
+
+        # FileManager des aktuellen Zielpfads (nur Zählen/Größe, Dateigröße egal)
+        self._file_managers: dict[str, FileManager] = {}
+
+        # SessionManager des aktuellen Zielpfads
+        self._session_managers: dict[str, SessionManager] = {}
+
+        # Letzte gemeldete Fortschrittswerte; der Timer überträgt sie gesammelt
+        self._pending_snapshot: Optional[ProgressSnapshot] = None
+        self._pending_file_percent = -1
+        self._shown_progress = self._NO_PROGRESS_SHOWN
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(self.PROGRESS_FLUSH_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
+        # Log-Einträge der Engine: (timestamp, level, message), per Timer gesammelt
+        # geschrieben. Mehr als das Log-Widget anzeigt, wird gar nicht erst vorgemerkt.
+        self._log_queue: deque[tuple[str, str, str]] = deque(maxlen=LogWidget.MAX_LINES)
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_logs)
+
         # Signals verbinden
         self._connect_gui_signals()
 
         # Letzten Pfad laden und setzen
         self._load_last_path()
 
+        # Session-Prüfung (Laufwerks-Scan + Dialog) erst nach dem ersten
+        # Zeichnen des Hauptfensters, damit es nicht leer auf den Scan wartet
+        QTimer.singleShot(0, self._run_startup_checks)
+
+    def _run_startup_checks(self):
+        """Startprüfungen, laufen sobald die Event-Loop aktiv ist."""
         # Session-Wiederherstellung beim Start prüfen
         self.session_controller.check_for_existing_session()
 
-        # Delete-Button Status aktualisieren
+        # Delete-Button Status aktualisieren (beim Laden des Pfads zurückgestellt)
         self._update_delete_button()
 
     def _connect_gui_signals(self):
         """Verbindet GUI-Signals mit Controller-Slots."""
         # Control-Buttons
-        self.window.control_widget.start_clicked.connect(self.on_start_clicked)
-        self.window.control_widget.pause_clicked.connect(self.on_pause_clicked)
-        self.window.control_widget.stop_after_file_clicked.connect(self.on_stop_after_file_clicked)
-        self.window.control_widget.stop_clicked.connect(self.on_stop_clicked)
-        self.window.control_widget.delete_files_clicked.connect(self.on_delete_files_clicked)
+        self._control_widget.start_clicked.connect(self.on_start_clicked)
+        self._control_widget.pause_clicked.connect(self.on_pause_clicked)
+        self._control_widget.stop_after_file_clicked.connect(self.on_stop_after_file_clicked)
+        self._control_widget.stop_clicked.connect(self.on_stop_clicked)
+        self._control_widget.delete_files_clicked.connect(self.on_delete_files_clicked)
 
         # Pattern-Auswahl Änderungen
-        self.window.config_widget.pattern_widget.selection_changed.connect(self.on_pattern_selection_changed)
+        self._config_widget.pattern_widget.selection_changed.connect(self.on_pattern_selection_changed)
 
         # Error-Counter klickbar machen
-        self.window.progress_widget.error_counter.clicked.connect(self.on_error_counter_clicked)
+        self._progress_widget.error_counter.clicked.connect(self.on_error_counter_clicked)
 
         # Config-Änderungen
-        self.window.config_widget.path_changed.connect(self.on_path_changed)
+        self._config_widget.path_changed.connect(self.on_path_changed)
 
     def _load_last_path(self):
-        """Lädt den zuletzt verwendeten Pfad aus QSettings."""
+        """
+        Lädt den zuletzt verwendeten Pfad aus QSettings.
+
+        Während des Fensteraufbaus gibt es keinen Laufwerkszugriff im
+        GUI-Thread: Ob der Pfad noch existiert, zeigt die Speicherplatz-Abfrage
+        im Hintergrund ("--" wenn nicht). Die Testdateien für den Delete-Button
+        werden erst in _run_startup_checks nach dem ersten Zeichnen gezählt.
+        """
         last_path = self.settings.get_last_path()
-        if last_path and os.path.exists(last_path):
-            self.window.config_widget.path_edit.setText(last_path)
+        if last_path:
+            # path_changed aus set_path_prefilled soll noch nicht zählen:
+            # gleicher Pfad -> on_path_changed übernimmt nur den gemerkten Stand
+            self._last_delete_path = last_path
+            self._last_delete_has_files = False
+
+            # Gespeicherten Wert (falls vorhanden) sofort zeigen
+            cached_gb = self.settings.get_free_space_cache().get(last_path)
+            self._config_widget.set_path_prefilled(last_path, cached_gb)
 
     # --- Button-Handler ---
 
@@ -117,11 +213,12 @@ class TestController(QObject):
         """Pause-Button wurde geklickt."""
         if self.engine and self.current_state == TestState.RUNNING:
             self.engine.pause()
-            self.window.control_widget.set_state_paused()
+            self._flush_logs()
+            self._control_widget.set_state_paused()
             self.window.enable_pattern_selection(True)  # Pattern-Auswahl bei Pause aktivieren
             self.current_state = TestState.PAUSED
 
-            self.window.log_widget.add_log(
+            self._log_widget.add_log(
                 self._get_timestamp(),
                 "INFO",
                 "Test pausiert"
@@ -130,17 +227,16 @@ class TestController(QObject):
     @Slot()
     def on_stop_after_file_clicked(self):
         """Pause-nach-Datei Button wurde geklickt."""
-        from gui.dialogs import StopConfirmationDialog
-
         if self.engine and self.current_state == TestState.RUNNING:
             self.engine.stop_after_current_file()
+            self._flush_logs()
 
             # Sofort Button-State auf Pausiert setzen
-            self.window.control_widget.set_state_paused()
+            self._control_widget.set_state_paused()
             self.window.enable_pattern_selection(True)  # Pattern-Auswahl bei Pause aktivieren
             self.current_state = TestState.PAUSED
 
-            self.window.log_widget.add_log(
+            self._log_widget.add_log(
                 self._get_timestamp(),
                 "INFO",
                 "Pausiere nach aktueller Datei..."
@@ -149,25 +245,44 @@ class TestController(QObject):
     @Slot()
     def on_stop_clicked(self):
         """Stop-Button wurde geklickt."""
-        from gui.dialogs import StopConfirmationDialog
-
         # Bestätigungs-Dialog
-        dialog = StopConfirmationDialog(self.window)
+        if self._stop_dialog is None:
+            self._stop_dialog = StopConfirmationDialog(self.window)
+        dialog = self._stop_dialog
         activate_window = get_window_activator()
         activate_window(dialog)
         if dialog.exec() != StopConfirmationDialog.DialogCode.Accepted:
             return
 
-        # Test stoppen
-        if self.engine:
-            self.engine.stop()
-            self.engine.wait()  # Warten bis Thread beendet
+        # Test stoppen, ohne die GUI auf den Engine-Thread warten zu lassen:
+        # aufgeräumt wird erst, wenn die Engine beendet ist
+        self._stop_pending = True
+        engine = self.engine
+        if engine and engine.isRunning():
+            self._control_widget.set_state_stopping()
+            self._status_bar.showMessage("Test wird gestoppt...")
+            engine.finished.connect(self._on_stop_finished, Qt.ConnectionType.SingleShotConnection)
+            engine.stop()
+            # Engine war schon vor dem connect fertig - finished kommt nicht mehr
+            if engine.isRunning():
+                return
+        self._on_stop_finished()
+
+    @Slot()
+    def _on_stop_finished(self):
+        """Räumt nach einem bestätigten Stop auf, sobald die Engine beendet ist."""
+        # Direkter Aufruf und gequeuetes finished können beide ankommen
+        if not self._stop_pending:
+            return
+        self._stop_pending = False
+
+        self._flush_logs()
 
         # Session löschen
-        config = self.window.config_widget.get_config()
+        config = self._config_widget.get_config()
         if config['target_path']:
             try:
-                session_manager = SessionManager(config['target_path'])
+                session_manager = self._get_session_manager(config['target_path'])
                 session_manager.delete()
             except Exception:
                 pass
@@ -175,7 +290,7 @@ class TestController(QObject):
         # GUI zurücksetzen
         self._reset_gui()
 
-        self.window.log_widget.add_log(
+        self._log_widget.add_log(
             self._get_timestamp(),
             "WARNING",
             "Test abgebrochen"
@@ -184,31 +299,36 @@ class TestController(QObject):
     @Slot()
     def on_delete_files_clicked(self):
         """Dateien löschen-Button wurde geklickt."""
-        config = self.window.config_widget.get_config()
+        config = self._config_widget.get_config()
         target_path = config['target_path']
 
         deleted_count, errors = self.file_controller.delete_test_files(target_path)
+        self._fs_cache.pop(target_path, None)
 
         # Delete-Button deaktivieren
-        self._update_delete_button()
+        self._update_delete_button(target_path)
 
     @Slot()
     def on_error_counter_clicked(self):
         """Error-Counter wurde geklickt - zeigt Detail-Dialog."""
-        from gui.dialogs import ErrorDetailDialog
-
         if not self.errors:
             return
 
-        # Fehler für Dialog formatieren
-        error_list = []
-        for err in self.errors:
-            error_list.append({
-                'filename': err.get('file', 'Unbekannt'),
-                'pattern': err.get('pattern', '--'),
-                'phase': 'Schreiben' if err.get('phase') == 'write' else 'Verifizierung',
-                'details': err.get('message', 'Keine Details')
-            })
+        # Fehler für Dialog formatieren - nur die seit dem letzten Klick neuen,
+        # self.errors wird nur ergänzt oder als Ganzes ersetzt
+        error_list = self._error_entries
+        if self._error_entries_source is not self.errors or len(error_list) > len(self.errors):
+            error_list = self._error_entries = []
+            self._error_entries_source = self.errors
+        error_list.extend(
+            ErrorEntry(
+                filename=err.get('file', 'Unbekannt'),
+                pattern=err.get('pattern', '--'),
+                phase='Schreiben' if err.get('phase') == 'write' else 'Verifizierung',
+                details=err.get('message', 'Keine Details')
+            )
+            for err in self.errors[len(error_list):]
+        )
 
         dialog = ErrorDetailDialog(error_list, self.window)
         activate_window = get_window_activator()
@@ -218,7 +338,12 @@ class TestController(QObject):
     @Slot(str)
     def on_path_changed(self, path: str):
         """Pfad wurde geändert."""
-        self._update_delete_button()
+        # Gleicher Pfad (z.B. erneut gesetzt): gemerkten Stand ohne neue
+        # Prüfung übernehmen; Löschen und Test-Ende aktualisieren ihn selbst
+        if path == self._last_delete_path:
+            self._control_widget.enable_delete_button(self._last_delete_has_files)
+            return
+        self._update_delete_button(path)
 
     @Slot()
     def on_pattern_selection_changed(self):
@@ -228,7 +353,7 @@ class TestController(QObject):
             return
 
         # Hole aktuelle Pattern-Auswahl aus GUI
-        new_selected_patterns = self.window.config_widget.pattern_widget.get_selected_patterns()
+        new_selected_patterns = self._config_widget.pattern_widget.get_selected_patterns()
         new_selected_pattern_values = [p.value for p in new_selected_patterns]
 
         # Hole alte Pattern-Auswahl aus Session
@@ -257,7 +382,7 @@ class TestController(QObject):
 
             if msg.exec() != QMessageBox.Yes:
                 # User hat abgebrochen - Pattern-Widget zurücksetzen
-                self.window.config_widget.pattern_widget.set_selected_patterns(
+                self._config_widget.pattern_widget.set_selected_patterns(
                     [PatternType(p) for p in old_selected_pattern_values]
                 )
                 return
@@ -284,13 +409,13 @@ class TestController(QObject):
         # Session sofort speichern
         try:
             self.engine.session_manager.save(self.engine.session)
-            self.window.log_widget.add_log(
+            self._log_widget.add_log(
                 self._get_timestamp(),
                 "INFO",
                 f"Testmuster angepasst: {len(new_selected_patterns)} Muster ausgewählt"
             )
         except Exception as e:
-            self.window.log_widget.add_log(
+            self._log_widget.add_log(
                 self._get_timestamp(),
                 "ERROR",
                 f"Fehler beim Speichern der Session: {e}"
@@ -301,9 +426,12 @@ class TestController(QObject):
     def _start_new_test(self):
         """Startet einen neuen Test."""
         # Config validieren
-        config = self.window.config_widget.get_config()
+        config = self._config_widget.get_config()
 
-        if not config['target_path'] or not os.path.exists(config['target_path']):
+        test_file_count = None
+        if config['target_path']:
+            test_file_count = self._get_test_file_count(config['target_path'], revalidate=True)
+        if test_file_count is None:
             QMessageBox.warning(
                 self.window,
                 "Fehler",
@@ -321,9 +449,8 @@ class TestController(QObject):
 
         # Prüfe ZUERST auf vorhandene Testdateien
         file_size_gb = config['file_size_mb'] / 1024.0
-        test_files = list(Path(config['target_path']).glob("disktest_*.dat"))
 
-        if test_files:
+        if test_file_count:
             # Testdateien gefunden - File Recovery anbieten
             # WICHTIG: Dieser Schritt läuft VOR Speicherplatz-Check
             # Wenn User "Fortsetzen" wählt, werden vorhandene Dateien wiederverwendet
@@ -336,15 +463,15 @@ class TestController(QObject):
             if recovery_result == "reconstructed":
                 # Session wurde erstellt
                 # Lade Session und setze GUI-State
-                session_manager = SessionManager(config['target_path'])
+                session_manager = self._get_session_manager(config['target_path'])
                 try:
                     session_data = session_manager.load()
                     self.errors = session_data.errors
-                    self.window.progress_widget.set_error_count(len(self.errors))
+                    self._progress_widget.set_error_count(len(self.errors))
                     self.session_controller.resume_session(session_data)
                     self.current_state = TestState.PAUSED
                 except Exception as e:
-                    self.window.log_widget.add_log(
+                    self._log_widget.add_log(
                         self._get_timestamp(),
                         "ERROR",
                         f"Fehler beim Laden der rekonstruierten Session: {e}"
@@ -361,14 +488,12 @@ class TestController(QObject):
         # Speicherplatz prüfen (nur wenn KEIN File Recovery oder "Neuer Test")
         try:
             disk_usage = shutil.disk_usage(config['target_path'])
-            free_space_gb = disk_usage.free / (1024 ** 3)
-
-            # Vorhandene Testdateien einrechnen (werden überschrieben)
-            # FileManager: Berechne file_count für richtige Stellenzahl
-            file_count = int(config['test_size_gb'] / file_size_gb)
-            file_count = max(1, file_count)
-            fm = FileManager(config['target_path'], file_size_gb, file_count)
-            existing_size_gb = fm.get_existing_files_size() / (1024 ** 3)
+            free_space_gb = disk_usage.free / BYTES_PER_GB
+
+            # Vorhandene Testdateien einrechnen (werden überschrieben);
+            # die Größe hängt nicht von der Stellenzahl der Dateinamen ab
+            fm = self._get_file_manager(config['target_path'])
+            existing_size_gb = fm.get_existing_files_size() / BYTES_PER_GB
             available_gb = free_space_gb + existing_size_gb
 
             if config['test_size_gb'] > available_gb:
@@ -417,27 +542,24 @@ class TestController(QObject):
         # GUI vorbereiten
         self.errors = []
         self.test_start_time = datetime.now()
-        self.window.control_widget.set_state_running()
-        self.window.config_widget.set_enabled(False)
+        self._control_widget.set_state_running()
+        self._config_widget.set_enabled(False)
         self.window.enable_pattern_selection(False)  # Pattern-Widget während Test sperren
-        self.window.progress_widget.reset()
+        self._discard_pending_progress()
+        self._progress_widget.reset()
         self.current_state = TestState.RUNNING
 
         # Session-Info
-        session_path = Path(config['target_path']) / "disktest_session.json"
-        self.window.set_session_info(str(session_path))
+        session_path = os.path.join(config['target_path'], SessionManager.SESSION_FILENAME)
+        self.window.set_session_info(session_path)
 
         # Log
-        self.window.log_widget.add_log(
-            self._get_timestamp(),
-            "INFO",
-            f"Test gestartet - Ziel: {config['target_path']}"
-        )
-        self.window.log_widget.add_log(
-            self._get_timestamp(),
-            "INFO",
-            f"Konfiguration: {config['test_size_gb']} GB, Dateigröße: {config['file_size_mb']} MB"
-        )
+        timestamp = self._get_timestamp()
+        self._log_widget.add_logs_batch([
+            (timestamp, "INFO", f"Test gestartet - Ziel: {config['target_path']}"),
+            (timestamp, "INFO",
+             f"Konfiguration: {config['test_size_gb']} GB, Dateigröße: {config['file_size_mb']} MB"),
+        ])
 
         # Engine starten
         self.engine.start()
@@ -446,8 +568,8 @@ class TestController(QObject):
         """Setzt pausierte Test fort."""
         if not self.engine:
             # Keine Engine vorhanden - Session laden und neue Engine erstellen
-            config = self.window.config_widget.get_config()
-            session_manager = SessionManager(config['target_path'])
+            config = self._config_widget.get_config()
+            session_manager = self._get_session_manager(config['target_path'])
 
             # Speichere Pfad in Recent Sessions
             self.settings.add_recent_session(config['target_path'])
@@ -465,9 +587,8 @@ class TestController(QObject):
             # Test-Config mit Session erstellen
             # WICHTIG: Verwende aktuelle GUI-Einstellung für total_size_gb und selected_patterns,
             # da User beim Fortsetzen diese ändern kann
-            current_config = self.window.config_widget.get_config()
-            new_total_size_gb = current_config.get('test_size_gb', session_data.total_size_gb)
-            new_selected_patterns = current_config.get('selected_patterns', None)
+            new_total_size_gb = config.get('test_size_gb', session_data.total_size_gb)
+            new_selected_patterns = config.get('selected_patterns', None)
 
             # Dateianzahl neu berechnen falls Testgröße geändert wurde
             new_file_count = int(new_total_size_gb / session_data.file_size_gb)
@@ -476,7 +597,7 @@ class TestController(QObject):
                 session_data.total_size_gb = new_total_size_gb
                 session_data.file_count = new_file_count
 
-                self.window.log_widget.add_log(
+                self._log_widget.add_log(
                     self._get_timestamp(),
                     "INFO",
                     f"Testgröße angepasst: {new_total_size_gb} GB ({new_file_count} Dateien)"
@@ -507,7 +628,7 @@ class TestController(QObject):
 
                         if msg.exec() != QMessageBox.Yes:
                             # User hat abgebrochen - Pattern-Widget zurücksetzen
-                            self.window.config_widget.pattern_widget.set_selected_patterns(
+                            self._config_widget.pattern_widget.set_selected_patterns(
                                 [PatternType(p) for p in old_selected_pattern_values]
                             )
                             return
@@ -530,7 +651,7 @@ class TestController(QObject):
 
                     session_data.selected_patterns = new_selected_pattern_values
 
-                    self.window.log_widget.add_log(
+                    self._log_widget.add_log(
                         self._get_timestamp(),
                         "INFO",
                         f"Testmuster angepasst: {len(new_selected_patterns)} Muster ausgewählt"
@@ -540,7 +661,7 @@ class TestController(QObject):
                     try:
                         session_manager.save(session_data)
                     except Exception as e:
-                        self.window.log_widget.add_log(
+                        self._log_widget.add_log(
                             self._get_timestamp(),
                             "ERROR",
                             f"Fehler beim Speichern der Session: {e}"
@@ -565,11 +686,11 @@ class TestController(QObject):
             self.engine.resume()
 
         # GUI aktualisieren
-        self.window.control_widget.set_state_running()
+        self._control_widget.set_state_running()
         self.window.enable_pattern_selection(False)  # Pattern-Widget während Test sperren
         self.current_state = TestState.RUNNING
 
-        self.window.log_widget.add_log(
+        self._log_widget.add_log(
             self._get_timestamp(),
             "INFO",
             "Test fortgesetzt"
@@ -577,93 +698,133 @@ class TestController(QObject):
 
     def _connect_engine_signals(self):
         """Verbindet Engine-Signals mit Controller-Slots."""
-        self.engine.progress_updated.connect(self.on_progress_updated)
-        self.engine.file_progress_updated.connect(self.on_file_progress_updated)
-        self.engine.file_changed.connect(self.on_file_changed)
-        self.engine.status_changed.connect(self.on_status_changed)
-        self.engine.log_entry.connect(self.on_log_entry)
-        self.engine.error_occurred.connect(self.on_error_occurred)
-        self.engine.test_completed.connect(self.on_test_completed)
-        self.engine.pattern_changed.connect(self.on_pattern_changed)
-        self.engine.phase_changed.connect(self.on_phase_changed)
+        # Alle Signale kommen aus dem Engine-Thread: fest gequeued verbinden,
+        # statt bei jedem emit die Thread-Zugehörigkeit prüfen zu lassen.
+        # Fortschritt wird im Engine-Thread berechnet, GUI setzt nur noch Werte
+        queued = Qt.ConnectionType.QueuedConnection
+        self.engine.progress_snapshot.connect(self.on_progress_snapshot, queued)
+        self.engine.file_progress_updated.connect(self.on_file_progress_updated, queued)
+        self.engine.file_changed.connect(self.on_file_changed, queued)
+        # Status-Texte gehen ohne Python-Slot direkt an die Statusleiste
+        self.engine.status_changed.connect(self._status_bar.showMessage, queued)
+        self.engine.log_entry.connect(self.on_log_entry, queued)
+        self.engine.error_occurred.connect(self.on_error_occurred, queued)
+        self.engine.test_completed.connect(self.on_test_completed, queued)
+        self.engine.pattern_changed.connect(self.on_pattern_changed, queued)
+        self.engine.phase_changed.connect(self.on_phase_changed, queued)
 
     # --- Engine-Signal-Handler ---
 
-    @Slot(float, float, float)
-    def on_progress_updated(self, current_bytes: float, total_bytes: float, speed_mbps: float):
-        """Progress-Update von Engine."""
-        # Test-Fortschritt berechnen (über alle Muster)
-        test_percent = self._calculate_test_progress(current_bytes, total_bytes)
-        self.window.progress_widget.set_test_progress(test_percent)
+    @Slot(object)
+    def on_progress_snapshot(self, snapshot: ProgressSnapshot):
+        """Progress-Update von Engine (merkt nur den Wert vor)."""
+        self._pending_snapshot = snapshot
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
 
-        # Alle-Dateien-Fortschritt berechnen (aktuelles Muster + Phase)
-        all_files_percent = self._calculate_all_files_progress(current_bytes, total_bytes)
-        self.window.progress_widget.set_all_files_progress(all_files_percent)
+    @Slot(int)
+    def on_file_progress_updated(self, percent: int):
+        """Datei-Fortschritt Update von Engine (merkt nur den Wert vor)."""
+        self._pending_file_percent = percent
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
 
-        self.window.progress_widget.set_speed(f"{speed_mbps:.1f} MB/s")
+    def _flush_progress(self):
+        """Überträgt den zuletzt gemeldeten Fortschritt in die Anzeige."""
+        progress_widget = self._progress_widget
 
-        # Restzeit schätzen - basierend auf tatsächlichem Test-Fortschritt
-        if speed_mbps > 0:
-            remaining_seconds = self._calculate_time_remaining(test_percent, speed_mbps)
-            time_str = self._format_time_remaining(remaining_seconds)
-            self.window.progress_widget.set_time_remaining(time_str)
+        if self._pending_file_percent >= 0:
+            progress_widget.set_file_progress(self._pending_file_percent)
+            self._pending_file_percent = -1
 
-    @Slot(int)
-    def on_file_progress_updated(self, percent: int):
-        """Datei-Fortschritt Update von Engine."""
-        self.window.progress_widget.set_file_progress(percent)
+        snapshot = self._pending_snapshot
+        if snapshot is None:
+            return
+        self._pending_snapshot = None
+
+        # Nur geänderte Anzeigen setzen (spart Formatierung und Neuzeichnen);
+        # kleine Schwankungen der Geschwindigkeit werden nicht angezeigt
+        test_percent, all_files_percent, speed, remaining = self._shown_progress
+
+        if snapshot.test_percent != test_percent:
+            test_percent = snapshot.test_percent
+            progress_widget.set_test_progress(test_percent)
+
+        if snapshot.all_files_percent != all_files_percent:
+            all_files_percent = snapshot.all_files_percent
+            progress_widget.set_all_files_progress(all_files_percent)
+
+        if abs(snapshot.speed_mbps - speed) > speed * self.SPEED_DISPLAY_TOLERANCE:
+            speed = snapshot.speed_mbps
+            progress_widget.set_speed(f"{speed:.1f} MB/s")
+
+        # Restzeit nur bei bekannter Geschwindigkeit anzeigen
+        if snapshot.speed_mbps > 0 and int(snapshot.remaining_seconds) != remaining:
+            remaining = int(snapshot.remaining_seconds)
+            progress_widget.set_time_remaining(self._format_time_remaining(remaining))
+
+        self._shown_progress = (test_percent, all_files_percent, speed, remaining)
+
+    def _queue_log(self, level: str, message: str):
+        """Merkt einen Log-Eintrag für das nächste gesammelte Schreiben vor."""
+        self._log_queue.append((self._get_timestamp(), level, message))
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_logs(self):
+        """Schreibt vorgemerkte Log-Einträge in einem Durchgang ins Log-Widget."""
+        self._log_timer.stop()
+        if self._log_queue:
+            self._log_widget.add_logs_batch(self._log_queue)
+            self._log_queue.clear()
+
+    def _discard_pending_progress(self):
+        """Verwirft vorgemerkten Fortschritt, z.B. wenn die Anzeige zurückgesetzt wird."""
+        self._progress_timer.stop()
+        self._pending_snapshot = None
+        self._pending_file_percent = -1
+        self._shown_progress = self._NO_PROGRESS_SHOWN
 
     @Slot(int, int)
     def on_file_changed(self, current_file_index: int, total_file_count: int):
         """Datei-Wechsel von Engine."""
         file_info = f"{current_file_index + 1}/{total_file_count}"
-        self.window.progress_widget.set_file(file_info)
-
-    @Slot(str)
-    def on_status_changed(self, status: str):
-        """Status-Update von Engine."""
-        self.window.statusBar().showMessage(status)
+        self._progress_widget.set_file(file_info)
 
     @Slot(str)
     def on_log_entry(self, message: str):
         """Log-Eintrag von Engine."""
-        self.window.log_widget.add_log(
-            self._get_timestamp(),
-            "INFO",
-            message
-        )
+        self._queue_log("INFO", message)
 
     @Slot(dict)
     def on_error_occurred(self, error: dict):
         """Fehler von Engine."""
         self.errors.append(error)
-        self.window.progress_widget.set_error_count(len(self.errors))
+        self._progress_widget.set_error_count(len(self.errors))
 
         # Log
         message = f"{error.get('file', '?')} - {error.get('message', 'Fehler')}"
-        self.window.log_widget.add_log(
-            self._get_timestamp(),
-            "ERROR",
-            message
-        )
+        self._queue_log("ERROR", message)
 
     @Slot(dict)
     def on_test_completed(self, summary: dict):
         """Test abgeschlossen."""
+        # Letzten Fortschritt (100%) und ausstehende Log-Einträge sofort anzeigen
+        self._progress_timer.stop()
+        self._flush_progress()
+        self._flush_logs()
+
         elapsed = summary.get('elapsed_seconds', 0)
         error_count = summary.get('error_count', 0)
 
+        duration = self._format_time_remaining(elapsed)
+
         # Log
-        self.window.log_widget.add_log(
-            self._get_timestamp(),
-            "SUCCESS",
-            f"Test abgeschlossen - Dauer: {self._format_time_remaining(elapsed)}"
-        )
-        self.window.log_widget.add_log(
-            self._get_timestamp(),
-            "INFO",
-            f"Fehler: {error_count}"
-        )
+        timestamp = self._get_timestamp()
+        self._log_widget.add_logs_batch([
+            (timestamp, "SUCCESS", f"Test abgeschlossen - Dauer: {duration}"),
+            (timestamp, "INFO", f"Fehler: {error_count}"),
+        ])
 
         # Warte kurz damit User die 100% sieht, dann GUI zurücksetzen
         QTimer.singleShot(500, self._reset_gui)  # 500ms delay
@@ -674,7 +835,7 @@ class TestController(QObject):
                 self.window,
                 "Test abgeschlossen",
                 f"Der Test wurde erfolgreich abgeschlossen!\n\n"
-                f"Dauer: {self._format_time_remaining(elapsed)}\n"
+                f"Dauer: {duration}\n"
                 f"Keine Fehler gefunden."
             )
         else:
@@ -682,7 +843,7 @@ class TestController(QObject):
                 self.window,
                 "Test abgeschlossen",
                 f"Der Test wurde abgeschlossen.\n\n"
-                f"Dauer: {self._format_time_remaining(elapsed)}\n"
+                f"Dauer: {duration}\n"
                 f"Fehler: {error_count}\n\n"
                 f"Klicken Sie auf den Fehler-Counter für Details."
             )
@@ -694,164 +855,163 @@ class TestController(QObject):
         total_patterns = 5  # Default
         if self.engine and self.engine.session:
             total_patterns = len(self.engine.session.selected_patterns) if self.engine.session.selected_patterns else 5
-        self.window.progress_widget.set_pattern(f"{pattern_index + 1}/{total_patterns} ({pattern_name})")
+        self._progress_widget.set_pattern(f"{pattern_index + 1}/{total_patterns} ({pattern_name})")
 
     @Slot(str)
     def on_phase_changed(self, phase: str):
         """Phasen-Wechsel von Engine."""
-        self.window.progress_widget.set_phase(phase)
+        # Vorgemerkter Fortschritt gehört noch zur alten Phase
+        self._discard_pending_progress()
+        self._progress_widget.set_phase(phase)
         # Beim Phasenwechsel "Alle Dateien" zurücksetzen
-        self.window.progress_widget.set_all_files_progress(0)
+        self._progress_widget.set_all_files_progress(0)
 
     # --- Helper-Methoden ---
 
     def _reset_gui(self):
         """Setzt GUI in Idle-Zustand zurück."""
-        self.window.control_widget.set_state_idle()
-        self.window.config_widget.set_enabled(True)
+        self._discard_pending_progress()
+        self._control_widget.set_state_idle()
+        self._config_widget.set_enabled(True)
         self.window.enable_pattern_selection(True)  # Pattern-Auswahl wieder aktivieren
         self.window.set_session_info("")
         self.current_state = TestState.IDLE
-        self.window.statusBar().showMessage("Bereit")
+        self._status_bar.showMessage("Bereit")
+        # Der Test hat Dateien angelegt oder geändert
+        self._fs_cache.clear()
         self._update_delete_button()
 
-    def _update_delete_button(self):
-        """Aktualisiert Delete-Button basierend auf vorhandenen Dateien."""
-        config = self.window.config_widget.get_config()
-        target_path = config.get('target_path', '')
-
-        if target_path and os.path.exists(target_path):
-            file_manager = FileManager(target_path, 1.0)
-            has_files = file_manager.count_existing_files() > 0
-            self.window.control_widget.enable_delete_button(has_files)
-        else:
-            self.window.control_widget.enable_delete_button(False)
-
-    def _get_timestamp(self) -> str:
-        """Gibt aktuellen Timestamp zurück."""
-        return datetime.now().strftime("%H:%M:%S")
-
-    def _get_user_log_dir(self) -> str:
-        """Gibt das Benutzerverzeichnis für Logs zurück."""
-        # Benutze das Dokumente-Verzeichnis oder Home-Verzeichnis
-        home = Path.home()
-        log_dir = home / "DiskTest_Logs"
-        # Verzeichnis erstellen falls nicht vorhanden
-        log_dir.mkdir(parents=True, exist_ok=True)
-        return str(log_dir)
-
-    def _calculate_test_progress(self, current_bytes: float, total_bytes: float) -> int:
+    def _update_delete_button(self, target_path: Optional[str] = None):
         """
-        Berechnet Test-Fortschritt über alle Muster.
-
-        Formel: (completed_patterns * 2 + current_phase) / (total_patterns * 2) * 100
+        Aktualisiert Delete-Button basierend auf vorhandenen Dateien.
 
         Args:
-            current_bytes: Bereits verarbeitete Bytes
-            total_bytes: Gesamtbytes des Tests
-
-        Returns:
-            Fortschritt in Prozent (0-100)
+            target_path: Zielpfad, falls der Aufrufer ihn schon kennt;
+                         sonst wird er aus der Konfiguration gelesen
         """
-        if not self.engine or not self.engine.session:
-            return 0
-
-        session = self.engine.session
-
-        # Anzahl ausgewählter Patterns
-        total_patterns = len(session.selected_patterns) if session.selected_patterns else 5
-
-        # Anzahl abgeschlossener Patterns (beide Phasen komplett)
-        completed_patterns = len(session.completed_patterns) if session.completed_patterns else 0
-
-        # Aktuelles Pattern: Wie viele Phasen sind abgeschlossen?
-        # - Wenn Phase "write": 0 Phasen abgeschlossen
-        # - Wenn Phase "verify": 1 Phase abgeschlossen (write ist fertig)
-        current_phase_value = 1 if session.current_phase == "verify" else 0
-
-        # Bytes pro Datei
-        file_size_bytes = session.file_size_gb * 1024 * 1024 * 1024
-        bytes_per_file = int(file_size_bytes)
-
-        # Fortschritt in der aktuellen Phase (0.0 - 1.0)
-        bytes_per_phase = session.file_count * bytes_per_file
-        current_file_bytes = session.current_file_index * bytes_per_file
-        current_chunk_bytes = session.current_chunk_index * self.engine.CHUNK_SIZE
-        phase_bytes = current_file_bytes + current_chunk_bytes
-        phase_progress = min(1.0, phase_bytes / bytes_per_phase) if bytes_per_phase > 0 else 0.0
-
-        # Gesamtfortschritt berechnen
-        # completed_patterns sind komplett (2 Phasen je Pattern)
-        # Aktuelles Pattern: current_phase_value Phasen + Fortschritt in aktueller Phase
-        total_phases = total_patterns * 2  # Jedes Pattern hat 2 Phasen (write + verify)
-        completed_phases = (completed_patterns * 2) + current_phase_value + phase_progress
+        if target_path is None:
+            target_path = self._config_widget.get_config().get('target_path', '')
 
-        percent = int((completed_phases / total_phases) * 100) if total_phases > 0 else 0
-        return min(100, max(0, percent))
+        file_count = self._get_test_file_count(target_path) if target_path else None
+        self._last_delete_has_files = bool(file_count)
+        self._control_widget.enable_delete_button(self._last_delete_has_files)
+        self._last_delete_path = target_path
+        self._watch_target_dir(target_path if file_count is not None else None)
 
-    def _calculate_all_files_progress(self, current_bytes: float, total_bytes: float) -> int:
+    def _watch_target_dir(self, path: Optional[str]):
         """
-        Berechnet Fortschritt aller Dateien in der aktuellen Phase.
+        Überwacht nur noch path (None: keinen Ordner).
 
         Args:
-            current_bytes: Bereits verarbeitete Bytes (gesamt)
-            total_bytes: Gesamtbytes des Tests
-
-        Returns:
-            Fortschritt in Prozent (0-100)
+            path: Existierender Zielordner oder None
         """
-        if not self.engine or not self.engine.session:
-            return 0
-
-        session = self.engine.session
-
-        # Bytes pro Datei
-        file_size_bytes = session.file_size_gb * 1024 * 1024 * 1024
-        bytes_per_file = int(file_size_bytes)
-
-        # Fortschritt in der aktuellen Phase
-        bytes_per_phase = session.file_count * bytes_per_file
-        current_file_bytes = session.current_file_index * bytes_per_file
-        current_chunk_bytes = session.current_chunk_index * self.engine.CHUNK_SIZE
-        phase_bytes = current_file_bytes + current_chunk_bytes
+        watched = self._dir_watcher.directories()
+        if watched == ([path] if path else []):
+            return
+        if watched:
+            self._dir_watcher.removePaths(watched)
+        if path:
+            self._dir_watcher.addPath(path)
 
-        percent = int((phase_bytes / bytes_per_phase) * 100) if bytes_per_phase > 0 else 0
-        return min(100, max(0, percent))
+    @Slot()
+    def _on_target_dir_changed(self):
+        """Inhalt des Zielordners hat sich geändert (entprellt)."""
+        # Während eines Tests ändert die Engine den Ordner selbst;
+        # _reset_gui aktualisiert den Button danach ohnehin
+        if self.current_state != TestState.IDLE:
+            return
+        path = self._last_delete_path
+        if path:
+            self._fs_cache.pop(path, None)
+            self._update_delete_button(path)
 
-    def _calculate_time_remaining(self, test_percent: int, speed_mbps: float) -> float:
+    def _get_test_file_count(self, path: str, revalidate: bool = False) -> Optional[int]:
         """
-        Berechnet geschätzte Restzeit basierend auf Test-Fortschritt und aktueller Geschwindigkeit.
+        Anzahl vorhandener Testdateien, gecacht pro Pfad.
+
+        Innerhalb der TTL wird der gespeicherte Wert ohne Dateisystemzugriff
+        zurückgegeben, z.B. wenn Pfadänderung und Reset kurz hintereinander
+        den Delete-Button aktualisieren. Danach genügt ein os.stat: Hat sich
+        die mtime des Ordners nicht geändert, wurden keine Dateien angelegt
+        oder gelöscht und der Verzeichnis-Scan entfällt. Einer mtime, die
+        jünger als die Dateisystem-Auflösung ist, wird nicht vertraut, da
+        weitere Änderungen im selben Zeitfenster sie nicht mehr verschieben.
 
         Args:
-            test_percent: Aktueller Test-Fortschritt (0-100)
-            speed_mbps: Aktuelle Geschwindigkeit in MB/s
+            path: Zielordner
+            revalidate: True zählt immer neu (vor Teststart)
 
         Returns:
-            Geschätzte Restzeit in Sekunden
+            Anzahl Testdateien oder None wenn der Pfad nicht existiert
         """
-        if not self.engine or not self.engine.session or test_percent >= 100:
-            return 0.0
+        now = time.monotonic()
+        cached = self._fs_cache.get(path)
+        if (not revalidate and cached is not None
+                and now - cached[0] < self.FS_CACHE_TTL_SECONDS):
+            return cached[2]
 
-        session = self.engine.session
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISDIR(st.st_mode):
+            self._fs_cache.pop(path, None)
+            return None
+
+        mtime_ns = st.st_mtime_ns
+        if (not revalidate and cached is not None and cached[1] == mtime_ns
+                and time.time_ns() - mtime_ns > self.FS_MTIME_RESOLUTION_NS):
+            self._fs_cache[path] = (now, mtime_ns, cached[2])
+            return cached[2]
+
+        count = self._get_file_manager(path).count_existing_files()
+        self._fs_cache[path] = (now, mtime_ns, count)
+        return count
+
+    def _get_file_manager(self, path: str) -> FileManager:
+        """
+        Gibt den FileManager für path zurück und erstellt ihn beim ersten Bedarf.
 
-        # Gesamtvolumen berechnen: Alle Dateien × Alle Muster × 2 Phasen
-        total_patterns = len(session.selected_patterns) if session.selected_patterns else 5
-        file_size_bytes = session.file_size_gb * 1024 * 1024 * 1024
-        bytes_per_pattern = session.file_count * int(file_size_bytes) * 2  # Write + Verify
+        Es wird nur der FileManager des zuletzt genutzten Pfads behalten.
 
-        total_test_bytes = total_patterns * bytes_per_pattern
+        Raises:
+            ValueError: Wenn der Pfad nicht existiert oder kein Verzeichnis ist
+        """
+        file_manager = self._file_managers.get(path)
+        if file_manager is None:
+            file_manager = FileManager(path, 1.0)
+            self._file_managers = {path: file_manager}
+        return file_manager
 
-        # Bereits verarbeitete Bytes basierend auf Test-Prozent
-        processed_bytes = (test_percent / 100.0) * total_test_bytes
+    def _get_session_manager(self, path: str) -> SessionManager:
+        """
+        Gibt den SessionManager für path zurück und erstellt ihn beim ersten Bedarf.
 
-        # Verbleibende Bytes
-        remaining_bytes = total_test_bytes - processed_bytes
-        remaining_mb = remaining_bytes / (1024 * 1024)
+        Es wird nur der SessionManager des zuletzt genutzten Pfads behalten.
+        """
+        session_manager = self._session_managers.get(path)
+        if session_manager is None:
+            session_manager = SessionManager(path)
+            self._session_managers = {path: session_manager}
+        return session_manager
 
-        # Restzeit = Verbleibende MB / Geschwindigkeit
-        remaining_seconds = remaining_mb / speed_mbps if speed_mbps > 0 else 0.0
+    def _get_timestamp(self) -> str:
+        """Gibt aktuellen Timestamp zurück (HH:MM:SS, pro Sekunde nur einmal formatiert)."""
+        t = int(time.time())
+        if t != self._ts_sec:
+            self._ts_sec = t
+            lt = time.localtime(t)
+            self._ts_str = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+        return self._ts_str
 
-        return max(0.0, remaining_seconds)
+    def _get_user_log_dir(self) -> str:
+        """Gibt das Benutzerverzeichnis für Logs zurück."""
+        # Benutze das Dokumente-Verzeichnis oder Home-Verzeichnis
+        home = Path.home()
+        log_dir = home / "DiskTest_Logs"
+        # Verzeichnis erstellen falls nicht vorhanden
+        log_dir.mkdir(parents=True, exist_ok=True)
+        return str(log_dir)
 
     def _format_time_remaining(self, seconds: float) -> str:
         """Formatiert Restzeit."""
@@ -859,10 +1019,5 @@ class TestController(QObject):
         if s < 60:
             return f"{s}s"
 
-        h = s // 3600
-        m = (s % 3600) // 60
-
-        if h > 0:
-            return f"{h}h {m}m"
-        else:
-            return f"{m}m"
+        h, m = divmod(s // 60, 60)
+        return f"{h}h {m}m" if h else f"{m}m"
@@ -1,15 +1,183 @@
 """Dialoge für DiskTest GUI."""
 
+import functools
 import os
+import queue
+import time
+from dataclasses import dataclass
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QDialogButtonBox, QMessageBox, QWidget, QScrollArea, QCheckBox,
-    QProgressBar, QComboBox, QFileDialog
+    QProgressBar, QComboBox, QFileDialog, QListView, QStyledItemDelegate
 )
-from PySide6.QtCore import Qt, QThread, Signal
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import (
+    Qt, QThread, QTimer, Signal, QAbstractListModel, QModelIndex, QRect, QSize,
+    QObject, QRunnable, QThreadPool, QCoreApplication
+)
+from PySide6.QtGui import QIcon, QColor, QFont, QFontMetrics, QPainter, QPalette
+
+from core.platform import get_drive_prober, get_disk_space_reader, BYTES_PER_GB
+from .styles import get_dialog_detail_style, get_theme_tokens, is_dark_mode
+
+# Häufig genutzte Qt-Enums einmalig binden
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_ACCEPT_ROLE = QDialogButtonBox.ButtonRole.AcceptRole
+_REJECT_ROLE = QDialogButtonBox.ButtonRole.RejectRole
+_CHECKED = Qt.CheckState.Checked.value
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_USER_ROLE = Qt.ItemDataRole.UserRole
+
+
+def _build_dialog_stylesheet(dark: bool) -> str:
+    """
+    Erstellt das gemeinsame Dialog-Stylesheet.
+
+    Die Widgets werden über objectName angesprochen, damit pro Dialog nur
+    ein einziges setStyleSheet() nötig ist statt eines Aufrufs je Widget.
+    """
+    tokens = get_theme_tokens(dark)
+    info_color = tokens['dialog_info']
+    warning_color = tokens['dialog_warning']
+    destructive_color = tokens['dialog_destructive']
+    border_color = tokens['border']
+    # Detail-Panel: Hintergrund/Abstände gelten wie bisher auch für die Labels darin
+    detail_style = get_dialog_detail_style(dark)
+    return f"""
+        QWidget#detailPanel, QWidget#detailPanel QLabel {{
+            {detail_style}
+        }}
+
+        QLabel#hintLabel {{
+            font-style: italic;
+            opacity: 0.7;
+        }}
+
+        QLabel#secondaryLabel {{
+            font-size: 9pt;
+            opacity: 0.7;
+        }}
+
+        QLabel#infoIcon {{
+            font-size: 32px;
+            color: {info_color};
+        }}
+
+        QLabel#warningIcon {{
+            font-size: 32px;
+            color: {warning_color};
+        }}
+
+        QLabel#boldLabel {{
+            font-weight: bold;
+        }}
+
+        QLabel#questionLabel {{
+            font-weight: bold;
+            margin-top: 10px;
+        }}
+
+        QLabel#dialogHeader {{
+            font-size: 14px;
+            font-weight: bold;
+            margin-bottom: 10px;
+        }}
+
+        QPushButton#destructiveButton {{
+            color: {destructive_color};
+            font-weight: bold;
+        }}
+
+        QListView#errorList {{
+            border: 1px solid {border_color};
+            border-radius: 5px;
+        }}
+    """
+
+
+# Gemeinsames Dialog-Stylesheet für Dark (True) und Light Mode (False),
+# beide Varianten werden einmalig beim Import erstellt
+DIALOG_STYLESHEETS = {
+    True: _build_dialog_stylesheet(True),
+    False: _build_dialog_stylesheet(False),
+}
+
+
+# Speicherplatz-Abfrage der Plattform, einmalig beim Import gewählt
+_get_disk_space = get_disk_space_reader()
+
+# Gültigkeitsdauer gecachter os.path.exists-Ergebnisse in Sekunden
+_PATH_EXISTS_TTL_SECONDS = 2
 
-from .styles import AppStyles, is_dark_mode
+
+@functools.lru_cache(maxsize=64)
+def _path_exists_in_slot(path: str, time_slot: int) -> bool:
+    """os.path.exists, gecacht pro (Pfad, Zeitfenster)."""
+    return os.path.exists(path)
+
+
+def _path_exists_cached(path: str) -> bool:
+    """
+    Prüft ob ein Pfad existiert; Ergebnisse gelten ca. 2 Sekunden.
+
+    Über das Zeitfenster im Cache-Schlüssel verfallen alte Einträge von
+    selbst, ohne dass ein Timer nötig ist.
+    """
+    return _path_exists_in_slot(path, int(time.monotonic() // _PATH_EXISTS_TTL_SECONDS))
+
+
+class _DriveProbeWorker(QThread):
+    """
+    Hintergrund-Thread für blockierende Laufwerks-Abfragen.
+
+    Ermittelt einmalig alle Laufwerke samt Speicherplatz und beantwortet danach
+    Speicherplatz-Anfragen aus einer Queue. Es gibt genau einen Thread pro
+    Dialog; veraltete Anfragen werden verworfen, nur die neueste zählt.
+    """
+
+    drives_ready = Signal(dict)  # Laufwerks-Wurzel -> DriveInfo
+    space_ready = Signal(str, float, float)  # path, free_gb, total_gb
+    space_failed = Signal(str, str)  # path, Anzeigetext
+
+    def __init__(self, probe_drives, parent=None):
+        """
+        Args:
+            probe_drives: Callable die das Laufwerks-Dict liefert
+        """
+        super().__init__(parent)
+        self._probe_drives = probe_drives
+        self._requests = queue.Queue()
+
+    def request_free_space(self, path: str):
+        """Stellt eine Speicherplatz-Anfrage in die Queue (thread-sicher)."""
+        self._requests.put(path)
+
+    def stop(self):
+        """Beendet den Thread nach der aktuellen Anfrage (thread-sicher)."""
+        self._requests.put(None)
+
+    def run(self):
+        """Hauptschleife - läuft im Worker-Thread."""
+        self.drives_ready.emit(self._probe_drives())
+
+        while True:
+            path = self._requests.get()
+
+            # Nur die neueste Anfrage bearbeiten
+            while path is not None and not self._requests.empty():
+                path = self._requests.get_nowait()
+
+            if path is None:
+                return
+
+            if not _path_exists_cached(path):
+                self.space_failed.emit(path, "Freier Speicher: --")
+                continue
+
+            try:
+                free_bytes, total_bytes = _get_disk_space(path)
+                self.space_ready.emit(path, free_bytes / BYTES_PER_GB, total_bytes / BYTES_PER_GB)
+            except Exception:
+                self.space_failed.emit(path, "Freier Speicher: Fehler beim Abrufen")
 
 
 class DriveSelectionDialog(QDialog):
@@ -22,17 +190,40 @@ class DriveSelectionDialog(QDialog):
     RESULT_SELECTED = 1
     RESULT_CANCEL = 0
 
+    # Laufwerksliste wird zwischen Dialog-Aufrufen wiederverwendet
+    DRIVE_CACHE_TTL_SECONDS = 5.0
+    _drive_cache = None
+    _drive_cache_time = 0.0
+
+    # Speicherplatz pro Laufwerks-Wurzel kurz cachen
+    DISK_USAGE_CACHE_TTL_SECONDS = 2.0
+    # Wartezeit nach Auswahländerung bevor abgefragt wird
+    FREE_SPACE_DEBOUNCE_MS = 150
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.selected_path = None
+        # Ergebnis der Laufwerks-Abfrage (Laufwerks-Wurzel -> DriveInfo)
+        self._drive_info: dict = {}
+        # Benutzerdefinierte Pfade: Laufwerks-Wurzel -> (Zeitstempel, free_gb, total_gb)
+        self._disk_usage_cache: dict[str, tuple[float, float, float]] = {}
         self._setup_ui()
-        self._populate_drives()
+
+        # Laufwerke und Speicherplatz im Hintergrund ermitteln
+        queued = Qt.ConnectionType.QueuedConnection
+        self._probe_worker = _DriveProbeWorker(self._probe_drives, self)
+        self._probe_worker.drives_ready.connect(self._populate_drives, queued)
+        self._probe_worker.space_ready.connect(self._on_space_ready, queued)
+        self._probe_worker.space_failed.connect(self._on_space_failed, queued)
+        self._probe_worker.start()
+        self._probe_detached = False
 
     def _setup_ui(self):
         """Erstellt die Benutzeroberfläche."""
         self.setWindowTitle("Laufwerk auswählen")
         self.setModal(True)
         self.setMinimumWidth(450)
+        self.setStyleSheet(DIALOG_STYLESHEETS[is_dark_mode()])
 
         # Window-Flags für Vordergrund-Anzeige (wichtig beim Start vor Hauptfenster)
         self.setWindowFlags(
@@ -57,6 +248,7 @@ class DriveSelectionDialog(QDialog):
 
         self.drive_combo = QComboBox()
         self.drive_combo.setMinimumWidth(200)
+        self.drive_combo.setPlaceholderText("Suche Laufwerke...")
         drive_layout.addWidget(self.drive_combo, 1)
 
         self.browse_button = QPushButton("Durchsuchen...")
@@ -68,11 +260,17 @@ class DriveSelectionDialog(QDialog):
         # Freier Speicher Anzeige
         self.free_space_label = QLabel("Freier Speicher: --")
         # Farbe passt sich automatisch an Dark/Light Mode an
-        self.free_space_label.setStyleSheet("font-style: italic; opacity: 0.7;")
+        self.free_space_label.setObjectName("hintLabel")
         layout.addWidget(self.free_space_label)
 
-        # Verbinde Combo-Box Signal
-        self.drive_combo.currentTextChanged.connect(self._update_free_space)
+        # Verbinde Combo-Box Signal (entprellt, schnelle Wechsel ergeben eine Abfrage)
+        self._free_space_timer = QTimer(self)
+        self._free_space_timer.setSingleShot(True)
+        self._free_space_timer.setInterval(self.FREE_SPACE_DEBOUNCE_MS)
+        self._free_space_timer.timeout.connect(
+            lambda: self._update_free_space(self.drive_combo.currentText())
+        )
+        self.drive_combo.currentTextChanged.connect(self._free_space_timer.start)
 
         # Buttons
         button_layout = QHBoxLayout()
@@ -91,43 +289,93 @@ class DriveSelectionDialog(QDialog):
 
         layout.addLayout(button_layout)
 
-    def _populate_drives(self):
-        """Füllt die ComboBox mit verfügbaren Laufwerken."""
-        # Windows: Prüfe Laufwerke A-Z
-        available_drives = []
-        for letter in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
-            drive_path = f"{letter}:\\"
-            if os.path.exists(drive_path):
-                try:
-                    # Prüfe ob Laufwerk zugreifbar ist
-                    os.listdir(drive_path)
-                    available_drives.append(drive_path)
-                except (PermissionError, OSError):
-                    # Laufwerk nicht zugreifbar (z.B. leeres CD-Laufwerk)
-                    pass
+    def _populate_drives(self, drive_info: dict):
+        """Füllt die ComboBox mit verfügbaren Laufwerken (vom Worker)."""
+        self._drive_info = drive_info
+        available_drives = list(drive_info)
 
+        # Signale während des Befüllens blockieren, danach genau eine Abfrage
+        self.drive_combo.blockSignals(True)
         self.drive_combo.addItems(available_drives)
+        # Noch nichts ausgewählt (Platzhalter aktiv): erstes Laufwerk wählen
+        if available_drives and self.drive_combo.currentIndex() < 0:
+            self.drive_combo.setCurrentIndex(0)
+        self.drive_combo.blockSignals(False)
+
+        if self.drive_combo.currentIndex() >= 0:
+            self._free_space_timer.stop()
+            self._update_free_space(self.drive_combo.currentText())
 
-        # Wenn Laufwerke gefunden wurden, zeige Speicherinfo für erstes
-        if available_drives:
-            self._update_free_space(available_drives[0])
+    @classmethod
+    def _probe_drives(cls) -> dict:
+        """
+        Gibt die zugreifbaren Laufwerke samt Speicherplatz zurück.
+
+        Das Ergebnis wird für DRIVE_CACHE_TTL_SECONDS auf Klassenebene
+        gecacht, damit erneutes Öffnen des Dialogs die Laufwerke nicht
+        wieder abfragt.
+        """
+        now = time.monotonic()
+        if (cls._drive_cache is None or
+                now - cls._drive_cache_time > cls.DRIVE_CACHE_TTL_SECONDS):
+            cls._drive_cache = get_drive_prober()()
+            cls._drive_cache_time = now
+        return dict(cls._drive_cache)
+
+    @classmethod
+    def invalidate_drive_cache(cls):
+        """Verwirft die gecachte Laufwerksliste."""
+        cls._drive_cache = None
 
     def _update_free_space(self, path: str):
-        """Aktualisiert die Anzeige des freien Speichers."""
-        if not path or not os.path.exists(path):
+        """Aktualisiert die Anzeige des freien Speichers (asynchron)."""
+        if not path:
             self.free_space_label.setText("Freier Speicher: --")
             return
 
-        try:
-            import shutil
-            stat = shutil.disk_usage(path)
-            free_gb = stat.free / (1024 ** 3)
-            total_gb = stat.total / (1024 ** 3)
-            self.free_space_label.setText(
-                f"Freier Speicher: {free_gb:.1f} GB von {total_gb:.1f} GB"
-            )
-        except Exception:
-            self.free_space_label.setText("Freier Speicher: Fehler beim Abrufen")
+        root = self._drive_root(path)
+
+        # Laufwerke aus der Abfrage: Werte liegen bereits vor
+        info = self._drive_info.get(root)
+        if info is not None:
+            self._show_free_space(info.free_bytes / BYTES_PER_GB, info.total_bytes / BYTES_PER_GB)
+            return
+
+        # Gecachten Wert verwenden solange er frisch ist
+        cached = self._disk_usage_cache.get(root)
+        if cached and time.monotonic() - cached[0] < self.DISK_USAGE_CACHE_TTL_SECONDS:
+            self._show_free_space(cached[1], cached[2])
+            return
+
+        self.free_space_label.setText("Freier Speicher: wird ermittelt...")
+        self._probe_worker.request_free_space(path)
+
+    @staticmethod
+    def _drive_root(path: str) -> str:
+        """Gibt die Laufwerks-Wurzel als Cache-Schlüssel zurück (z.B. 'D:\\')."""
+        drive = os.path.splitdrive(path)[0]
+        return drive + '\\' if drive else path
+
+    def _show_free_space(self, free_gb: float, total_gb: float):
+        """Setzt den Text der Speicherplatz-Anzeige."""
+        self.free_space_label.setText(
+            f"Freier Speicher: {free_gb:.1f} GB von {total_gb:.1f} GB"
+        )
+
+    def _on_space_ready(self, path: str, free_gb: float, total_gb: float):
+        """Speicherplatz-Ergebnis vom Worker anzeigen."""
+        self._disk_usage_cache[self._drive_root(path)] = (time.monotonic(), free_gb, total_gb)
+
+        # Ergebnisse für inzwischen abgewählte Pfade ignorieren
+        if path != self.drive_combo.currentText():
+            return
+        self._show_free_space(free_gb, total_gb)
+
+    def _on_space_failed(self, path: str, text: str):
+        """Fehlgeschlagene Speicherplatz-Abfrage anzeigen."""
+        if path != self.drive_combo.currentText():
+            return
+        self.free_space_label.setText(text)
 
     def _browse_path(self):
         """Öffnet Datei-Dialog zur manuellen Ordnerauswahl."""
@@ -141,21 +389,30 @@ class DriveSelectionDialog(QDialog):
         )
 
         if directory:
-            # Setze benutzerdefinierten Pfad
+            # Frisch gewählter Ordner: keine veralteten Existenz-Ergebnisse nutzen
+            _path_exists_in_slot.cache_clear()
+
+            # Setze benutzerdefinierten Pfad (ohne Signale, Abfrage folgt einmalig)
+            self.drive_combo.blockSignals(True)
             # Prüfe ob Pfad bereits in ComboBox ist
             index = self.drive_combo.findText(directory)
             if index >= 0:
                 self.drive_combo.setCurrentIndex(index)
             else:
                 # Füge benutzerdefinierten Pfad hinzu
+                self.invalidate_drive_cache()
                 self.drive_combo.addItem(directory)
                 self.drive_combo.setCurrentIndex(self.drive_combo.count() - 1)
+            self.drive_combo.blockSignals(False)
+
+            self._free_space_timer.stop()
+            self._update_free_space(directory)
 
     def _on_ok_clicked(self):
         """OK-Button wurde geklickt."""
         self.selected_path = self.drive_combo.currentText()
 
-        if not self.selected_path or not os.path.exists(self.selected_path):
+        if not self.selected_path or not self._is_valid_path(self.selected_path):
             QMessageBox.warning(
                 self,
                 "Ungültiger Pfad",
@@ -165,10 +422,43 @@ class DriveSelectionDialog(QDialog):
 
         self.done(self.RESULT_SELECTED)
 
+    def _is_valid_path(self, path: str) -> bool:
+        """
+        Prüft ob der gewählte Pfad existiert.
+
+        Laufwerke aus der Laufwerks-Abfrage sind bereits geprüft. Nur
+        benutzerdefinierte Pfade werden (kurzzeitig gecacht) geprüft.
+        """
+        return path in self._drive_info or _path_exists_cached(path)
+
     def get_selected_path(self) -> str:
         """Gibt den ausgewählten Pfad zurück."""
         return self.selected_path
 
+    def done(self, result: int):
+        """
+        Löst den Worker-Thread vom Dialog, ohne auf ihn zu warten.
+
+        Eine laufende Abfrage (z.B. langsames Netzlaufwerk) würde sonst den
+        GUI-Thread blockieren. Der Thread beendet sich nach der aktuellen
+        Abfrage selbst und gibt sich danach frei. Bis dahin gehört er der
+        Anwendung, damit er nicht mit dem Dialog zerstört wird.
+        """
+        self._free_space_timer.stop()
+        worker = self._probe_worker
+        if not self._probe_detached:
+            self._probe_detached = True
+            worker.drives_ready.disconnect(self._populate_drives)
+            worker.space_ready.disconnect(self._on_space_ready)
+            worker.space_failed.disconnect(self._on_space_failed)
+            worker.stop()
+            worker.setParent(QCoreApplication.instance())
+            worker.finished.connect(worker.deleteLater)
+            # Schon beendet: finished kommt nicht mehr (doppeltes deleteLater ist harmlos)
+            if worker.isFinished():
+                worker.deleteLater()
+        super().done(result)
+
 
 class SessionRestoreDialog(QDialog):
     """
@@ -192,17 +482,35 @@ class SessionRestoreDialog(QDialog):
                 - progress: Fortschritt in Prozent
                 - pattern_index: Aktuelles Muster (0-4)
                 - pattern_name: Name des Musters (z.B. '0xFF')
+                - pattern_total: Anzahl ausgewählter Muster (Standard: 5)
                 - error_count: Anzahl Fehler
         """
         super().__init__(parent)
         self.session_info = session_info
+        # Anzeige-Texte einmalig aufbereiten
+        self._detail_rows = self._build_detail_rows(session_info)
         self._setup_ui()
 
+    @staticmethod
+    def _build_detail_rows(session_info: dict) -> list:
+        """Bereitet die Detail-Zeilen (Label, Wert) aus session_info auf."""
+        pattern_idx = session_info.get('pattern_index', 0)
+        pattern_total = session_info.get('pattern_total', 5)
+        pattern_name = session_info.get('pattern_name', '--')
+        return [
+            ("Zielpfad:", session_info.get('target_path', '--')),
+            ("Fortschritt:", f"{session_info.get('progress', 0)}%"),
+            ("Muster:", f"{pattern_idx + 1}/{pattern_total} ({pattern_name})"),
+            ("Fehler:", str(session_info.get('error_count', 0))),
+        ]
+
     def _setup_ui(self):
         """Erstellt die Benutzeroberfläche."""
         self.setWindowTitle("Vorherige Session gefunden")
         self.setModal(True)
         self.setMinimumWidth(450)
+        # Farben passen sich an Dark/Light Mode an
+        self.setStyleSheet(DIALOG_STYLESHEETS[is_dark_mode()])
 
         layout = QVBoxLayout(self)
         layout.setSpacing(20)
@@ -211,9 +519,7 @@ class SessionRestoreDialog(QDialog):
         header_layout = QHBoxLayout()
 
         icon_label = QLabel("ℹ")
-        # Farbe passt sich an Dark/Light Mode an
-        icon_color = "#1565c0" if is_dark_mode() else "#0078d4"
-        icon_label.setStyleSheet(f"font-size: 32px; color: {icon_color};")
+        icon_label.setObjectName("infoIcon")
         header_layout.addWidget(icon_label)
 
         info_text = QLabel("Eine vorherige Test-Session wurde gefunden.")
@@ -228,8 +534,8 @@ class SessionRestoreDialog(QDialog):
 
         # Frage
         question = QLabel("Möchten Sie den Test fortsetzen?")
-        question.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        question.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        question.setAlignment(_ALIGN_CENTER)
+        question.setObjectName("questionLabel")
         layout.addWidget(question)
 
         # Buttons
@@ -257,42 +563,13 @@ class SessionRestoreDialog(QDialog):
     def _create_details_widget(self) -> QWidget:
         """Erstellt das Widget mit Session-Details."""
         widget = QWidget()
-        widget.setStyleSheet(AppStyles.get_dialog_detail_style())
+        widget.setObjectName("detailPanel")
 
         layout = QVBoxLayout(widget)
         layout.setSpacing(8)
 
-        # Zielpfad
-        path_layout = self._create_detail_row(
-            "Zielpfad:",
-            self.session_info.get('target_path', '--')
-        )
-        layout.addLayout(path_layout)
-
-        # Fortschritt
-        progress = self.session_info.get('progress', 0)
-        progress_layout = self._create_detail_row(
-            "Fortschritt:",
-            f"{progress}%"
-        )
-        layout.addLayout(progress_layout)
-
-        # Muster
-        pattern_idx = self.session_info.get('pattern_index', 0)
-        pattern_name = self.session_info.get('pattern_name', '--')
-        muster_layout = self._create_detail_row(
-            "Muster:",
-            f"{pattern_idx + 1}/5 ({pattern_name})"
-        )
-        layout.addLayout(muster_layout)
-
-        # Fehler
-        errors = self.session_info.get('error_count', 0)
-        error_layout = self._create_detail_row(
-            "Fehler:",
-            str(errors)
-        )
-        layout.addLayout(error_layout)
+        for label_text, value_text in self._detail_rows:
+            layout.addLayout(self._create_detail_row(label_text, value_text))
 
         return widget
 
@@ -302,7 +579,7 @@ class SessionRestoreDialog(QDialog):
 
         label = QLabel(label_text)
         label.setMinimumWidth(100)
-        label.setStyleSheet("font-weight: bold;")
+        label.setObjectName("boldLabel")
         row_layout.addWidget(label)
 
         value = QLabel(value_text)
@@ -311,31 +588,33 @@ class SessionRestoreDialog(QDialog):
         return row_layout
 
 
-class DeleteFilesDialog(QDialog):
+class _WarningConfirmDialogBase(QDialog):
     """
-    Dialog zur Bestätigung der Testdatei-Löschung.
+    Gemeinsame Basis für Warn-Bestätigungsdialoge.
 
-    Zeigt Informationen über zu löschende Dateien und fordert Bestätigung.
+    Baut Warn-Kopfzeile, Detail-Panel und die beiden Buttons genau einmal
+    auf. Unterklassen liefern nur Texte und füllen das Detail-Panel; sie
+    können über reset() mit neuen Werten erneut per exec() geöffnet werden,
+    ohne den Widget-Baum neu aufzubauen.
     """
 
-    def __init__(self, target_path: str, file_count: int, total_size_gb: float, parent=None):
-        """
-        Args:
-            target_path: Pfad wo Dateien liegen
-            file_count: Anzahl der Testdateien
-            total_size_gb: Gesamtgröße in GB
-        """
+    WINDOW_TITLE = ""
+    QUESTION_TEXT = ""
+    ACCEPT_TEXT = ""
+    DETAILS_SPACING = None
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.target_path = target_path
-        self.file_count = file_count
-        self.total_size_gb = total_size_gb
+        # Zuletzt gesetztes Stylesheet (Vergleich per Identität, siehe _apply_theme)
+        self._applied_sheet = None
         self._setup_ui()
 
     def _setup_ui(self):
         """Erstellt die Benutzeroberfläche."""
-        self.setWindowTitle("Testdateien löschen")
+        self.setWindowTitle(self.WINDOW_TITLE)
         self.setModal(True)
         self.setMinimumWidth(400)
+        self._apply_theme()
 
         layout = QVBoxLayout(self)
         layout.setSpacing(20)
@@ -344,46 +623,34 @@ class DeleteFilesDialog(QDialog):
         warning_layout = QHBoxLayout()
 
         warning_icon = QLabel("⚠")
-        warning_color = "#ffa726" if is_dark_mode() else "#ffc107"
-        warning_icon.setStyleSheet(f"font-size: 32px; color: {warning_color};")
+        warning_icon.setObjectName("warningIcon")
         warning_layout.addWidget(warning_icon)
 
-        warning_text = QLabel("Möchten Sie alle Testdateien löschen?")
+        warning_text = QLabel(self.QUESTION_TEXT)
         warning_text.setWordWrap(True)
-        warning_text.setStyleSheet("font-weight: bold;")
+        warning_text.setObjectName("boldLabel")
         warning_layout.addWidget(warning_text, 1)
 
         layout.addLayout(warning_layout)
 
         # Details
         details_widget = QWidget()
-        details_widget.setStyleSheet(AppStyles.get_dialog_detail_style())
+        details_widget.setObjectName("detailPanel")
 
         details_layout = QVBoxLayout(details_widget)
-        details_layout.setSpacing(8)
-
-        # Pfad
-        path_layout = self._create_detail_row("Pfad:", self.target_path)
-        details_layout.addLayout(path_layout)
-
-        # Anzahl
-        count_layout = self._create_detail_row("Anzahl:", f"{self.file_count} Dateien")
-        details_layout.addLayout(count_layout)
-
-        # Größe
-        size_layout = self._create_detail_row("Größe:", f"{self.total_size_gb:.1f} GB")
-        details_layout.addLayout(size_layout)
+        if self.DETAILS_SPACING is not None:
+            details_layout.setSpacing(self.DETAILS_SPACING)
+        self._build_details(details_layout)
 
         layout.addWidget(details_widget)
 
         # Buttons
         button_box = QDialogButtonBox()
 
-        delete_button = button_box.addButton("Löschen", QDialogButtonBox.ButtonRole.AcceptRole)
-        delete_color = "#ef5350" if is_dark_mode() else "#d32f2f"
-        delete_button.setStyleSheet(f"color: {delete_color}; font-weight: bold;")
+        accept_button = button_box.addButton(self.ACCEPT_TEXT, _ACCEPT_ROLE)
+        accept_button.setObjectName("destructiveButton")
 
-        cancel_button = button_box.addButton("Abbrechen", QDialogButtonBox.ButtonRole.RejectRole)
+        cancel_button = button_box.addButton("Abbrechen", _REJECT_ROLE)
         cancel_button.setDefault(True)
 
         button_box.accepted.connect(self.accept)
@@ -391,104 +658,273 @@ class DeleteFilesDialog(QDialog):
 
         layout.addWidget(button_box)
 
-    def _create_detail_row(self, label_text: str, value_text: str) -> QHBoxLayout:
-        """Hilfsfunktion zum Erstellen einer Detail-Zeile."""
+    def _build_details(self, layout: QVBoxLayout):
+        """Füllt das Detail-Panel. Unterklassen überschreiben diesen Hook, ohne bleibt es leer."""
+
+    def _apply_theme(self):
+        """
+        Setzt das Stylesheet des aktuellen Farbschemas.
+
+        Die Dialoge werden wiederverwendet, das Farbschema kann sich
+        zwischen zwei Anzeigen ändern. Neu gesetzt wird nur bei einem
+        Wechsel, sonst würde Qt das gleiche Stylesheet erneut auswerten.
+        """
+        sheet = DIALOG_STYLESHEETS[is_dark_mode()]
+        if sheet is not self._applied_sheet:
+            self._applied_sheet = sheet
+            self.setStyleSheet(sheet)
+
+    def exec(self) -> int:
+        """Zeigt den Dialog modal an, im aktuellen Farbschema."""
+        self._apply_theme()
+        return super().exec()
+
+    def _create_detail_row(self, label_text: str) -> tuple:
+        """
+        Hilfsfunktion zum Erstellen einer Detail-Zeile.
+
+        Returns:
+            Tuple (row_layout, value_label) - der Wert wird später gesetzt
+        """
         row_layout = QHBoxLayout()
 
         label = QLabel(label_text)
         label.setMinimumWidth(80)
-        label.setStyleSheet("font-weight: bold;")
+        label.setObjectName("boldLabel")
         row_layout.addWidget(label)
 
-        value = QLabel(value_text)
+        value = QLabel()
         row_layout.addWidget(value, 1)
 
-        return row_layout
+        return row_layout, value
 
 
-class StopConfirmationDialog(QDialog):
+class DeleteFilesDialog(_WarningConfirmDialogBase):
     """
-    Dialog zur Bestätigung des Test-Abbruchs.
+    Dialog zur Bestätigung der Testdatei-Löschung.
 
-    Warnt den User dass der Fortschritt verloren geht.
+    Zeigt Informationen über zu löschende Dateien und fordert Bestätigung.
     """
 
-    def __init__(self, parent=None):
+    WINDOW_TITLE = "Testdateien löschen"
+    QUESTION_TEXT = "Möchten Sie alle Testdateien löschen?"
+    ACCEPT_TEXT = "Löschen"
+    DETAILS_SPACING = 8
+
+    def __init__(self, target_path: str, file_count: int, total_size_gb: float, parent=None):
+        """
+        Args:
+            target_path: Pfad wo Dateien liegen
+            file_count: Anzahl der Testdateien
+            total_size_gb: Gesamtgröße in GB
+        """
         super().__init__(parent)
-        self._setup_ui()
+        self.reset(target_path, file_count, total_size_gb)
 
-    def _setup_ui(self):
-        """Erstellt die Benutzeroberfläche."""
-        self.setWindowTitle("Test abbrechen")
-        self.setModal(True)
-        self.setMinimumWidth(400)
+    def _build_details(self, layout: QVBoxLayout):
+        """Erstellt die Zeilen für Pfad, Anzahl und Größe."""
+        path_layout, self._path_value = self._create_detail_row("Pfad:")
+        layout.addLayout(path_layout)
 
-        layout = QVBoxLayout(self)
-        layout.setSpacing(20)
+        count_layout, self._count_value = self._create_detail_row("Anzahl:")
+        layout.addLayout(count_layout)
 
-        # Warnung
-        warning_layout = QHBoxLayout()
+        size_layout, self._size_value = self._create_detail_row("Größe:")
+        layout.addLayout(size_layout)
 
-        warning_icon = QLabel("⚠")
-        warning_color = "#ffa726" if is_dark_mode() else "#ffc107"
-        warning_icon.setStyleSheet(f"font-size: 32px; color: {warning_color};")
-        warning_layout.addWidget(warning_icon)
+    def reset(self, target_path: str, file_count: int, total_size_gb: float):
+        """
+        Setzt neue Werte für eine erneute Anzeige per exec().
 
-        warning_text = QLabel("Möchten Sie den Test wirklich abbrechen?")
-        warning_text.setWordWrap(True)
-        warning_text.setStyleSheet("font-weight: bold;")
-        warning_layout.addWidget(warning_text, 1)
+        Args:
+            target_path: Pfad wo Dateien liegen
+            file_count: Anzahl der Testdateien
+            total_size_gb: Gesamtgröße in GB
+        """
+        self.target_path = target_path
+        self.file_count = file_count
+        self.total_size_gb = total_size_gb
 
-        layout.addLayout(warning_layout)
+        self._apply_theme()
+        self._path_value.setText(target_path)
+        self._count_value.setText(f"{file_count} Dateien")
+        self._size_value.setText(f"{total_size_gb:.1f} GB")
 
-        # Info
-        info_widget = QWidget()
-        info_widget.setStyleSheet(AppStyles.get_dialog_detail_style())
 
-        info_layout = QVBoxLayout(info_widget)
+class StopConfirmationDialog(_WarningConfirmDialogBase):
+    """
+    Dialog zur Bestätigung des Test-Abbruchs.
 
+    Warnt den User dass der Fortschritt verloren geht.
+    """
+
+    WINDOW_TITLE = "Test abbrechen"
+    QUESTION_TEXT = "Möchten Sie den Test wirklich abbrechen?"
+    ACCEPT_TEXT = "Test beenden"
+
+    def _build_details(self, layout: QVBoxLayout):
+        """Erstellt die beiden Hinweiszeilen."""
         info1 = QLabel("Der aktuelle Fortschritt geht verloren.")
-        info_layout.addWidget(info1)
+        layout.addWidget(info1)
 
         info2 = QLabel("Die erstellten Testdateien bleiben erhalten.")
-        info_layout.addWidget(info2)
+        layout.addWidget(info2)
+
+
+@dataclass(frozen=True, slots=True)
+class ErrorEntry:
+    """Ein Eintrag für ErrorDetailDialog (bereits für die Anzeige formatiert)"""
+    filename: str   # Dateiname
+    pattern: str    # Muster (z.B. '0xFF')
+    phase: str      # Phase ('Schreiben' oder 'Verifizierung')
+    details: str    # Detaillierte Fehlerbeschreibung
+
+    @classmethod
+    def from_dict(cls, error: dict) -> "ErrorEntry":
+        """Erstellt einen Eintrag aus einem Fehler-Dictionary (altes Format)."""
+        return cls(
+            filename=error.get('filename', 'Unbekannte Datei'),
+            pattern=error.get('pattern', '--'),
+            phase=error.get('phase', '--'),
+            details=error.get('details', 'Keine Details verfügbar'),
+        )
 
-        layout.addWidget(info_widget)
 
-        # Buttons
-        button_box = QDialogButtonBox()
+class ErrorListModel(QAbstractListModel):
+    """
+    Listen-Model für die Fehler-Einträge.
 
-        abort_button = button_box.addButton("Test beenden", QDialogButtonBox.ButtonRole.AcceptRole)
-        abort_color = "#ef5350" if is_dark_mode() else "#d32f2f"
-        abort_button.setStyleSheet(f"color: {abort_color}; font-weight: bold;")
+    Hält nur eine Referenz auf die Fehler-Liste; die Darstellung übernimmt
+    ErrorDelegate für die jeweils sichtbaren Zeilen.
+    """
 
-        cancel_button = button_box.addButton("Abbrechen", QDialogButtonBox.ButtonRole.RejectRole)
-        cancel_button.setDefault(True)
+    def __init__(self, errors: list, parent=None):
+        super().__init__(parent)
+        self._errors = errors
 
-        button_box.accepted.connect(self.accept)
-        button_box.rejected.connect(self.reject)
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Anzahl Fehler (flache Liste, keine Kinder)."""
+        return 0 if parent.isValid() else len(self._errors)
 
-        layout.addWidget(button_box)
+    def data(self, index: QModelIndex, role: int = _DISPLAY_ROLE):
+        """Liefert den ErrorEntry (UserRole) bzw. den Dateinamen."""
+        if not index.isValid():
+            return None
+        error = self._errors[index.row()]
+        if role == _USER_ROLE:
+            return error
+        if role == _DISPLAY_ROLE:
+            return error.filename
+        return None
+
+
+class ErrorDelegate(QStyledItemDelegate):
+    """
+    Zeichnet einen Fehler-Eintrag (Dateiname, Muster, Phase, Details).
+
+    Optik entspricht styles.get_error_style(): farbiger Hintergrund
+    mit Akzentbalken links, beide aus denselben Theme-Tokens.
+    """
+
+    PADDING = 10
+    ACCENT_WIDTH = 4
+    LINE_SPACING = 5
+    ITEM_SPACING = 15
+    TEXT_FLAGS = int(Qt.AlignmentFlag.AlignLeft | Qt.TextFlag.TextWordWrap)
+
+    def __init__(self, dark: bool, parent=None):
+        super().__init__(parent)
+        tokens = get_theme_tokens(dark)
+        self._background = QColor(tokens['error_bg'])
+        self._accent = QColor(tokens['error'])
+
+    def _lines(self, option, index) -> list:
+        """Gibt die Zeilen als (Text, Font) zurück."""
+        error = index.data(_USER_ROLE)
+
+        header_font = QFont(option.font)
+        header_font.setBold(True)
+        header_font.setPixelSize(12)
+
+        return [
+            (f"{index.row() + 1}. {error.filename}", header_font),
+            (f"Muster: {error.pattern}", option.font),
+            (f"Phase: {error.phase}", option.font),
+            (f"Details: {error.details}", option.font),
+        ]
+
+    def _text_width(self, option) -> int:
+        """Verfügbare Textbreite (Viewport-Breite abzüglich Ränder)."""
+        width = option.rect.width()
+        if width <= 0 and option.widget is not None:
+            width = option.widget.viewport().width()
+        return max(50, width - self.ACCENT_WIDTH - 2 * self.PADDING)
+
+    def _line_heights(self, lines: list, text_width: int) -> list:
+        """Berechnet die Höhe jeder Zeile inkl. Zeilenumbruch."""
+        bounds = QRect(0, 0, text_width, 100000)
+        return [
+            QFontMetrics(font).boundingRect(bounds, self.TEXT_FLAGS, text).height()
+            for text, font in lines
+        ]
+
+    def sizeHint(self, option, index) -> QSize:
+        """Höhe ergibt sich aus den (umgebrochenen) Textzeilen."""
+        lines = self._lines(option, index)
+        heights = self._line_heights(lines, self._text_width(option))
+        height = (sum(heights) + self.LINE_SPACING * (len(heights) - 1) +
+                  2 * self.PADDING + self.ITEM_SPACING)
+        return QSize(option.rect.width(), height)
+
+    def paint(self, painter, option, index):
+        """Zeichnet Hintergrund, Akzentbalken und Textzeilen."""
+        painter.save()
+
+        rect = option.rect.adjusted(0, 0, 0, -self.ITEM_SPACING)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._background)
+        painter.drawRoundedRect(rect, 3, 3)
+        painter.fillRect(
+            QRect(rect.left(), rect.top(), self.ACCENT_WIDTH, rect.height()),
+            self._accent
+        )
+
+        painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+        lines = self._lines(option, index)
+        text_width = self._text_width(option)
+        x = rect.left() + self.ACCENT_WIDTH + self.PADDING
+        y = rect.top() + self.PADDING
+        for (text, font), height in zip(lines, self._line_heights(lines, text_width)):
+            painter.setFont(font)
+            painter.drawText(QRect(x, y, text_width, height), self.TEXT_FLAGS, text)
+            y += height + self.LINE_SPACING
+
+        painter.restore()
 
 
 class ErrorDetailDialog(QDialog):
     """
     Dialog zur Anzeige von Fehler-Details.
 
-    Zeigt eine Liste aller aufgetretenen Fehler.
+    Zeigt eine Liste aller aufgetretenen Fehler. Die Liste ist ein
+    QListView mit Model/Delegate, es werden also nur die sichtbaren
+    Einträge gezeichnet - auch bei tausenden Fehlern öffnet der Dialog
+    sofort.
     """
 
     def __init__(self, errors: list, parent=None):
         """
         Args:
-            errors: Liste von Fehler-Dictionaries mit Schlüsseln:
-                - filename: Dateiname
-                - pattern: Muster (z.B. '0xFF')
-                - phase: Phase ('Schreiben' oder 'Verifizierung')
-                - details: Detaillierte Fehlerbeschreibung
+            errors: Liste von ErrorEntry; Fehler-Dictionaries mit den
+                Schlüsseln filename, pattern, phase, details werden
+                weiterhin akzeptiert und umgewandelt
         """
         super().__init__(parent)
-        self.errors = errors
+        self.errors = [
+            error if isinstance(error, ErrorEntry) else ErrorEntry.from_dict(error)
+            for error in errors
+        ]
         self._setup_ui()
 
     def _setup_ui(self):
@@ -496,38 +932,28 @@ class ErrorDetailDialog(QDialog):
         self.setWindowTitle("Fehler-Details")
         self.setModal(True)
         self.setMinimumSize(500, 400)
+        dark = is_dark_mode()
+        self.setStyleSheet(DIALOG_STYLESHEETS[dark])
 
         layout = QVBoxLayout(self)
 
         # Header
         header = QLabel(f"Fehler während des Tests: {len(self.errors)}")
-        header.setStyleSheet("font-size: 14px; font-weight: bold; margin-bottom: 10px;")
+        header.setObjectName("dialogHeader")
         layout.addWidget(header)
 
-        # Scroll-Bereich für Fehler-Liste
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        border_color = "#555555" if is_dark_mode() else "#cccccc"
-        scroll.setStyleSheet(f"""
-            QScrollArea {{
-                border: 1px solid {border_color};
-                border-radius: 5px;
-            }}
-        """)
-
-        error_list_widget = QWidget()
-        error_list_layout = QVBoxLayout(error_list_widget)
-        error_list_layout.setSpacing(15)
-
-        # Fehler-Einträge erstellen
-        for i, error in enumerate(self.errors, 1):
-            error_widget = self._create_error_widget(i, error)
-            error_list_layout.addWidget(error_widget)
-
-        error_list_layout.addStretch()
-
-        scroll.setWidget(error_list_widget)
-        layout.addWidget(scroll)
+        # Fehler-Liste (nur sichtbare Zeilen werden gezeichnet)
+        self.error_view = QListView()
+        self.error_view.setObjectName("errorList")
+        self.error_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.error_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.error_view.setResizeMode(QListView.ResizeMode.Adjust)
+        # Zeilenhöhen in Batches berechnen, GUI bleibt dabei bedienbar
+        self.error_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.error_view.setBatchSize(100)
+        self.error_view.setModel(ErrorListModel(self.errors, self.error_view))
+        self.error_view.setItemDelegate(ErrorDelegate(dark, self.error_view))
+        layout.addWidget(self.error_view)
 
         # Schließen-Button
         close_button = QPushButton("Schließen")
@@ -541,34 +967,6 @@ class ErrorDetailDialog(QDialog):
 
         layout.addLayout(button_layout)
 
-    def _create_error_widget(self, index: int, error: dict) -> QWidget:
-        """Erstellt ein Widget für einen Fehler-Eintrag."""
-        widget = QWidget()
-        widget.setStyleSheet(AppStyles.get_error_style())
-
-        layout = QVBoxLayout(widget)
-        layout.setSpacing(5)
-
-        # Nummer und Dateiname
-        header = QLabel(f"{index}. {error.get('filename', 'Unbekannte Datei')}")
-        header.setStyleSheet("font-weight: bold; font-size: 12px;")
-        layout.addWidget(header)
-
-        # Muster
-        muster_label = QLabel(f"Muster: {error.get('pattern', '--')}")
-        layout.addWidget(muster_label)
-
-        # Phase
-        phase_label = QLabel(f"Phase: {error.get('phase', '--')}")
-        layout.addWidget(phase_label)
-
-        # Details
-        details_label = QLabel(f"Details: {error.get('details', 'Keine Details verfügbar')}")
-        details_label.setWordWrap(True)
-        layout.addWidget(details_label)
-
-        return widget
-
 
 class FileRecoveryDialog(QDialog):
     """
@@ -608,6 +1006,17 @@ class FileRecoveryDialog(QDialog):
         self.setWindowTitle("Testdateien gefunden")
         self.setModal(True)
         self.setMinimumWidth(500)
+        self.setStyleSheet(DIALOG_STYLESHEETS[is_dark_mode()])
+
+        # Recovery-Informationen einmalig auslesen
+        info = self.recovery_info
+        file_count = info.get('file_count', 0)
+        complete_count = info.get('complete_count', 0)
+        smaller_count = info.get('smaller_consistent_count', 0)
+        corrupted_count = info.get('corrupted_count', 0)
+        expected_size_mb = info.get('expected_size_mb', 0)
+        total_size_gb = info.get('total_size_gb', 0)
+        detected_pattern = info.get('detected_pattern')
 
         layout = QVBoxLayout(self)
         layout.setSpacing(20)
@@ -616,8 +1025,7 @@ class FileRecoveryDialog(QDialog):
         header_layout = QHBoxLayout()
 
         icon_label = QLabel("⚠")
-        warning_color = "#ffa726" if is_dark_mode() else "#ffc107"
-        icon_label.setStyleSheet(f"font-size: 32px; color: {warning_color};")
+        icon_label.setObjectName("warningIcon")
         header_layout.addWidget(icon_label)
 
         info_text = QLabel(
@@ -630,11 +1038,13 @@ class FileRecoveryDialog(QDialog):
         layout.addLayout(header_layout)
 
         # Datei-Details
-        details_widget = self._create_details_widget()
+        details_widget = self._create_details_widget(
+            file_count, complete_count, smaller_count,
+            corrupted_count, total_size_gb, detected_pattern
+        )
         layout.addWidget(details_widget)
 
         # Option: Beschädigte Dateien überschreiben
-        corrupted_count = self.recovery_info.get('corrupted_count', 0)
         if corrupted_count > 0:
             self.overwrite_checkbox = QCheckBox(
                 f"Beschädigte Dateien überschreiben ({corrupted_count} Dateien)"
@@ -648,8 +1058,6 @@ class FileRecoveryDialog(QDialog):
             layout.addWidget(self.overwrite_checkbox)
 
         # Option: Zu kleine Dateien vergrößern
-        smaller_count = self.recovery_info.get('smaller_consistent_count', 0)
-        expected_size_mb = self.recovery_info.get('expected_size_mb', 0)
         if smaller_count > 0:
             self.expand_checkbox = QCheckBox(
                 f"Zu kleine Dateien auf {expected_size_mb} MB vergrößern ({smaller_count} Dateien)"
@@ -664,8 +1072,8 @@ class FileRecoveryDialog(QDialog):
 
         # Frage
         question = QLabel("Wie möchten Sie fortfahren?")
-        question.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        question.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        question.setAlignment(_ALIGN_CENTER)
+        question.setObjectName("questionLabel")
         layout.addWidget(question)
 
         # Buttons
@@ -694,16 +1102,17 @@ class FileRecoveryDialog(QDialog):
 
         layout.addLayout(button_layout)
 
-    def _create_details_widget(self) -> QWidget:
+    def _create_details_widget(self, file_count: int, complete: int,
+                               smaller_consistent: int, corrupted: int,
+                               size_gb: float, pattern: str) -> QWidget:
         """Erstellt das Widget mit Datei-Details."""
         widget = QWidget()
-        widget.setStyleSheet(AppStyles.get_dialog_detail_style())
+        widget.setObjectName("detailPanel")
 
         layout = QVBoxLayout(widget)
         layout.setSpacing(8)
 
         # Anzahl Dateien
-        file_count = self.recovery_info.get('file_count', 0)
         count_layout = self._create_detail_row(
             "Gefundene Dateien:",
             str(file_count)
@@ -711,7 +1120,6 @@ class FileRecoveryDialog(QDialog):
         layout.addLayout(count_layout)
 
         # Vollständige Dateien
-        complete = self.recovery_info.get('complete_count', 0)
         complete_layout = self._create_detail_row(
             "Vollständig:",
             f"{complete} Dateien"
@@ -719,7 +1127,6 @@ class FileRecoveryDialog(QDialog):
         layout.addLayout(complete_layout)
 
         # Zu kleine konsistente Dateien
-        smaller_consistent = self.recovery_info.get('smaller_consistent_count', 0)
         if smaller_consistent > 0:
             smaller_layout = self._create_detail_row(
                 "Zu klein (konsistent):",
@@ -728,7 +1135,6 @@ class FileRecoveryDialog(QDialog):
             layout.addLayout(smaller_layout)
 
         # Beschädigte Dateien
-        corrupted = self.recovery_info.get('corrupted_count', 0)
         if corrupted > 0:
             corrupted_layout = self._create_detail_row(
                 "Beschädigt/Unfertig:",
@@ -737,7 +1143,6 @@ class FileRecoveryDialog(QDialog):
             layout.addLayout(corrupted_layout)
 
         # Gesamtgröße
-        size_gb = self.recovery_info.get('total_size_gb', 0)
         size_layout = self._create_detail_row(
             "Gesamtgröße:",
             f"{size_gb:.1f} GB"
@@ -745,7 +1150,6 @@ class FileRecoveryDialog(QDialog):
         layout.addLayout(size_layout)
 
         # Erkanntes Muster
-        pattern = self.recovery_info.get('detected_pattern')
         if pattern:
             pattern_layout = self._create_detail_row(
                 "Erkanntes Muster:",
@@ -761,7 +1165,7 @@ class FileRecoveryDialog(QDialog):
 
         label = QLabel(label_text)
         label.setMinimumWidth(140)
-        label.setStyleSheet("font-weight: bold;")
+        label.setObjectName("boldLabel")
         row_layout.addWidget(label)
 
         value = QLabel(value_text)
@@ -771,11 +1175,11 @@ class FileRecoveryDialog(QDialog):
 
     def _on_overwrite_changed(self, state):
         """Callback wenn Checkbox geändert wird."""
-        self.overwrite_corrupted = (state == Qt.CheckState.Checked.value)
+        self.overwrite_corrupted = (state == _CHECKED)
 
     def _on_expand_changed(self, state):
         """Callback wenn Expand-Checkbox geändert wird."""
-        self.expand_smaller_files = (state == Qt.CheckState.Checked.value)
+        self.expand_smaller_files = (state == _CHECKED)
 
     def should_overwrite_corrupted(self) -> bool:
         """Gibt zurück ob beschädigte Dateien überschrieben werden sollen."""
@@ -786,28 +1190,43 @@ class FileRecoveryDialog(QDialog):
         return self.expand_smaller_files
 
 
-class FileExpansionWorker(QThread):
+class ExpansionSignals(QObject):
     """
-    Worker-Thread zum Vergrößern von Dateien.
+    Signale für ExpansionRunnable.
+
+    QRunnable ist kein QObject und kann selbst keine Signale senden;
+    dieses Objekt lebt im GUI-Thread und wird vom Dialog gehalten.
     """
     progress = Signal(int, int, str)  # (current_file_index, total_files, filename)
     file_progress = Signal(int, int)  # (current_bytes, total_bytes)
     finished = Signal(int, int)  # (success_count, error_count)
 
-    def __init__(self, file_analyzer, files_to_expand):
+
+class ExpansionRunnable(QRunnable):
+    """
+    Aufgabe zum Vergrößern von Dateien (läuft im globalen QThreadPool).
+    """
+
+    # Mindestabstand zwischen zwei file_progress-Signalen (50 ms = 20 Hz)
+    FILE_PROGRESS_INTERVAL_NS = 50_000_000
+
+    def __init__(self, file_analyzer, files_to_expand, signals: ExpansionSignals):
         super().__init__()
         self.file_analyzer = file_analyzer
         self.files_to_expand = files_to_expand
+        self.signals = signals
+        self._last_emit_ns = 0
 
     def run(self):
         """Führt die Datei-Vergrößerung aus."""
+        signals = self.signals
         success_count = 0
         error_count = 0
         total_files = len(self.files_to_expand)
 
         for i, file_result in enumerate(self.files_to_expand):
             # Emit progress für diese Datei
-            self.progress.emit(i + 1, total_files, file_result.filepath.name)
+            signals.progress.emit(i + 1, total_files, file_result.filepath.name)
 
             # Pattern muss bekannt sein
             if not file_result.detected_pattern:
@@ -815,8 +1234,13 @@ class FileExpansionWorker(QThread):
                 continue
 
             # Vergrößern mit File-Progress-Callback
+            # Gedrosselt: höchstens alle 50 ms, letzter Stand immer
             def on_file_progress(current_bytes, total_bytes):
-                self.file_progress.emit(current_bytes, total_bytes)
+                now = time.monotonic_ns()
+                if (current_bytes >= total_bytes or
+                        now - self._last_emit_ns >= self.FILE_PROGRESS_INTERVAL_NS):
+                    self._last_emit_ns = now
+                    signals.file_progress.emit(current_bytes, total_bytes)
 
             if self.file_analyzer.expand_file_to_target_size(
                 file_result.filepath,
@@ -828,7 +1252,7 @@ class FileExpansionWorker(QThread):
                 error_count += 1
 
         # Fertig
-        self.finished.emit(success_count, error_count)
+        signals.finished.emit(success_count, error_count)
 
 
 class FileExpansionDialog(QDialog):
@@ -836,6 +1260,9 @@ class FileExpansionDialog(QDialog):
     Dialog zur Anzeige des Fortschritts beim Vergrößern von Dateien.
     """
 
+    # Intervall, in dem Fortschrittswerte in die Balken übernommen werden
+    UI_FLUSH_INTERVAL_MS = 50
+
     def __init__(self, file_analyzer, files_to_expand, parent=None):
         """
         Args:
@@ -847,7 +1274,18 @@ class FileExpansionDialog(QDialog):
         self.files_to_expand = files_to_expand
         self.success_count = 0
         self.error_count = 0
+
+        # Letzte gemeldete Werte; der UI-Timer überträgt sie gesammelt
+        self._pending_file_pct = -1
+        self._pending_overall = -1
+
         self._setup_ui()
+
+        self._ui_timer = QTimer(self)
+        self._ui_timer.setInterval(self.UI_FLUSH_INTERVAL_MS)
+        self._ui_timer.timeout.connect(self._flush_ui)
+        self._ui_timer.start()
+
         self._start_expansion()
 
     def _setup_ui(self):
@@ -861,12 +1299,12 @@ class FileExpansionDialog(QDialog):
 
         # Info-Text
         info_text = QLabel("Testdateien werden auf Zielgröße vergrößert...")
-        info_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        info_text.setAlignment(_ALIGN_CENTER)
         layout.addWidget(info_text)
 
         # Datei-Label
         self.file_label = QLabel("Vorbereitung...")
-        self.file_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.file_label.setAlignment(_ALIGN_CENTER)
         layout.addWidget(self.file_label)
 
         # Datei-Fortschrittsbalken
@@ -894,28 +1332,40 @@ class FileExpansionDialog(QDialog):
         layout.addWidget(self.close_button)
 
     def _start_expansion(self):
-        """Startet den Expansion-Worker."""
-        self.worker = FileExpansionWorker(self.file_analyzer, self.files_to_expand)
-        self.worker.progress.connect(self._on_progress)
-        self.worker.file_progress.connect(self._on_file_progress)
-        self.worker.finished.connect(self._on_finished)
-        self.worker.start()
+        """Startet die Vergrößerung im globalen Thread-Pool."""
+        # Signale explizit gequeued: Slots laufen immer im GUI-Thread
+        self._signals = ExpansionSignals(self)
+        queued = Qt.ConnectionType.QueuedConnection
+        self._signals.progress.connect(self._on_progress, queued)
+        self._signals.file_progress.connect(self._on_file_progress, queued)
+        self._signals.finished.connect(self._on_finished, queued)
+
+        QThreadPool.globalInstance().start(
+            ExpansionRunnable(self.file_analyzer, self.files_to_expand, self._signals)
+        )
 
     def _on_progress(self, current_file: int, total_files: int, filename: str):
         """Callback für Gesamt-Fortschritt."""
         self.file_label.setText(f"Datei: {filename}")
-        self.overall_progress_bar.setValue(current_file)
+        self._pending_overall = current_file
         # Reset File-Progress für nächste Datei
-        self.file_progress_bar.setValue(0)
+        self._pending_file_pct = 0
 
     def _on_file_progress(self, current_bytes: int, total_bytes: int):
-        """Callback für Datei-Fortschritt."""
+        """Callback für Datei-Fortschritt (merkt nur den Wert vor)."""
         if total_bytes > 0:
-            progress_percent = int((current_bytes / total_bytes) * 100)
-            self.file_progress_bar.setValue(progress_percent)
+            self._pending_file_pct = int((current_bytes / total_bytes) * 100)
+
+    def _flush_ui(self):
+        """Überträgt vorgemerkte Werte in die Balken, nur bei Änderung."""
+        if self._pending_file_pct >= 0 and self._pending_file_pct != self.file_progress_bar.value():
+            self.file_progress_bar.setValue(self._pending_file_pct)
+        if self._pending_overall >= 0 and self._pending_overall != self.overall_progress_bar.value():
+            self.overall_progress_bar.setValue(self._pending_overall)
 
     def _on_finished(self, success_count: int, error_count: int):
         """Callback wenn Expansion fertig ist."""
+        self._ui_timer.stop()
         self.success_count = success_count
         self.error_count = error_count
 
@@ -966,6 +1416,7 @@ class MultiSessionSelectionDialog(QDialog):
         self.setModal(True)
         self.setMinimumWidth(600)
         self.setMinimumHeight(400)
+        self.setStyleSheet(DIALOG_STYLESHEETS[is_dark_mode()])
 
         layout = QVBoxLayout(self)
         layout.setSpacing(15)
@@ -1052,7 +1503,7 @@ class MultiSessionSelectionDialog(QDialog):
             # Letzte Änderung
             if session.last_modified:
                 modified_label = QLabel(f"<i>Zuletzt geändert: {session.last_modified}</i>")
-                modified_label.setStyleSheet("font-size: 9pt; opacity: 0.7;")
+                modified_label.setObjectName("secondaryLabel")
                 info_layout.addWidget(modified_label)
 
             session_layout.addWidget(info_widget, 1)
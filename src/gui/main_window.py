@@ -1,18 +1,85 @@
 """Hauptfenster der DiskTest Anwendung."""
 
+import functools
 import os
-from pathlib import Path
+import time
+from typing import Optional
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
     QPushButton, QLineEdit, QLabel, QSlider, QSpinBox, QDoubleSpinBox,
-    QCheckBox, QFileDialog, QStatusBar, QMessageBox
+    QCheckBox, QStatusBar
 )
-from PySide6.QtCore import Qt, Signal, Slot
-from PySide6.QtGui import QIcon, QAction
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QTimer, QSignalBlocker, QObject, QRunnable, QThreadPool, QDir,
+    QEventLoop
+)
+from PySide6.QtGui import QAction
 
+from core.file_manager import FileManager
+from core.platform import get_disk_space_reader, BYTES_PER_GB
 from .widgets import ProgressWidget, LogWidget, PatternSelectionWidget
 
+# Speicherplatz-Abfrage der Plattform, einmalig beim Import gewählt
+_get_disk_space = get_disk_space_reader()
+
+
+@functools.lru_cache(maxsize=256)
+def _format_free_space(tenths_gb: int) -> str:
+    """Anzeigetext für den verfügbaren Speicher (Wert in Zehntel-GB)."""
+    return f"Freier Speicher: {tenths_gb // 10}.{tenths_gb % 10} GB"
+
+
+def _cache_put(cache: dict, key, value, max_size: int):
+    """Legt einen Eintrag als neuesten ab und verwirft bei Überlauf den ältesten."""
+    cache.pop(key, None)
+    cache[key] = value
+    if len(cache) > max_size:
+        del cache[next(iter(cache))]
+
+
+class _FreeSpaceSignals(QObject):
+    """Signale für _FreeSpaceRefresh (QRunnable selbst ist kein QObject)."""
+    # Generation, Pfad, Ergebnis: None = Pfad fehlt, 0.0 = Fehler,
+    # sonst Tuple (st_dev, mtime_ns des Ordners, frei in GB, Testdateien in GB)
+    ready = Signal(int, str, object)
+
+
+class _FreeSpaceRefresh(QRunnable):
+    """
+    Ermittelt den verfügbaren Speicher im globalen QThreadPool.
+
+    Die blockierenden Abfragen (Speicherplatz, Suche nach Testdateien)
+    laufen so nicht im GUI-Thread. Die Einzelwerte werden zurückgegeben,
+    damit der GUI-Thread sie in seine Caches übernehmen kann.
+    """
+
+    def __init__(self, generation: int, path: str, file_size_gb: float,
+                 signals: _FreeSpaceSignals):
+        super().__init__()
+        self.generation = generation
+        self.path = path
+        self.file_size_gb = file_size_gb
+        self.signals = signals
+
+    def run(self):
+        """Fragt Speicherplatz und vorhandene Testdateien ab."""
+        try:
+            st = os.stat(self.path)
+            free_bytes, _ = _get_disk_space(self.path)
+        except (FileNotFoundError, NotADirectoryError, ValueError):
+            result = None
+        except OSError:
+            result = 0.0
+        else:
+            try:
+                existing_bytes = FileManager(self.path, self.file_size_gb).get_existing_files_size()
+                result = (st.st_dev, st.st_mtime_ns,
+                          free_bytes / BYTES_PER_GB, existing_bytes / BYTES_PER_GB)
+            except Exception:
+                result = 0.0
+        self.signals.ready.emit(self.generation, self.path, result)
+
 
 class ConfigurationWidget(QGroupBox):
     """
@@ -29,11 +96,35 @@ class ConfigurationWidget(QGroupBox):
     path_changed = Signal(str)  # Emittiert wenn Pfad geändert wird
     config_changed = Signal()   # Emittiert bei jeder Config-Änderung
 
+    PATH_DEBOUNCE_MS = 200               # Wartezeit nach letztem Tastendruck
+    CONFIG_DEBOUNCE_MS = 100             # Sammelintervall für config_changed
+    FREE_SPACE_CACHE_TTL_SECONDS = 5.0   # Gültigkeit gecachter Speicherplatz-Werte
+    FREE_SPACE_CACHE_SIZE = 32           # Maximale Anzahl gecachter Laufwerke
+    FREE_SPACE_SNAPSHOT_SIZE = 16        # Gemerkte Pfade für den nächsten Start
+
     def __init__(self, parent=None):
         super().__init__("Konfiguration", parent)
+        # Laufwerk (st_dev) -> (Zeitstempel, freier Speicher in GB)
+        self._mount_cache: dict[int, tuple[float, float]] = {}
+        # Pfad -> (Zeitstempel, mtime des Ordners, Größe vorhandener Testdateien in GB)
+        self._existing_size_cache: dict[str, tuple[float, int, float]] = {}
+        # Zuletzt angezeigter Text (unveränderte Werte nicht neu setzen)
+        self._last_free_space_text = "Freier Speicher: --"
+        # Pfad -> angezeigter verfügbarer Speicher in GB (wird beim Beenden gespeichert)
+        self._shown_free_space: dict[str, float] = {}
+        # Ordner-Dialog, wird beim ersten Durchsuchen erstellt
+        self._dir_dialog = None
+        # Zählt Speicherplatz-Abfragen hoch; nur das Ergebnis der neuesten
+        # Hintergrund-Abfrage wird angezeigt
+        self._free_space_generation = 0
         self._setup_ui()
         self._connect_signals()
 
+        self._refresh_signals = _FreeSpaceSignals(self)
+        self._refresh_signals.ready.connect(
+            self._on_free_space_refreshed, Qt.ConnectionType.QueuedConnection
+        )
+
     def _setup_ui(self):
         """UI-Elemente erstellen."""
         layout = QVBoxLayout(self)
@@ -69,7 +160,7 @@ class ConfigurationWidget(QGroupBox):
         controls_layout = QHBoxLayout()
 
         # Freier Speicher ganz links
-        self.free_space_label = QLabel("Freier Speicher: --")
+        self.free_space_label = QLabel(self._last_free_space_text)
         self.free_space_label.setMinimumWidth(180)
         controls_layout.addWidget(self.free_space_label)
 
@@ -127,7 +218,18 @@ class ConfigurationWidget(QGroupBox):
     def _connect_signals(self):
         """Verbindet interne Signals."""
         self.browse_button.clicked.connect(self._browse_path)
-        self.path_edit.textChanged.connect(self._on_path_changed)
+
+        # Tippen entprellen: erst nach einer Pause wird der Pfad ausgewertet.
+        # textEdited kommt nur bei Benutzereingaben und vor textChanged;
+        # setText() aus dem Code wird weiterhin sofort ausgewertet.
+        self._path_debounce = QTimer(self)
+        self._path_debounce.setSingleShot(True)
+        self._path_debounce.setInterval(self.PATH_DEBOUNCE_MS)
+        self._path_debounce.timeout.connect(
+            lambda: self._on_path_changed(self.path_edit.text(), background=True)
+        )
+        self.path_edit.textEdited.connect(self._path_debounce.start)
+        self.path_edit.textChanged.connect(self._on_path_text_changed)
 
         # Slider und SpinBox synchronisieren
         # Slider verwendet Ganzzahlen, SpinBox erlaubt Dezimalwerte
@@ -137,88 +239,341 @@ class ConfigurationWidget(QGroupBox):
         # Checkbox für ganzes Laufwerk
         self.whole_drive_checkbox.toggled.connect(self._on_whole_drive_toggled)
 
-        # Config-Changed Signal (Lambda um Parameter zu ignorieren)
-        self.size_spinbox.valueChanged.connect(lambda: self.config_changed.emit())
-        self.file_size_spinbox.valueChanged.connect(lambda: self.config_changed.emit())
-
-        # Wenn Dateigröße geändert wird, Speicherplatz neu berechnen
-        self.file_size_spinbox.valueChanged.connect(lambda: self._on_path_changed(self.path_edit.text()))
+        # Config-Changed Signal gesammelt: beim Ziehen des Sliders höchstens
+        # einmal pro Intervall, beim Loslassen sofort
+        self._config_timer = QTimer(self)
+        self._config_timer.setSingleShot(True)
+        self._config_timer.setInterval(self.CONFIG_DEBOUNCE_MS)
+        self._config_timer.timeout.connect(self.config_changed.emit)
+        self.size_spinbox.valueChanged.connect(self._schedule_config_changed)
+        self.file_size_spinbox.valueChanged.connect(self._schedule_config_changed)
+        self.size_slider.sliderReleased.connect(self._emit_config_changed_now)
+
+        # Wenn Dateigröße geändert wird, Speicherplatz neu berechnen -
+        # gesammelt, schnelles Durchklicken löst nur eine Abfrage aus
+        self._file_size_debounce = QTimer(self)
+        self._file_size_debounce.setSingleShot(True)
+        self._file_size_debounce.setInterval(self.CONFIG_DEBOUNCE_MS)
+        self._file_size_debounce.timeout.connect(self._on_file_size_changed)
+        self.file_size_spinbox.valueChanged.connect(self._file_size_debounce.start)
+
+    def _schedule_config_changed(self):
+        """Plant config_changed ein (läuft der Timer schon, wird nichts verschoben)."""
+        if not self._config_timer.isActive():
+            self._config_timer.start()
+
+    def _emit_config_changed_now(self):
+        """Sendet config_changed sofort und verwirft ein geplantes Signal."""
+        self._config_timer.stop()
+        self.config_changed.emit()
 
     def _on_slider_changed(self, value: int):
         """Slider-Wert geändert - synchronisiere mit SpinBox"""
-        # Nur synchronisieren wenn Wert unterschiedlich (verhindert Endlosschleife)
-        if abs(self.size_spinbox.value() - value) >= 0.5:
+        # Ohne Rückmeldung an den Slider; config_changed daher selbst einplanen
+        with QSignalBlocker(self.size_spinbox):
             self.size_spinbox.setValue(float(value))
+        self._schedule_config_changed()
 
     def _on_spinbox_changed(self, value: float):
         """SpinBox-Wert geändert - synchronisiere mit Slider"""
-        # Slider kann nur Ganzzahlen, runde den Wert
-        int_value = max(1, int(round(value)))  # Mindestens 1 für Slider
-        if self.size_slider.value() != int_value:
-            self.size_slider.setValue(int_value)
+        # Slider kann nur Ganzzahlen, runde den Wert (mindestens 1).
+        # Signale blockiert, sonst würde der Slider die Dezimalstellen überschreiben
+        with QSignalBlocker(self.size_slider):
+            self.size_slider.setValue(max(1, int(round(value))))
 
     def _browse_path(self):
         """Öffnet Datei-Dialog zur Ordnerauswahl."""
-        directory = QFileDialog.getExistingDirectory(
-            self,
-            "Zielpfad auswählen",
-            self.path_edit.text() or "",
-            QFileDialog.Option.ShowDirsOnly
-        )
+        # Dialog einmalig erstellen und wiederverwenden (spart den Neuaufbau)
+        if self._dir_dialog is None:
+            from PySide6.QtWidgets import QFileDialog
+
+            self._dir_dialog = QFileDialog(self, "Zielpfad auswählen")
+            self._dir_dialog.setFileMode(QFileDialog.FileMode.Directory)
+            self._dir_dialog.setOption(QFileDialog.Option.ShowDirsOnly)
+
+        self._dir_dialog.setDirectory(self.path_edit.text() or QDir.homePath())
+
+        if self._dir_dialog.exec():
+            selected = self._dir_dialog.selectedFiles()
+            if selected:
+                self.path_edit.setText(selected[0])
 
-        if directory:
-            self.path_edit.setText(directory)
+    def _on_path_text_changed(self, path: str):
+        """Text geändert - Benutzereingaben laufen über den Entprell-Timer."""
+        if self._path_debounce.isActive():
+            return
+        self._on_path_changed(path)
+
+    def _on_path_changed(self, path: str, background: bool = False):
+        """
+        Wird aufgerufen wenn Pfad geändert wird.
 
-    def _on_path_changed(self, path: str):
-        """Wird aufgerufen wenn Pfad geändert wird."""
-        self._update_free_space(path)
+        Args:
+            path: Neuer Pfad
+            background: Speicherplatz im Thread-Pool ermitteln (Benutzereingaben).
+                        Bei setText() aus dem Code sofort, da z.B. set_config
+                        direkt danach die angepassten Maxima braucht.
+        """
+        self._path_debounce.stop()
+        self._file_size_debounce.stop()
+        if background:
+            self._request_free_space(path)
+        else:
+            self._update_free_space(path)
         self.path_changed.emit(path)
         self.config_changed.emit()
 
-    def _get_available_test_space(self, path: str) -> float:
+    def _on_file_size_changed(self):
         """
-        Berechnet verfügbaren Speicher für Test inkl. vorhandener Testdateien.
+        Dateigröße geändert - nur den Speicherplatz neu ermitteln.
+
+        path_changed wird nicht gesendet (Pfad ist gleich geblieben),
+        config_changed kommt bereits über den Config-Timer.
+        """
+        self._request_free_space(self.path_edit.text())
+
+    def invalidate_free_space_cache(self):
+        """Verwirft gecachte Speicherplatz-Werte (z.B. nach dem Vergrößern von Dateien)."""
+        self._mount_cache.clear()
+        self._existing_size_cache.clear()
+
+    def _get_free_gb(self, path: str, st: os.stat_result):
+        """
+        Ermittelt den OS-freien Speicher, gecacht pro Laufwerk.
+
+        Schlüssel ist das Laufwerk (st_dev), nicht der Pfad: Unterordner
+        desselben Laufwerks teilen sich einen Eintrag, beim Durchsuchen
+        vieler Ordner fällt nur ein GetDiskFreeSpaceExW bzw. statvfs pro
+        Laufwerk an.
+
+        Args:
+            path: Zielpfad
+            st: os.stat-Ergebnis des Zielpfads
 
         Returns:
-            float: Verfügbarer Speicher in GB
+            float: Freier Speicher in GB, None wenn der Pfad nicht existiert
+
+        Raises:
+            OSError: Wenn die Abfrage fehlschlägt
         """
-        if not path or not os.path.exists(path):
-            return 0.0
+        key = st.st_dev
+        now = time.monotonic()
+
+        cached = self._mount_cache.pop(key, None)
+        if cached is not None and now - cached[0] < self.FREE_SPACE_CACHE_TTL_SECONDS:
+            # Wieder ans Ende setzen (zuletzt benutzt)
+            self._mount_cache[key] = cached
+            return cached[1]
 
         try:
-            import shutil
-            from core.file_manager import FileManager
+            free_bytes, _ = _get_disk_space(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+        free_gb = free_bytes / BYTES_PER_GB
+        _cache_put(self._mount_cache, key, (now, free_gb), self.FREE_SPACE_CACHE_SIZE)
+        return free_gb
 
-            # OS-freier Speicher
-            stat = shutil.disk_usage(path)
-            free_gb = stat.free / (1024 ** 3)
+    def _get_available_test_space(self, path: str, free_gb: float, mtime_ns: int) -> float:
+        """
+        Berechnet verfügbaren Speicher für Test inkl. vorhandener Testdateien.
 
-            # Größe vorhandener Testdateien
-            file_size_gb = self.file_size_spinbox.value() / 1024.0  # MB to GB
-            fm = FileManager(path, file_size_gb)
-            existing_size_gb = fm.get_existing_files_size() / (1024 ** 3)
+        Args:
+            path: Zielpfad (existiert)
+            free_gb: OS-freier Speicher in GB
+            mtime_ns: mtime des Zielordners
 
-            return free_gb + existing_size_gb
+        Returns:
+            float: Verfügbarer Speicher in GB
+        """
+        try:
+            return free_gb + self._get_existing_size_gb(path, mtime_ns)
         except Exception:
             return 0.0
 
+    def _get_existing_size_gb(self, path: str, mtime_ns: int) -> float:
+        """
+        Größe vorhandener Testdateien, gecacht pro Pfad.
+
+        Der Eintrag gilt, solange sich die mtime des Ordners nicht ändert
+        (Dateien angelegt/gelöscht/umbenannt) und die TTL nicht abgelaufen
+        ist - Größenänderungen bestehender Dateien ändern die Ordner-mtime
+        nicht. Ein os.stat ersetzt so das Durchsuchen des Ordners, z.B.
+        bei jeder Änderung der Dateigröße.
+        """
+        now = time.monotonic()
+
+        cached = self._existing_size_cache.get(path)
+        if (cached is not None and cached[1] == mtime_ns
+                and now - cached[0] < self.FREE_SPACE_CACHE_TTL_SECONDS):
+            return cached[2]
+
+        # Dateigröße beeinflusst nur den Dateinamen-Aufbau, nicht die Suche
+        file_size_gb = self.file_size_spinbox.value() / 1024.0  # MB to GB
+        fm = FileManager(path, file_size_gb)
+        existing_size_gb = fm.get_existing_files_size() / BYTES_PER_GB
+
+        _cache_put(self._existing_size_cache, path, (now, mtime_ns, existing_size_gb),
+                   self.FREE_SPACE_CACHE_SIZE)
+        return existing_size_gb
+
     def _update_free_space(self, path: str):
         """Aktualisiert die Anzeige des freien Speichers."""
-        if not path or not os.path.exists(path):
-            self.free_space_label.setText("Freier Speicher: --")
+        # Noch laufende Hintergrund-Abfragen sind damit überholt
+        self._free_space_generation += 1
+
+        # Ein os.stat für Existenz-Prüfung, Laufwerk (st_dev) und Ordner-mtime
+        try:
+            st = os.stat(path) if path else None
+        except (OSError, ValueError):
+            # Wie os.path.exists: nicht erreichbar gilt als nicht vorhanden
+            st = None
+
+        try:
+            free_gb = self._get_free_gb(path, st) if st is not None else None
+        except OSError:
+            self._set_free_space_text("Freier Speicher: Fehler")
             return
 
-        available_gb = self._get_available_test_space(path)
+        if free_gb is None:
+            self._set_free_space_text("Freier Speicher: --")
+            return
+
+        self._show_available_space(
+            path, self._get_available_test_space(path, free_gb, st.st_mtime_ns)
+        )
+
+    def _show_available_space(self, path: str, available_gb):
+        """
+        Zeigt den verfügbaren Speicher an und passt die Maxima an.
+
+        Args:
+            path: Zugehöriger Pfad
+            available_gb: Verfügbarer Speicher in GB, None wenn der Pfad fehlt
+        """
+        if available_gb is None:
+            self._set_free_space_text("Freier Speicher: --")
+            return
 
         if available_gb > 0:
-            self.free_space_label.setText(f"Freier Speicher: {available_gb:.1f} GB")
+            # Für den nächsten Programmstart merken (neuester Eintrag am Ende)
+            _cache_put(self._shown_free_space, path, available_gb,
+                       self.FREE_SPACE_SNAPSHOT_SIZE)
+
+            # Gleicher angezeigter Wert: Label und Maxima bleiben unverändert
+            if not self._set_free_space_text(_format_free_space(round(available_gb * 10))):
+                return
 
             # Slider-Maximum anpassen (Ganzzahl)
-            self.size_slider.setMaximum(max(1, int(available_gb)))
+            slider_max = max(1, int(available_gb))
+            if self.size_slider.maximum() != slider_max:
+                self.size_slider.setMaximum(slider_max)
             # SpinBox-Maximum anpassen (Dezimalwert)
-            self.size_spinbox.setMaximum(available_gb)
+            if self.size_spinbox.maximum() != available_gb:
+                self.size_spinbox.setMaximum(available_gb)
         else:
-            self.free_space_label.setText("Freier Speicher: Fehler")
+            self._set_free_space_text("Freier Speicher: Fehler")
+
+    def set_path_prefilled(self, path: str, available_gb: Optional[float]):
+        """
+        Setzt den Pfad und zeigt sofort einen gespeicherten Speicherplatz-Wert.
+
+        Der aktuelle Wert wird im Hintergrund ermittelt und ersetzt die
+        Anzeige, sobald er vorliegt - der GUI-Thread blockiert dabei nicht.
+
+        Args:
+            path: Zielpfad
+            available_gb: Gespeicherter verfügbarer Speicher in GB,
+                          None zeigt "--" bis zum Ergebnis
+        """
+        self._path_debounce.stop()
+        with QSignalBlocker(self.path_edit):
+            self.path_edit.setText(path)
+        self._show_available_space(path, available_gb)
+        self._request_free_space(path)
+
+        self.path_changed.emit(path)
+        self.config_changed.emit()
+
+    def _request_free_space(self, path: str):
+        """Startet die Speicherplatz-Abfrage im Thread-Pool."""
+        self._free_space_generation += 1
+        if not path:
+            self._set_free_space_text("Freier Speicher: --")
+            return
+
+        # Beide Teilwerte noch gültig (z.B. nur Dateigröße geändert): kein Thread nötig
+        cached_gb = self._get_cached_available_gb(path)
+        if cached_gb is not None:
+            self._show_available_space(path, cached_gb)
+            return
+
+        file_size_gb = self.file_size_spinbox.value() / 1024.0  # MB to GB
+        QThreadPool.globalInstance().start(
+            _FreeSpaceRefresh(self._free_space_generation, path, file_size_gb,
+                              self._refresh_signals)
+        )
+
+    def _get_cached_available_gb(self, path: str):
+        """
+        Verfügbarer Speicher nur aus den Caches.
+
+        Returns:
+            float: Freier Speicher plus vorhandene Testdateien in GB,
+                   None wenn ein Teilwert fehlt oder veraltet ist
+        """
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            return None
+        now = time.monotonic()
+
+        mount = self._mount_cache.get(st.st_dev)
+        if mount is None or now - mount[0] >= self.FREE_SPACE_CACHE_TTL_SECONDS:
+            return None
+        existing = self._existing_size_cache.get(path)
+        if (existing is None or existing[1] != st.st_mtime_ns
+                or now - existing[0] >= self.FREE_SPACE_CACHE_TTL_SECONDS):
+            return None
+        return mount[1] + existing[2]
+
+    def _on_free_space_refreshed(self, generation: int, path: str, result):
+        """Ergebnis der Hintergrund-Abfrage (veraltete Ergebnisse werden verworfen)."""
+        if generation != self._free_space_generation or path != self.path_edit.text():
+            return
+
+        if isinstance(result, tuple):
+            dev, mtime_ns, free_gb, existing_gb = result
+            # In die Caches übernehmen, folgende Abfragen im GUI-Thread profitieren
+            now = time.monotonic()
+            _cache_put(self._mount_cache, dev, (now, free_gb), self.FREE_SPACE_CACHE_SIZE)
+            _cache_put(self._existing_size_cache, path, (now, mtime_ns, existing_gb),
+                       self.FREE_SPACE_CACHE_SIZE)
+            result = free_gb + existing_gb
+
+        self._show_available_space(path, result)
+
+    def get_free_space_snapshot(self) -> dict:
+        """
+        Gibt die zuletzt angezeigten Speicherplatz-Werte zurück.
+
+        Returns:
+            Dict Pfad -> verfügbarer Speicher in GB
+        """
+        return dict(self._shown_free_space)
+
+    def _set_free_space_text(self, text: str) -> bool:
+        """
+        Setzt den Text der Speicherplatz-Anzeige, nur wenn er sich ändert.
+
+        Returns:
+            bool: True wenn der Text neu gesetzt wurde
+        """
+        if text == self._last_free_space_text:
+            return False
+        self._last_free_space_text = text
+        self.free_space_label.setText(text)
+        return True
 
     def _on_whole_drive_toggled(self, checked: bool):
         """Wird aufgerufen wenn 'Ganzes Laufwerk' Checkbox geändert wird."""
@@ -278,15 +633,7 @@ class ConfigurationWidget(QGroupBox):
 
     def set_enabled(self, enabled: bool):
         """Aktiviert/Deaktiviert alle Eingabeelemente."""
-        self.path_edit.setEnabled(enabled)
-        self.browse_button.setEnabled(enabled)
-        self.file_size_spinbox.setEnabled(enabled)
-
-        if not self.whole_drive_checkbox.isChecked():
-            self.size_slider.setEnabled(enabled)
-            self.size_spinbox.setEnabled(enabled)
-
-        self.whole_drive_checkbox.setEnabled(enabled)
+        self._apply_enabled_state(path_enabled=enabled, size_enabled=enabled)
 
     def set_enabled_for_resume(self):
         """
@@ -299,18 +646,30 @@ class ConfigurationWidget(QGroupBox):
         - Zielpfad (fest durch Session)
         - Dateigröße (fest durch Session)
         """
-        # Zielpfad und Dateigröße deaktiviert (fest durch Session)
-        self.path_edit.setEnabled(False)
-        self.browse_button.setEnabled(False)
-        self.file_size_spinbox.setEnabled(False)
+        self._apply_enabled_state(path_enabled=False, size_enabled=True)
 
-        # Testgröße kann geändert werden
-        if not self.whole_drive_checkbox.isChecked():
-            self.size_slider.setEnabled(True)
-            self.size_spinbox.setEnabled(True)
+    def _apply_enabled_state(self, path_enabled: bool, size_enabled: bool):
+        """
+        Setzt die Aktivierung aller Eingabeelemente mit einem einzigen Neuzeichnen.
 
-        self.whole_drive_checkbox.setEnabled(True)
+        Args:
+            path_enabled: Zielpfad, Durchsuchen und Dateigröße
+            size_enabled: Testgröße und 'Ganzes Laufwerk'
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            self.path_edit.setEnabled(path_enabled)
+            self.browse_button.setEnabled(path_enabled)
+            self.file_size_spinbox.setEnabled(path_enabled)
 
+            # Bei 'Ganzes Laufwerk' bleibt die manuelle Eingabe deaktiviert
+            if not self.whole_drive_checkbox.isChecked():
+                self.size_slider.setEnabled(size_enabled)
+                self.size_spinbox.setEnabled(size_enabled)
+
+            self.whole_drive_checkbox.setEnabled(size_enabled)
+        finally:
+            self.setUpdatesEnabled(True)
 
 class ControlWidget(QGroupBox):
     """
@@ -375,27 +734,54 @@ class ControlWidget(QGroupBox):
 
     def set_state_idle(self):
         """Setzt Buttons für 'Bereit' Zustand."""
-        self.start_button.setEnabled(True)
-        self.start_button.setText("▶ Start")
-        self.pause_button.setEnabled(False)
-        self.stop_after_file_button.setEnabled(False)
-        self.stop_button.setEnabled(False)
+        self._apply_button_state(
+            start_enabled=True, start_text="▶ Start",
+            pause_enabled=False, stop_after_file_enabled=False, stop_enabled=False
+        )
 
     def set_state_running(self):
         """Setzt Buttons für 'Test läuft' Zustand."""
-        self.start_button.setEnabled(False)
-        self.pause_button.setEnabled(True)
-        self.pause_button.setText("⏸ Pause")
-        self.stop_after_file_button.setEnabled(True)
-        self.stop_button.setEnabled(True)
+        self._apply_button_state(
+            start_enabled=False,
+            pause_enabled=True, pause_text="⏸ Pause",
+            stop_after_file_enabled=True, stop_enabled=True
+        )
 
     def set_state_paused(self):
         """Setzt Buttons für 'Pausiert' Zustand."""
-        self.start_button.setEnabled(True)
-        self.start_button.setText("▶ Fortsetzen")
-        self.pause_button.setEnabled(False)
-        self.stop_after_file_button.setEnabled(False)
-        self.stop_button.setEnabled(True)
+        self._apply_button_state(
+            start_enabled=True, start_text="▶ Fortsetzen",
+            pause_enabled=False, stop_after_file_enabled=False, stop_enabled=True
+        )
+
+    def set_state_stopping(self):
+        """Sperrt alle Buttons, bis die Engine nach einem Stop beendet ist."""
+        self._apply_button_state(
+            start_enabled=False,
+            pause_enabled=False, stop_after_file_enabled=False, stop_enabled=False
+        )
+
+    def _apply_button_state(self, start_enabled: bool, pause_enabled: bool,
+                            stop_after_file_enabled: bool, stop_enabled: bool,
+                            start_text: str = None, pause_text: str = None):
+        """
+        Setzt alle Button-Zustände mit einem einzigen Neuzeichnen.
+
+        Während der Änderungen sind Updates abgeschaltet; das erneute
+        Einschalten löst genau ein update() für das ganze Widget aus.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            self.start_button.setEnabled(start_enabled)
+            if start_text is not None:
+                self.start_button.setText(start_text)
+            self.pause_button.setEnabled(pause_enabled)
+            if pause_text is not None:
+                self.pause_button.setText(pause_text)
+            self.stop_after_file_button.setEnabled(stop_after_file_enabled)
+            self.stop_button.setEnabled(stop_enabled)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def enable_delete_button(self, enabled: bool):
         """Aktiviert/Deaktiviert den Dateien-löschen Button."""
@@ -405,8 +791,15 @@ class ControlWidget(QGroupBox):
 class MainWindow(QMainWindow):
     """Hauptfenster der DiskTest Anwendung."""
 
+    # Maximale Wartezeit auf die Engine beim Schließen, bevor das Fenster
+    # offen bleibt und sich nach Ende der Engine selbst schließt
+    SHUTDOWN_TIMEOUT_MS = 3000
+
     def __init__(self):
         super().__init__()
+        self._shutdown_pending = False
+        # Wartet gerade in _shutdown_engine auf die Engine (lokale Event-Loop)
+        self._shutting_down = False
         self._setup_ui()
         self._initialize_state()
 
@@ -490,6 +883,8 @@ class MainWindow(QMainWindow):
 
     def _show_about(self):
         """Zeigt About-Dialog."""
+        from PySide6.QtWidgets import QMessageBox
+
         QMessageBox.about(
             self,
             "Über DiskTest",
@@ -502,7 +897,7 @@ class MainWindow(QMainWindow):
     def set_session_info(self, session_path: str):
         """Zeigt Session-Info in Statusleiste."""
         if session_path:
-            filename = Path(session_path).name
+            filename = os.path.basename(session_path)
             self.session_label.setText(f"Session: {filename}")
         else:
             self.session_label.setText("")
@@ -518,8 +913,24 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Wird beim Schließen des Fensters aufgerufen."""
+        # Weitere Schließen-Anforderungen (X, Strg+Q) während des Wartens
+        # ignorieren, sonst würde die lokale Event-Loop erneut betreten
+        if self._shutting_down:
+            event.ignore()
+            return
+
+        # Engine wird bereits beendet: erst schließen, wenn sie fertig ist
+        if self._shutdown_pending:
+            if self.controller.engine and self.controller.engine.isRunning():
+                event.ignore()
+                return
+            self._save_state_and_accept(event)
+            return
+
         # Prüfen ob Test läuft
         if hasattr(self, 'controller') and self.controller.current_state.name == 'RUNNING':
+            from PySide6.QtWidgets import QMessageBox
+
             reply = QMessageBox.question(
                 self,
                 "Test läuft",
@@ -533,9 +944,81 @@ class MainWindow(QMainWindow):
                 event.ignore()
                 return
 
-            # Test pausieren vor dem Beenden
-            if self.controller.engine:
-                self.controller.engine.pause()
-                self.controller.engine.wait()
+        # Laufende oder pausierte Engine sauber beenden (Session bleibt erhalten)
+        engine = self.controller.engine if hasattr(self, 'controller') else None
+        if engine and engine.isRunning():
+            if not self._shutdown_engine(engine):
+                # Fenster bleibt offen und schließt sich, sobald die Engine fertig ist
+                event.ignore()
+                return
+
+        self._save_state_and_accept(event)
+
+    def _shutdown_engine(self, engine) -> bool:
+        """
+        Pausiert die Engine (Session wird gespeichert) und beendet sie dann.
+
+        Gewartet wird in einer lokalen QEventLoop statt mit engine.wait(),
+        das Fenster wird dabei weiter gezeichnet. Dauert es länger, zeigt ein
+        modaler Fortschrittsdialog das Warten an und sperrt weitere Eingaben.
+        Gestoppt wird erst, wenn die Engine pausiert ist - ein Stop aus dem
+        laufenden Zustand würde die Session als abgeschlossen löschen.
+
+        Returns:
+            True wenn die Engine innerhalb von SHUTDOWN_TIMEOUT_MS beendet wurde
+        """
+        from PySide6.QtWidgets import QProgressDialog
+
+        engine.pause()
+
+        # Erscheint erst nach einer halben Sekunde, schnelles Beenden bleibt ohne Dialog
+        progress = QProgressDialog("Warte auf Ende des Tests...", "", 0, 0, self)
+        progress.setWindowTitle("DiskTest wird beendet")
+        progress.setCancelButton(None)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
+        progress.setValue(0)  # startet die Wartezeit bis zum Anzeigen
+
+        def stop_when_paused():
+            if engine.state.name == 'PAUSED':
+                engine.stop()
+                self._shutdown_poll.stop()
+
+        # Abfrage endet mit dem Stop oder spätestens mit dem Ende der Engine
+        self._shutdown_poll = QTimer(self)
+        self._shutdown_poll.setInterval(50)
+        self._shutdown_poll.timeout.connect(stop_when_paused)
+        engine.finished.connect(self._shutdown_poll.stop)
+        self._shutdown_poll.start()
+
+        loop = QEventLoop()
+        engine.finished.connect(loop.quit)
+        QTimer.singleShot(self.SHUTDOWN_TIMEOUT_MS, loop.quit)
+        self._shutting_down = True
+        try:
+            loop.exec()
+        finally:
+            self._shutting_down = False
+        engine.finished.disconnect(loop.quit)
+
+        if engine.isRunning():
+            # Weiter im Hintergrund warten, danach erneut schließen
+            self._shutdown_pending = True
+            # Dialog bleibt bis zum Ende der Engine sichtbar und wird nur hier freigegeben
+            engine.finished.connect(progress.deleteLater)
+            engine.finished.connect(self.close)
+            self.status_bar.showMessage("Warte auf Ende des Tests...")
+            return False
+
+        progress.deleteLater()
+        return True
+
+    def _save_state_and_accept(self, event):
+        """Speichert Zustand für den nächsten Start und schließt das Fenster."""
+        # Speicherplatz-Werte für den nächsten Start merken
+        if hasattr(self, 'controller'):
+            self.controller.settings.save_free_space_cache(
+                self.config_widget.get_free_space_snapshot()
+            )
 
         event.accept()
@@ -5,690 +5,335 @@ Unterstützt automatische Erkennung von Windows Dark Mode
 und passt die Farben entsprechend an.
 """
 
+import functools
+import re
+import string
 import sys
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QPalette, QColor
+from importlib import resources
+from types import MappingProxyType
+from typing import Mapping, Optional, TYPE_CHECKING
+
+# PySide6 wird erst in is_dark_mode() importiert: die Stylesheets selbst
+# brauchen kein Qt und sind so auch ohne geladenes PySide6 nutzbar
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QApplication
+
+
+# Grundfarben, die innerhalb eines Themes für mehrere Rollen gelten
+_DARK_BG = '#2b2b2b'
+_DARK_SURFACE = '#3c3f41'
+_DARK_BORDER = '#555555'
+_DARK_ACCENT_HOVER = '#1565c0'
+_LIGHT_SURFACE = '#ffffff'
+_LIGHT_BORDER = '#cccccc'
+_LIGHT_HOVER = '#e8e8e8'
+_LIGHT_ACCENT = '#0078d4'
+_LIGHT_PANEL = '#f0f0f0'
+_LIGHT_WARNING = '#ffc107'
+
+# Farben der Themes, in den .qss-Vorlagen als $name eingesetzt und über
+# get_theme_tokens() auch für Widgets verfügbar, die eigene Farben brauchen
+_DARK_TOKENS = {
+    'window_bg': _DARK_BG,
+    'text': '#e0e0e0',
+    'border': _DARK_BORDER,
+    'surface': _DARK_SURFACE,
+    'surface_hover': '#4c5052',
+    'accent': '#0d47a1',
+    'accent_hover': _DARK_ACCENT_HOVER,
+    'on_accent': '#ffffff',
+    'disabled_bg': _DARK_BG,
+    'disabled_text': '#808080',
+    'disabled_border': _DARK_SURFACE,
+    'button_disabled_text': '#606060',
+    'button_pressed': _DARK_BG,
+    'menu_selected': _DARK_SURFACE,
+    'scrollbar_handle': _DARK_BORDER,
+    'scrollbar_handle_hover': '#666666',
+    'arrow': '#b0b0b0',
+    'error_bg': '#3c1f1f',
+    'error': '#d32f2f',
+    'info_bg': '#1f2f3c',
+    'info': '#0288d1',
+    'success_bg': '#1f3c1f',
+    'success': '#388e3c',
+    'warning_bg': '#3c3c1f',
+    'warning': '#f57c00',
+    'dialog_info': _DARK_ACCENT_HOVER,
+    'dialog_warning': '#ffa726',
+    'dialog_destructive': '#ef5350',
+}
+
+_LIGHT_TOKENS = {
+    'window_bg': '#f5f5f5',
+    'text': '#000000',
+    'border': _LIGHT_BORDER,
+    'surface': _LIGHT_SURFACE,
+    'surface_hover': _LIGHT_HOVER,
+    'accent': _LIGHT_ACCENT,
+    'accent_hover': '#1084d8',
+    'on_accent': _LIGHT_SURFACE,
+    'disabled_bg': _LIGHT_PANEL,
+    'disabled_text': '#808080',
+    'disabled_border': '#e0e0e0',
+    'button_disabled_text': '#a0a0a0',
+    'button_pressed': '#d0d0d0',
+    'menu_selected': _LIGHT_HOVER,
+    'scrollbar_handle': _LIGHT_BORDER,
+    'scrollbar_handle_hover': '#b0b0b0',
+    'error_bg': '#ffebee',
+    'error': '#dc3545',
+    'info_bg': '#e3f2fd',
+    'info': _LIGHT_ACCENT,
+    'success_bg': '#e8f5e9',
+    'success': '#28a745',
+    'warning_bg': '#fff3e0',
+    'warning': _LIGHT_WARNING,
+    'dialog_info': _LIGHT_ACCENT,
+    'dialog_warning': _LIGHT_WARNING,
+    'dialog_destructive': '#d32f2f',
+}
+
+
+_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _minify(css: str) -> str:
+    """Entfernt Kommentare und überflüssige Leerzeichen (weniger Arbeit für den QSS-Parser)."""
+    css = _COMMENT_RE.sub('', css)
+    css = _WHITESPACE_RE.sub(' ', css)
+    for old, new in ((' {', '{'), ('{ ', '{'), ('; ', ';'), (': ', ':'), (', ', ','),
+                     (' }', '}'), ('} ', '}'), (';}', '}')):
+        css = css.replace(old, new)
+    return css.strip()
+
+
+@functools.lru_cache(maxsize=2)
+def _load_template(filename: str) -> string.Template:
+    """
+    Liest eine .qss-Vorlage aus gui/resources und minifiziert sie einmalig.
+
+    Die Platzhalter stehen nur für Farbwerte ohne Leerzeichen, daher kann
+    vor dem Einsetzen minifiziert werden.
+    """
+    css = resources.files(__package__).joinpath("resources").joinpath(filename).read_text(encoding="utf-8")
+    return string.Template(_minify(css))
+
+
+@functools.lru_cache(maxsize=2)
+def _build_stylesheet(dark: bool) -> str:
+    """
+    Setzt die Farben des Themes in die minifizierte Vorlage ein.
+
+    Wird erst beim ersten Bedarf erstellt und danach zwischengespeichert,
+    das Stylesheet des nicht genutzten Themes wird nie geladen. Das Ergebnis
+    ist interniert: Alle Aufrufer erhalten dasselbe str-Objekt und können
+    per Identität (is) vergleichen.
+    """
+    filename, tokens = ("dark.qss", _DARK_TOKENS) if dark else ("light.qss", _LIGHT_TOKENS)
+    return sys.intern(_load_template(filename).substitute(tokens))
+
+
+# Zwischengespeichertes Ergebnis von is_dark_mode() (None = noch nicht ermittelt)
+_is_dark_cache: Optional[bool] = None
+
+# Registry-Schlüssel mit der App-Theme-Einstellung von Windows 10/11
+_PERSONALIZE_KEY = r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize"
+
+
+def _probe_os_dark() -> Optional[bool]:
+    """
+    Liest die Dark-Mode-Einstellung direkt vom Betriebssystem, ohne Qt.
+
+    Unter Windows ist das der Registry-Wert AppsUseLightTheme (0 = dunkel).
+    Auf anderen Plattformen und wenn der Wert fehlt (ältere Windows-Versionen)
+    wird None zurückgegeben, dann entscheidet Qt.
+
+    Returns:
+        True/False wenn die Einstellung gelesen werden konnte, sonst None
+    """
+    if sys.platform != 'win32':
+        return None
+
+    import winreg
+    try:
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, _PERSONALIZE_KEY) as key:
+            return winreg.QueryValueEx(key, "AppsUseLightTheme")[0] == 0
+    except OSError:
+        return None
 
 
 def is_dark_mode() -> bool:
     """
     Erkennt ob Windows im Dark Mode läuft.
 
+    Unter Windows wird zuerst die Registry gelesen (_probe_os_dark), dafür
+    muss weder PySide6 geladen noch eine QApplication erstellt sein. Sonst
+    gilt das Farbschema von Qt (Qt.ColorScheme, ab Qt 6.5), und ist auch das
+    unbekannt, entscheidet die Helligkeit der Fensterfarbe. Die
+    Abfrage erfolgt nur beim ersten Aufruf, danach gilt das gespeicherte
+    Ergebnis bis AppStyles.refresh().
+
     Returns:
         True wenn Dark Mode aktiv ist
     """
-    # Prüfe Windows-Palette
-    palette = QApplication.palette()
-    window_color = palette.color(QPalette.ColorRole.Window)
+    global _is_dark_cache
+    if _is_dark_cache is None:
+        _is_dark_cache = _probe_os_dark()
+    if _is_dark_cache is None:
+        from PySide6.QtCore import Qt
+        from PySide6.QtGui import QPalette
+        from PySide6.QtWidgets import QApplication
+
+        scheme = QApplication.styleHints().colorScheme()
+        if scheme != Qt.ColorScheme.Unknown:
+            _is_dark_cache = scheme == Qt.ColorScheme.Dark
+        else:
+            # Prüfe Windows-Palette
+            window_color = QApplication.palette().color(QPalette.ColorRole.Window)
 
-    # Dark Mode wenn Hintergrund dunkel ist (Helligkeit < 128)
-    return window_color.lightness() < 128
+            # Dark Mode wenn Hintergrund dunkel ist: Luma nach Rec. 601 in
+            # Ganzzahlen (< 128 von 255), ohne Umrechnung nach HSL
+            _is_dark_cache = (window_color.red() * 299 + window_color.green() * 587
+                              + window_color.blue() * 114) < 128_000
+    return _is_dark_cache
 
 
-class AppStyles:
+def _resolve_dark(is_dark: Optional[bool]) -> bool:
+    """Gibt is_dark zurück, bei None das (gespeicherte) Ergebnis von is_dark_mode()."""
+    return is_dark_mode() if is_dark is None else is_dark
+
+
+# Widget-Styles für Light (Index 0/False) und Dark Mode (Index 1/True),
+# einmalig aus den Theme-Farben zusammengesetzt
+_DETAIL_STYLES = tuple(
+    f"background-color: {panel}; border-radius: 5px; padding: 15px;"
+    for panel in (_LIGHT_PANEL, _DARK_SURFACE)
+)
+_ERROR_STYLES = tuple(
+    f"background-color: {tokens['error_bg']}; border-left: 4px solid {tokens['error']}; "
+    f"border-radius: 3px; padding: 10px;"
+    for tokens in (_LIGHT_TOKENS, _DARK_TOKENS)
+)
+
+
+def install(app: "QApplication"):
     """
-    Zentrale Stylesheet-Verwaltung für die Anwendung.
+    Wendet das Haupt-Stylesheet an und folgt Theme-Wechseln.
+
+    Meldet Qt ein neues Farbschema (colorSchemeChanged), wird das Ergebnis
+    von is_dark_mode() direkt daraus gesetzt, ohne erneute Abfrage. Ändert
+    sich nur die Palette, wird die gespeicherte Erkennung verworfen. In
+    beiden Fällen wird das Stylesheet nur dann neu gesetzt, wenn sich das
+    Sheet tatsächlich geändert hat. Da die Sheets interniert sind, genügt
+    dafür ein Identitätsvergleich.
 
-    Stellt Stylesheets für Light/Dark Mode bereit.
+    Args:
+        app: Die QApplication
     """
+    from PySide6.QtCore import Qt
+
+    applied = get_main_stylesheet()
+    app.setStyleSheet(applied)
+
+    def apply_current():
+        nonlocal applied
+        sheet = get_main_stylesheet()
+        if sheet is not applied:
+            applied = sheet
+            app.setStyleSheet(sheet)
+
+    def on_color_scheme_changed(scheme):
+        global _is_dark_cache
+        if scheme == Qt.ColorScheme.Unknown:
+            refresh()
+        else:
+            _is_dark_cache = scheme == Qt.ColorScheme.Dark
+        apply_current()
 
-    @staticmethod
-    def get_main_stylesheet() -> str:
-        """
-        Gibt das Haupt-Stylesheet für die Anwendung zurück.
+    def on_palette_changed(_palette):
+        refresh()
+        apply_current()
 
-        Passt sich automatisch an Light/Dark Mode an.
+    app.styleHints().colorSchemeChanged.connect(on_color_scheme_changed)
+    app.paletteChanged.connect(on_palette_changed)
 
-        Returns:
-            CSS-String für QApplication.setStyleSheet()
-        """
-        if is_dark_mode():
-            return AppStyles._get_dark_stylesheet()
-        else:
-            return AppStyles._get_light_stylesheet()
+
+def refresh():
+    """Verwirft die gespeicherte Dark-Mode-Erkennung (z.B. nach Theme-Wechsel)."""
+    global _is_dark_cache
+    _is_dark_cache = None
+
+
+def get_main_stylesheet() -> str:
+    """
+    Gibt das Haupt-Stylesheet für die Anwendung zurück.
+
+    Passt sich automatisch an Light/Dark Mode an.
+
+    Returns:
+        CSS-String für QApplication.setStyleSheet()
+    """
+    return _build_stylesheet(is_dark_mode())
+
+
+def get_dialog_detail_style(is_dark: Optional[bool] = None) -> str:
+    """
+    Gibt Stylesheet für Detail-Widgets in Dialogen zurück.
+
+    Args:
+        is_dark: Optional, ob Dark Mode verwendet werden soll.
+                 Wenn None, wird automatisch erkannt.
+
+    Returns:
+        CSS-String für Detail-Widget-Hintergrund
+    """
+    return _DETAIL_STYLES[_resolve_dark(is_dark)]
+
+
+def get_error_style(is_dark: Optional[bool] = None) -> str:
+    """Gibt Stylesheet für Fehler-Widgets zurück."""
+    return _ERROR_STYLES[_resolve_dark(is_dark)]
+
+
+_THEME_TOKENS = (MappingProxyType(_LIGHT_TOKENS), MappingProxyType(_DARK_TOKENS))
+
+
+def get_theme_tokens(is_dark: Optional[bool] = None) -> Mapping[str, str]:
+    """
+    Gibt die Farben des Themes zurück (nur lesbar).
+
+    Args:
+        is_dark: Optional, ob Dark Mode verwendet werden soll.
+                 Wenn None, wird automatisch erkannt.
+
+    Returns:
+        Zuordnung Token-Name -> Farbe, z.B. 'error' -> '#dc3545'
+    """
+    return _THEME_TOKENS[_resolve_dark(is_dark)]
+
+
+class AppStyles:
+    """
+    Kompatibilitäts-Namensraum für die Modul-Funktionen.
+
+    Neuer Code ruft install(), get_main_stylesheet() usw. direkt auf.
+    """
+
+    install = staticmethod(install)
+    refresh = staticmethod(refresh)
+    get_main_stylesheet = staticmethod(get_main_stylesheet)
+    get_dialog_detail_style = staticmethod(get_dialog_detail_style)
+    get_error_style = staticmethod(get_error_style)
+    get_theme_tokens = staticmethod(get_theme_tokens)
 
     @staticmethod
     def _get_dark_stylesheet() -> str:
         """Stylesheet für Dark Mode"""
-        return """
-        /* Haupt-Fenster */
-        QMainWindow {
-            background-color: #2b2b2b;
-            color: #e0e0e0;
-        }
-
-        /* GroupBox */
-        QGroupBox {
-            color: #e0e0e0;
-            border: 1px solid #555555;
-            border-radius: 5px;
-            margin-top: 12px;
-            padding-top: 10px;
-            font-weight: bold;
-        }
-
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            subcontrol-position: top left;
-            padding: 0 5px;
-            color: #e0e0e0;
-        }
-
-        /* Labels */
-        QLabel {
-            color: #e0e0e0;
-        }
-
-        /* LineEdit / TextEdit */
-        QLineEdit, QTextEdit, QPlainTextEdit {
-            background-color: #3c3f41;
-            color: #e0e0e0;
-            border: 1px solid #555555;
-            border-radius: 3px;
-            padding: 5px;
-            selection-background-color: #0d47a1;
-        }
-
-        QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {
-            border: 1px solid #0d47a1;
-        }
-
-        QLineEdit:disabled, QTextEdit:disabled {
-            background-color: #2b2b2b;
-            color: #808080;
-        }
-
-        /* Buttons */
-        QPushButton {
-            background-color: #3c3f41;
-            color: #e0e0e0;
-            border: 1px solid #555555;
-            border-radius: 3px;
-            padding: 5px 15px;
-            min-height: 20px;
-        }
-
-        QPushButton:hover {
-            background-color: #4c5052;
-            border: 1px solid #0d47a1;
-        }
-
-        QPushButton:pressed {
-            background-color: #2b2b2b;
-        }
-
-        QPushButton:disabled {
-            background-color: #2b2b2b;
-            color: #606060;
-            border: 1px solid #3c3f41;
-        }
-
-        QPushButton:default {
-            border: 2px solid #0d47a1;
-        }
-
-        /* SpinBox / DoubleSpinBox */
-        QSpinBox, QDoubleSpinBox {
-            background-color: #3c3f41;
-            color: #e0e0e0;
-            border: 1px solid #555555;
-            border-radius: 3px;
-            padding: 3px;
-        }
-
-        QSpinBox:disabled, QDoubleSpinBox:disabled {
-            background-color: #2b2b2b;
-            color: #808080;
-        }
-
-        QSpinBox::up-button, QDoubleSpinBox::up-button,
-        QSpinBox::down-button, QDoubleSpinBox::down-button {
-            background-color: #3c3f41;
-            border: 1px solid #555555;
-        }
-
-        QSpinBox::up-button:hover, QDoubleSpinBox::up-button:hover,
-        QSpinBox::down-button:hover, QDoubleSpinBox::down-button:hover {
-            background-color: #4c5052;
-        }
-
-        /* Slider */
-        QSlider::groove:horizontal {
-            border: 1px solid #555555;
-            height: 8px;
-            background: #3c3f41;
-            margin: 2px 0;
-            border-radius: 4px;
-        }
-
-        QSlider::handle:horizontal {
-            background: #0d47a1;
-            border: 1px solid #0d47a1;
-            width: 18px;
-            margin: -5px 0;
-            border-radius: 9px;
-        }
-
-        QSlider::handle:horizontal:hover {
-            background: #1565c0;
-        }
-
-        QSlider:disabled {
-            opacity: 0.5;
-        }
-
-        /* ProgressBar */
-        QProgressBar {
-            border: 1px solid #555555;
-            border-radius: 5px;
-            text-align: center;
-            background-color: #3c3f41;
-            color: #e0e0e0;
-        }
-
-        QProgressBar::chunk {
-            background-color: #0d47a1;
-            border-radius: 4px;
-        }
-
-        /* CheckBox */
-        QCheckBox {
-            color: #e0e0e0;
-            spacing: 5px;
-        }
-
-        QCheckBox::indicator {
-            width: 18px;
-            height: 18px;
-            border: 1px solid #555555;
-            border-radius: 3px;
-            background-color: #3c3f41;
-        }
-
-        QCheckBox::indicator:hover {
-            border: 1px solid #0d47a1;
-        }
-
-        QCheckBox::indicator:checked {
-            background-color: #0d47a1;
-            border: 1px solid #0d47a1;
-            image: url(none);
-        }
-
-        QCheckBox::indicator:disabled {
-            background-color: #2b2b2b;
-            border: 1px solid #3c3f41;
-        }
-
-        /* ComboBox */
-        QComboBox {
-            background-color: #3c3f41;
-            color: #e0e0e0;
-            border: 1px solid #555555;
-            border-radius: 3px;
-            padding: 5px;
-        }
-
-        QComboBox:hover {
-            border: 1px solid #0d47a1;
-        }
-
-        QComboBox::drop-down {
-            border: none;
-            width: 20px;
-        }
-
-        QComboBox::down-arrow {
-            image: none;
-            border-left: 4px solid transparent;
-            border-right: 4px solid transparent;
-            border-top: 6px solid #b0b0b0;
-            margin-right: 5px;
-        }
-
-        QComboBox QAbstractItemView {
-            background-color: #3c3f41;
-            color: #e0e0e0;
-            border: 1px solid #555555;
-            selection-background-color: #0d47a1;
-            selection-color: #ffffff;
-        }
-
-        /* StatusBar */
-        QStatusBar {
-            background-color: #2b2b2b;
-            color: #e0e0e0;
-            border-top: 1px solid #555555;
-        }
-
-        /* MenuBar */
-        QMenuBar {
-            background-color: #2b2b2b;
-            color: #e0e0e0;
-            border-bottom: 1px solid #555555;
-        }
-
-        QMenuBar::item {
-            background-color: transparent;
-            padding: 4px 8px;
-        }
-
-        QMenuBar::item:selected {
-            background-color: #3c3f41;
-        }
-
-        QMenu {
-            background-color: #3c3f41;
-            color: #e0e0e0;
-            border: 1px solid #555555;
-        }
-
-        QMenu::item {
-            padding: 5px 25px 5px 20px;
-        }
-
-        QMenu::item:selected {
-            background-color: #0d47a1;
-        }
-
-        /* ScrollBar */
-        QScrollBar:vertical {
-            background-color: #2b2b2b;
-            width: 12px;
-            margin: 0px;
-        }
-
-        QScrollBar::handle:vertical {
-            background-color: #555555;
-            min-height: 20px;
-            border-radius: 6px;
-        }
-
-        QScrollBar::handle:vertical:hover {
-            background-color: #666666;
-        }
-
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-            height: 0px;
-        }
-
-        QScrollBar:horizontal {
-            background-color: #2b2b2b;
-            height: 12px;
-            margin: 0px;
-        }
-
-        QScrollBar::handle:horizontal {
-            background-color: #555555;
-            min-width: 20px;
-            border-radius: 6px;
-        }
-
-        QScrollBar::handle:horizontal:hover {
-            background-color: #666666;
-        }
-
-        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-            width: 0px;
-        }
-
-        /* TabWidget */
-        QTabWidget::pane {
-            border: 1px solid #555555;
-            background-color: #2b2b2b;
-        }
-
-        QTabBar::tab {
-            background-color: #3c3f41;
-            color: #e0e0e0;
-            border: 1px solid #555555;
-            padding: 5px 10px;
-        }
-
-        QTabBar::tab:selected {
-            background-color: #0d47a1;
-            border-bottom: none;
-        }
-
-        QTabBar::tab:hover {
-            background-color: #4c5052;
-        }
-
-        /* Dialog */
-        QDialog {
-            background-color: #2b2b2b;
-            color: #e0e0e0;
-        }
-
-        /* Custom Widget-spezifische Styles */
-        .error-widget {
-            background-color: #3c1f1f;
-            border-left: 4px solid #d32f2f;
-        }
-
-        .success-widget {
-            background-color: #1f3c1f;
-            border-left: 4px solid #388e3c;
-        }
-
-        .warning-widget {
-            background-color: #3c3c1f;
-            border-left: 4px solid #f57c00;
-        }
-
-        .info-widget {
-            background-color: #1f2f3c;
-            border-left: 4px solid #0288d1;
-        }
-        """
+        return _build_stylesheet(True)
 
     @staticmethod
     def _get_light_stylesheet() -> str:
         """Stylesheet für Light Mode"""
-        return """
-        /* Haupt-Fenster */
-        QMainWindow {
-            background-color: #f5f5f5;
-            color: #000000;
-        }
-
-        /* GroupBox */
-        QGroupBox {
-            color: #000000;
-            border: 1px solid #cccccc;
-            border-radius: 5px;
-            margin-top: 12px;
-            padding-top: 10px;
-            font-weight: bold;
-        }
-
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            subcontrol-position: top left;
-            padding: 0 5px;
-            color: #000000;
-        }
-
-        /* Labels */
-        QLabel {
-            color: #000000;
-        }
-
-        /* LineEdit / TextEdit */
-        QLineEdit, QTextEdit, QPlainTextEdit {
-            background-color: #ffffff;
-            color: #000000;
-            border: 1px solid #cccccc;
-            border-radius: 3px;
-            padding: 5px;
-            selection-background-color: #0078d4;
-        }
-
-        QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {
-            border: 1px solid #0078d4;
-        }
-
-        QLineEdit:disabled, QTextEdit:disabled {
-            background-color: #f0f0f0;
-            color: #808080;
-        }
-
-        /* Buttons */
-        QPushButton {
-            background-color: #ffffff;
-            color: #000000;
-            border: 1px solid #cccccc;
-            border-radius: 3px;
-            padding: 5px 15px;
-            min-height: 20px;
-        }
-
-        QPushButton:hover {
-            background-color: #e8e8e8;
-            border: 1px solid #0078d4;
-        }
-
-        QPushButton:pressed {
-            background-color: #d0d0d0;
-        }
-
-        QPushButton:disabled {
-            background-color: #f0f0f0;
-            color: #a0a0a0;
-            border: 1px solid #e0e0e0;
-        }
-
-        QPushButton:default {
-            border: 2px solid #0078d4;
-        }
-
-        /* SpinBox / DoubleSpinBox */
-        QSpinBox, QDoubleSpinBox {
-            background-color: #ffffff;
-            color: #000000;
-            border: 1px solid #cccccc;
-            border-radius: 3px;
-            padding: 3px;
-        }
-
-        QSpinBox:disabled, QDoubleSpinBox:disabled {
-            background-color: #f0f0f0;
-            color: #808080;
-        }
-
-        /* Slider */
-        QSlider::groove:horizontal {
-            border: 1px solid #cccccc;
-            height: 8px;
-            background: #ffffff;
-            margin: 2px 0;
-            border-radius: 4px;
-        }
-
-        QSlider::handle:horizontal {
-            background: #0078d4;
-            border: 1px solid #0078d4;
-            width: 18px;
-            margin: -5px 0;
-            border-radius: 9px;
-        }
-
-        QSlider::handle:horizontal:hover {
-            background: #1084d8;
-        }
-
-        /* ProgressBar */
-        QProgressBar {
-            border: 1px solid #cccccc;
-            border-radius: 5px;
-            text-align: center;
-            background-color: #ffffff;
-            color: #000000;
-        }
-
-        QProgressBar::chunk {
-            background-color: #0078d4;
-            border-radius: 4px;
-        }
-
-        /* CheckBox */
-        QCheckBox {
-            color: #000000;
-            spacing: 5px;
-        }
-
-        QCheckBox::indicator {
-            width: 18px;
-            height: 18px;
-            border: 1px solid #cccccc;
-            border-radius: 3px;
-            background-color: #ffffff;
-        }
-
-        QCheckBox::indicator:hover {
-            border: 1px solid #0078d4;
-        }
-
-        QCheckBox::indicator:checked {
-            background-color: #0078d4;
-            border: 1px solid #0078d4;
-        }
-
-        /* ComboBox */
-        QComboBox {
-            background-color: #ffffff;
-            color: #000000;
-            border: 1px solid #cccccc;
-            border-radius: 3px;
-            padding: 5px;
-        }
-
-        QComboBox:hover {
-            border: 1px solid #0078d4;
-        }
-
-        QComboBox QAbstractItemView {
-            background-color: #ffffff;
-            color: #000000;
-            border: 1px solid #cccccc;
-            selection-background-color: #0078d4;
-            selection-color: #ffffff;
-        }
-
-        /* StatusBar */
-        QStatusBar {
-            background-color: #f5f5f5;
-            color: #000000;
-            border-top: 1px solid #cccccc;
-        }
-
-        /* MenuBar */
-        QMenuBar {
-            background-color: #f5f5f5;
-            color: #000000;
-            border-bottom: 1px solid #cccccc;
-        }
-
-        QMenuBar::item:selected {
-            background-color: #e8e8e8;
-        }
-
-        QMenu {
-            background-color: #ffffff;
-            color: #000000;
-            border: 1px solid #cccccc;
-        }
-
-        QMenu::item:selected {
-            background-color: #0078d4;
-            color: #ffffff;
-        }
-
-        /* ScrollBar */
-        QScrollBar:vertical {
-            background-color: #f5f5f5;
-            width: 12px;
-        }
-
-        QScrollBar::handle:vertical {
-            background-color: #cccccc;
-            min-height: 20px;
-            border-radius: 6px;
-        }
-
-        QScrollBar::handle:vertical:hover {
-            background-color: #b0b0b0;
-        }
-
-        QScrollBar:horizontal {
-            background-color: #f5f5f5;
-            height: 12px;
-        }
-
-        QScrollBar::handle:horizontal {
-            background-color: #cccccc;
-            min-width: 20px;
-            border-radius: 6px;
-        }
-
-        QScrollBar::handle:horizontal:hover {
-            background-color: #b0b0b0;
-        }
-
-        /* Dialog */
-        QDialog {
-            background-color: #f5f5f5;
-            color: #000000;
-        }
-
-        /* Custom Widget-spezifische Styles */
-        .error-widget {
-            background-color: #ffebee;
-            border-left: 4px solid #dc3545;
-        }
-
-        .success-widget {
-            background-color: #e8f5e9;
-            border-left: 4px solid #28a745;
-        }
-
-        .warning-widget {
-            background-color: #fff3e0;
-            border-left: 4px solid #ffc107;
-        }
-
-        .info-widget {
-            background-color: #e3f2fd;
-            border-left: 4px solid #0078d4;
-        }
-        """
-
-    @staticmethod
-    def get_dialog_detail_style(is_dark: bool = None) -> str:
-        """
-        Gibt Stylesheet für Detail-Widgets in Dialogen zurück.
-
-        Args:
-            is_dark: Optional, ob Dark Mode verwendet werden soll.
-                     Wenn None, wird automatisch erkannt.
-
-        Returns:
-            CSS-String für Detail-Widget-Hintergrund
-        """
-        if is_dark is None:
-            is_dark = is_dark_mode()
-
-        if is_dark:
-            return """
-                background-color: #3c3f41;
-                border-radius: 5px;
-                padding: 15px;
-            """
-        else:
-            return """
-                background-color: #f0f0f0;
-                border-radius: 5px;
-                padding: 15px;
-            """
-
-    @staticmethod
-    def get_error_style(is_dark: bool = None) -> str:
-        """Gibt Stylesheet für Fehler-Widgets zurück."""
-        if is_dark is None:
-            is_dark = is_dark_mode()
-
-        if is_dark:
-            return """
-                background-color: #3c1f1f;
-                border-left: 4px solid #d32f2f;
-                border-radius: 3px;
-                padding: 10px;
-            """
-        else:
-            return """
-                background-color: #ffebee;
-                border-left: 4px solid #dc3545;
-                border-radius: 3px;
-                padding: 10px;
-            """
+        return _build_stylesheet(False)
@@ -5,11 +5,16 @@ from PySide6.QtWidgets import (
     QGroupBox, QFrame, QCheckBox, QPushButton
 )
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPalette, QColor
+from PySide6.QtGui import QPalette, QColor, QTextCursor
 
 from core.patterns import PatternType, PATTERN_SEQUENCE
 
 
+# Stylesheet der Pattern-Auswahl: wird einmal für die ganze Gruppe gesetzt,
+# abgeschlossene Patterns werden über die Property "completed" markiert
+_PATTERN_SELECTION_STYLE = 'QCheckBox[completed="true"] { color: green; font-weight: bold; }'
+
+
 class ErrorCounterWidget(QWidget):
     """
     Custom Widget für Fehler-Counter mit farblicher Hervorhebung.
@@ -317,6 +322,8 @@ class LogWidget(QGroupBox):
         'ERROR': '#dc3545',     # Rot
     }
 
+    MAX_LINES = 1000  # Ältere Zeilen verwirft das Dokument automatisch
+
     def __init__(self, parent=None):
         super().__init__("Log", parent)
         self._setup_ui()
@@ -330,7 +337,7 @@ class LogWidget(QGroupBox):
 
         self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.setMaximumBlockCount(1000)  # Limitiere auf 1000 Zeilen
+        self.log_text.setMaximumBlockCount(self.MAX_LINES)
 
         # Monospace Font für bessere Lesbarkeit
         font = self.log_text.font()
@@ -349,17 +356,50 @@ class LogWidget(QGroupBox):
             level: Log-Level (INFO, SUCCESS, WARNING, ERROR)
             message: Log-Nachricht
         """
-        color = self.COLORS.get(level, '#000000')
+        self.log_text.appendHtml(self._format_entry(timestamp, level, message))
+        self._scroll_to_end()
 
-        # HTML für farbigen Text
-        html = f'<span style="color: {color};">[{timestamp}] {level:8} {message}</span>'
+    def add_logs_batch(self, entries):
+        """
+        Fügt mehrere Log-Einträge mit einem Neuzeichnen hinzu.
 
-        self.log_text.appendHtml(html)
+        Alle Einträge werden in einem Edit-Block eingefügt, das Dokument
+        wird dadurch nur einmal statt pro Eintrag neu umbrochen.
 
-        # Auto-Scroll zum Ende
-        self.log_text.verticalScrollBar().setValue(
-            self.log_text.verticalScrollBar().maximum()
-        )
+        Args:
+            entries: Folge von (timestamp, level, message)-Tupeln
+        """
+        if not entries:
+            return
+
+        document = self.log_text.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        # Wie appendHtml: im leeren Dokument keine Leerzeile voranstellen
+        new_block = not document.isEmpty()
+
+        self.log_text.setUpdatesEnabled(False)
+        try:
+            cursor.beginEditBlock()
+            for timestamp, level, message in entries:
+                if new_block:
+                    cursor.insertBlock()
+                new_block = True
+                cursor.insertHtml(self._format_entry(timestamp, level, message))
+            cursor.endEditBlock()
+            self._scroll_to_end()
+        finally:
+            self.log_text.setUpdatesEnabled(True)
+
+    def _format_entry(self, timestamp: str, level: str, message: str) -> str:
+        """HTML für farbigen Log-Eintrag."""
+        color = self.COLORS.get(level, '#000000')
+        return f'<span style="color: {color};">[{timestamp}] {level:8} {message}</span>'
+
+    def _scroll_to_end(self):
+        """Auto-Scroll zum Ende."""
+        scrollbar = self.log_text.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
 
     def clear(self):
         """Löscht alle Log-Einträge."""
@@ -394,6 +434,7 @@ class PatternSelectionWidget(QGroupBox):
         """UI-Elemente erstellen."""
         layout = QVBoxLayout(self)
         layout.setSpacing(8)
+        self.setStyleSheet(_PATTERN_SELECTION_STYLE)
 
         # Checkboxen und Buttons horizontal in einer Zeile
         checkbox_layout = QHBoxLayout()
@@ -500,11 +541,18 @@ class PatternSelectionWidget(QGroupBox):
     def _update_checkbox_styles(self):
         """Aktualisiert die visuellen Styles der Checkboxen basierend auf completed_patterns"""
         for pattern_type, checkbox in self.checkboxes.items():
-            if pattern_type.value in self.completed_patterns:
+            completed = pattern_type.value in self.completed_patterns
+            # Unveränderte Checkboxen nicht neu polieren (Property ist anfangs None)
+            if checkbox.property("completed") == completed:
+                continue
+
+            checkbox.setProperty("completed", completed)
+            checkbox.style().unpolish(checkbox)
+            checkbox.style().polish(checkbox)
+
+            if completed:
                 # Pattern abgeschlossen - grüner Text und Tooltip
-                checkbox.setStyleSheet("QCheckBox { color: green; font-weight: bold; }")
                 checkbox.setToolTip(f"✓ Bereits getestet - Entfernen verwirft Fortschritt")
             else:
                 # Pattern nicht abgeschlossen - normaler Style
-                checkbox.setStyleSheet("")
                 checkbox.setToolTip(f"{pattern_type.display_name} - Ausstehend")
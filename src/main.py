@@ -7,7 +7,7 @@ from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt
 
 from gui import MainWindow
-from gui.styles import AppStyles
+from gui import styles
 
 
 def main():
@@ -20,8 +20,8 @@ def main():
     app.setOrganizationName("DiskTest")
     app.setApplicationVersion("1.0.0")
 
-    # Stylesheet anwenden (automatisch Light/Dark Mode)
-    app.setStyleSheet(AppStyles.get_main_stylesheet())
+    # Stylesheet anwenden (automatisch Light/Dark Mode, folgt Theme-Wechseln)
+    styles.install(app)
 
     # Hauptfenster erstellen und anzeigen
     window = MainWindow()
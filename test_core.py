@@ -4,6 +4,8 @@ Testet: patterns.py, file_manager.py, disk_info.py, logger.py
 """
 import sys
 import os
+import shutil
+import tempfile
 from pathlib import Path
 
 # Pfad zum src-Verzeichnis hinzufügen
@@ -88,6 +90,42 @@ def test_file_manager():
     print(f"   Testdateien existieren: {exists}")
     print(f"   Anzahl: {count}")
 
+    # Test 5: Größe existierender Dateien (os.scandir statt glob)
+    print("\n5. Test Groesse existierender Dateien:")
+    size_dir = Path(tempfile.mkdtemp(prefix="disktest_size_"))
+    try:
+        for name, size in (
+            ("disktest_001.dat", 100),
+            ("disktest_002.dat", 200),
+            ("DISKTEST_1.DAT", 300),   # nur unter Windows eine Testdatei
+            ("disktest_003.tmp", 400),  # falsche Endung
+            ("other_004.dat", 500),     # falsches Präfix
+            ("disktest.dat", 600),      # ohne Unterstrich
+        ):
+            (size_dir / name).write_bytes(b"\0" * size)
+        (size_dir / "disktest_x.dat").mkdir()
+
+        size_fm = FileManager(str(size_dir), file_size_gb=1.0)
+        total_size = size_fm.get_existing_files_size()
+        # Referenz: bisheriges glob, Verzeichnisse zählen nicht als Testdatei
+        glob_size = sum(
+            p.stat().st_size
+            for p in size_dir.glob(FileManager.FILE_GLOB_PATTERN)
+            if p.is_file()
+        )
+        expected_size = 300 + (300 if os.name == "nt" else 0)
+        print(f"   Groesse: {total_size} Bytes (glob: {glob_size}, erwartet: {expected_size})")
+        assert total_size == glob_size == expected_size
+
+        # Ordner verschwindet nachträglich (z.B. Laufwerk entfernt)
+        shutil.rmtree(size_dir)
+        missing_size = size_fm.get_existing_files_size()
+        print(f"   Fehlender Ordner: {missing_size} Bytes")
+        assert missing_size == 0 == len(list(size_dir.glob(FileManager.FILE_GLOB_PATTERN)))
+        print(f"   [OK] Groesse wie bei glob")
+    finally:
+        shutil.rmtree(size_dir, ignore_errors=True)
+
 
 def test_disk_info():
     """Testet DiskInfo"""